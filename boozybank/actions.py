@@ -0,0 +1,208 @@
+# actions.py — Per-channel queue for Discord REST actions
+# Emoji buttons, ✅/❌ marks and reaction removals for a channel all go through
+# one worker. Requests are paced to Discord's per-route limits before they are
+# sent (instead of waiting out a 429), duplicates are coalesced, a burst of
+# removals on one message becomes a single clear + re-add of its buttons, and
+# whatever is still queued for a round is dropped as soon as the round ends.
+
+import asyncio
+import logging
+import time
+from collections import deque
+
+import discord
+
+log = logging.getLogger("red.boozybank")
+
+# Minimum seconds between two requests of a bucket in one channel (reaction routes allow about 4/s)
+BUCKET_INTERVALS = {"reaction": 0.25, "message": 0.0}
+
+
+class _Action:
+    __slots__ = ("run", "bucket", "key", "tag", "done")
+
+    def __init__(self, run, bucket, key, tag):
+        self.run = run
+        self.bucket = bucket
+        self.key = key
+        self.tag = tag
+        self.done = asyncio.get_running_loop().create_future()
+
+
+class ChannelActions:
+    """Ordered REST actions for one channel, run by a single worker task."""
+
+    def __init__(self, channel, on_idle=None):
+        self.channel = channel
+        self._on_idle = on_idle  # called once nothing is queued, running or remembered
+        self._pending = deque()
+        self._keys = set()
+        self._buttons = {}  # {message_id: [emoji, ...]}, used to rebuild buttons after a clear
+        self._next_allowed = {}  # {bucket: monotonic time}
+        self._worker = None
+        self.sent = 0
+        self.dropped = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def submit(self, run, bucket: str = "message", key=None, tag=None) -> asyncio.Future:
+        """Queues `run()` (a coroutine function). Returns a future that resolves once it ran or was dropped.
+        An action whose `key` is already queued is coalesced into the queued one.
+        """
+        if key is not None and key in self._keys:
+            self.dropped += 1
+            return self._queued(key).done
+        action = _Action(run, bucket, key, tag)
+        self._pending.append(action)
+        if key is not None:
+            self._keys.add(key)
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._work())
+        return action.done
+
+    def add_reaction(self, message, emoji, tag=None) -> asyncio.Future:
+        return self.submit(lambda: message.add_reaction(emoji), "reaction", ("add", message.id, str(emoji)), tag)
+
+    def add_buttons(self, message, emojis, tag=None):
+        """Adds emoji buttons in order and remembers them in case the message's reactions get reset."""
+        self._buttons[message.id] = list(dict.fromkeys(emojis))
+        for emoji in emojis:
+            self.add_reaction(message, emoji, tag)
+
+    def remove_reaction(self, message, emoji, member, tag=None) -> asyncio.Future:
+        """Removes one member's reaction. Once removing them one by one would cost more requests
+        than clearing the message and re-adding its buttons, the queued removals are replaced by a reset.
+        """
+        reset_key = ("reset", message.id)
+        if reset_key in self._keys:
+            return self._queued(reset_key).done
+
+        buttons = self._buttons.get(message.id)
+        removals = [a for a in self._pending if a.key is not None and a.key[:2] == ("remove", message.id)]
+        # len(removals) + 1 single removals vs. one clear plus len(buttons) re-adds
+        if buttons and len(removals) > len(buttons):
+            for action in removals:
+                self._discard(action)
+            return self.reset_buttons(message, tag)
+
+        return self.submit(
+            lambda: message.remove_reaction(emoji, member),
+            "reaction",
+            ("remove", message.id, str(emoji), member.id),
+            tag,
+        )
+
+    def reset_buttons(self, message, tag=None) -> asyncio.Future:
+        """Clears every reaction on the message and re-adds its buttons in their original order."""
+        async def run():
+            await message.clear_reactions()
+            for emoji in self._buttons.get(message.id, ()):
+                await self._pace("reaction")
+                await message.add_reaction(emoji)
+
+        return self.submit(run, "reaction", ("reset", message.id), tag)
+
+    def clear_early_reactions(self, message, bot_id: int, tag=None) -> asyncio.Future:
+        """Removes reactions players added before answers opened (reading time)."""
+        async def run():
+            fresh = await self.channel.fetch_message(message.id)
+            early = sum(r.count - (1 if r.me else 0) for r in fresh.reactions)
+            if early == 0:
+                return
+            buttons = self._buttons.get(message.id)
+            if buttons and early > len(buttons) + 1:
+                await message.clear_reactions()
+                for emoji in buttons:
+                    await self._pace("reaction")
+                    await message.add_reaction(emoji)
+                return
+            for rxn in fresh.reactions:
+                async for r_user in rxn.users():
+                    if r_user.id != bot_id:
+                        await self._pace("reaction")
+                        await rxn.remove(r_user)
+
+        return self.submit(run, "message", ("early", message.id), tag)
+
+    def drop(self, tag):
+        """Drops every queued action for `tag` (usually the round's question message id)."""
+        for action in [a for a in self._pending if a.tag == tag]:
+            self._discard(action)
+        self._buttons.pop(tag, None)
+        self._check_idle()
+
+    def close(self):
+        if self._worker is not None:
+            self._worker.cancel()
+        while self._pending:
+            self._discard(self._pending[0])
+
+    def _check_idle(self):
+        if self._on_idle is not None and not self._pending and self._worker is None and not self._buttons:
+            self._on_idle(self)
+
+    def _queued(self, key) -> _Action:
+        return next(a for a in self._pending if a.key == key)
+
+    def _discard(self, action: _Action):
+        self._pending.remove(action)
+        self._keys.discard(action.key)
+        self.dropped += 1
+        if not action.done.done():
+            action.done.set_result(None)
+
+    async def _pace(self, bucket: str):
+        wait = self._next_allowed.get(bucket, 0.0) - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        self._next_allowed[bucket] = time.monotonic() + BUCKET_INTERVALS.get(bucket, 0.0)
+
+    async def _work(self):
+        try:
+            while self._pending:
+                action = self._pending.popleft()
+                self._keys.discard(action.key)
+                try:
+                    await self._pace(action.bucket)
+                    await action.run()
+                    self.sent += 1
+                except discord.Forbidden:
+                    log.warning(f"Missing permissions for a queued action in channel {getattr(self.channel, 'name', self.channel.id)}; dropping the rest of it.")
+                    if action.tag is not None:
+                        self.drop(action.tag)
+                except discord.HTTPException:
+                    pass
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    log.error(f"Queued Discord action failed: {e}")
+                finally:
+                    if not action.done.done():
+                        action.done.set_result(None)
+        finally:
+            self._worker = None
+            self._check_idle()
+
+
+class ActionQueues:
+    """One ChannelActions queue per channel, dropped again once it has nothing left to do."""
+
+    def __init__(self):
+        self._channels = {}
+
+    def get(self, channel) -> ChannelActions:
+        actions = self._channels.get(channel.id)
+        if actions is None:
+            actions = self._channels[channel.id] = ChannelActions(channel, on_idle=self._evict)
+        return actions
+
+    def _evict(self, actions: ChannelActions):
+        if self._channels.get(actions.channel.id) is actions:
+            del self._channels[actions.channel.id]
+
+    def close(self):
+        for actions in self._channels.values():
+            actions.close()
+        self._channels.clear()
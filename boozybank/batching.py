@@ -0,0 +1,91 @@
+# batching.py — Surplus batch sizing and generation cost per topic
+# Every OpenAI request pays the same prompt and round-trip, so a request asks
+# for a few questions more than it needs and the rest waits in the pool and
+# the question bank. BatchTuner keeps, per (guild, topic, difficulty), what
+# was generated, what it cost in tokens and how much of it was served, and
+# shrinks the surplus for topics whose extra questions go unplayed.
+
+from collections import OrderedDict
+
+MAX_BATCH = 10  # questions per OpenAI request
+MIN_SAMPLES = 20  # generated questions before the surplus starts adapting
+TARGET_UTILIZATION = 0.8  # share of generated questions served that earns the full surplus
+
+
+class TopicCost:
+    """Generation and serving counters of one pool key."""
+
+    __slots__ = ("requests", "tokens", "generated", "served", "pool_hits", "pool_lookups")
+
+    def __init__(self):
+        self.requests = 0
+        self.tokens = 0
+        self.generated = 0
+        self.served = 0
+        self.pool_hits = 0
+        self.pool_lookups = 0
+
+    @property
+    def utilization(self) -> float:
+        return min(1.0, self.served / self.generated) if self.generated else 1.0
+
+    @property
+    def tokens_per_served(self):
+        return self.tokens / self.served if self.served else None
+
+    @property
+    def pool_hit_ratio(self):
+        return self.pool_hits / self.pool_lookups if self.pool_lookups else None
+
+
+class BatchTuner:
+    """Sizes OpenAI batches per pool key and tracks the cost per served question."""
+
+    def __init__(self, max_keys: int = 200):
+        self.max_keys = max_keys
+        self._costs = OrderedDict()  # {pool_key: TopicCost}, least recently used first
+
+    def _cost(self, key: tuple) -> TopicCost:
+        cost = self._costs.get(key)
+        if cost is None:
+            cost = self._costs[key] = TopicCost()
+            while len(self._costs) > self.max_keys:
+                self._costs.popitem(last=False)
+        self._costs.move_to_end(key)
+        return cost
+
+    def surplus(self, key: tuple, base: int) -> int:
+        """The guild's surplus, scaled down once a topic has shown it leaves generated questions unplayed."""
+        cost = self._costs.get(key)
+        if cost is None or cost.generated < MIN_SAMPLES:
+            return base
+        return round(base * min(1.0, cost.utilization / TARGET_UTILIZATION))
+
+    def size(self, key: tuple, needed: int, base: int) -> int:
+        """How many questions to request when `needed` are missing."""
+        return max(1, min(MAX_BATCH, needed + self.surplus(key, base)))
+
+    def record_request(self, key: tuple, tokens: int, generated: int):
+        cost = self._cost(key)
+        cost.requests += 1
+        cost.tokens += tokens
+        cost.generated += generated
+
+    def record_served(self, key: tuple, count: int):
+        self._cost(key).served += count
+
+    def record_pool_lookup(self, key: tuple, hits: int, wanted: int):
+        cost = self._cost(key)
+        cost.pool_hits += hits
+        cost.pool_lookups += wanted
+
+    def for_guild(self, guild_id: int) -> list:
+        """Returns [(pool_key, TopicCost)] of one guild, most recently used first."""
+        return [(key, cost) for key, cost in reversed(self._costs.items()) if key[0] == guild_id]
+
+    def totals(self) -> TopicCost:
+        total = TopicCost()
+        for cost in self._costs.values():
+            for name in TopicCost.__slots__:
+                setattr(total, name, getattr(total, name) + getattr(cost, name))
+        return total
@@ -1,13 +1,40 @@
 import asyncio
+import contextlib
+import copy
 import time
 import random
-import json
 import logging
+from collections import defaultdict
 import aiohttp
 import discord
 from redbot.core import Config, commands, bank
+from redbot.core.data_manager import cog_data_path
 from redbot.core.utils.chat_formatting import box
 
+from .actions import ActionQueues
+from .batching import MAX_BATCH, BatchTuner
+from .checkpoints import CheckpointStore
+from .client import ConnectionStats, create_session
+from .dispatch import EMOJI_TO_LETTER, AnswerRouter
+from .engine import LOADING, PLAYING, TIEBREAK, GameEngine, GameSession, GameStopped
+from .facts import FactGenerator
+from .generation import QuestionError, QuestionPipeline, loads
+from .leaderboard import SORT_KEYS, LeaderboardIndex
+from .limits import DailyLimitCache
+from .metrics import Metrics
+from .payouts import PayoutAudit, PayoutLedger
+from .pool import QuestionPool, normalize_topic, pool_key
+from .render import QuestionRenderer, RenderedMessage
+from .resilience import CircuitBreaker, CircuitOpenError, LatencyTracker, RetryableError, hedged, with_retries
+from .scheduler import GenerationScheduler
+from .settings import GuildSettings
+from .similarity import MAX_WINDOW_DAYS, RecentQuestions
+from .stats import StatsDelta, StatsWriter
+from .storage import QuestionBank, quiz_fingerprint
+from .streaming import QuestionStreamParser, iter_sse_content
+from .timing import FairnessStats, LoopLagMonitor, RoundFairness, now_ms, snowflake_ms
+from .views import AnswerButtonsView, LobbyView
+
 log = logging.getLogger("red.boozybank")
 
 class BoozyBank(commands.Cog):
@@ -32,6 +59,13 @@ class BoozyBank(commands.Cog):
             "daily_limit": 5, # default 5 starts per day
             "min_players": 2, # default 2 players required
             "reading_time": 0, # default 0 seconds (disabled)
+            "pool_low_water": 5, # refill the question pool in the background below this many questions
+            "batch_surplus": 3, # extra questions per OpenAI request, kept in the pool for later games
+            "stream_questions": True, # start round 1 while later questions are still being generated
+            "hedge_requests": False, # send a second OpenAI request when the first one is slower than usual
+            "answer_mode": "reactions", # "reactions" (emoji buttons) or "buttons" (message components)
+            "offline_questions": False, # build questions from the bundled fact tables instead of calling OpenAI
+            "repeat_window_days": 14, # skip questions similar to ones played in the last N days, 0 to disable
             "default_topics": [
                 "Beer & Breweries",
                 "Classic Cocktails",
@@ -49,15 +83,216 @@ class BoozyBank(commands.Cog):
             "wins": 0,
             "earnings": 0,
             "last_quiz_date": "",
-            "quizzes_today": 0
+            "quizzes_today": 0,
+            "stats_batch": 0 # id of the last journaled stats batch applied to this member
+        }
+
+        default_global = {
+            "stats_journal": {}, # {batch_id: {"guild": guild_id, "deltas": {member_id: [wins, earnings]}}}
+            "stats_batch_seq": 0, # last stats batch id handed out
+            "max_in_flight": 4, # concurrent OpenAI requests across all guilds
+            "requests_per_minute": 60,
+            "tokens_per_minute": 200000
         }
 
         self.config.register_guild(**default_guild)
         self.config.register_member(**default_member)
+        self.config.register_global(**default_global)
+
+        # One GameSession per channel; the engine runs them side by side and checkpoints them to disk
+        self.engine = GameEngine(CheckpointStore(cog_data_path(self) / "games"))
+        self._resume_task = None
+
+        # Cached guild settings snapshots, dropped whenever a boozyquizset command runs
+        self._settings_cache = {} # {guild_id: GuildSettings}
+
+        # End-of-game stats are written in one journaled batch
+        self.stats_writer = StatsWriter(self.config)
+        self.payout_audit = PayoutAudit(cog_data_path(self) / "payouts.jsonl") # What every game paid out
+        self.leaderboards = LeaderboardIndex()
+
+        # Daily start counters live in memory and are written behind to Config
+        self.daily_limits = DailyLimitCache(self.config)
+
+        # Routes guesses from the listeners below to the open round of each channel
+        self.answer_router = AnswerRouter()
+        self.channel_actions = ActionQueues() # Paced, droppable reaction/REST actions per channel
+        self.renderer = QuestionRenderer() # Question/choices text rendered once per question
+        self.question_pipeline = QuestionPipeline() # parse -> validate -> normalize -> shuffle
+
+        # Persistent answer buttons: clicks on questions posted before a reload still reach the cog
+        self.answer_view = AnswerButtonsView(self)
+        self.bot.add_view(self.answer_view)
+
+        # Pre-generated questions, refilled in the background
+        self.question_pool = QuestionPool()
+        self.batch_tuner = BatchTuner() # Surplus per OpenAI request and cost per served question
+        self._pool_refills = {} # {pool_key: asyncio.Task}
+
+        # Every generated question is kept on disk for reuse
+        self.question_bank = QuestionBank(cog_data_path(self) / "questions.sqlite3")
+
+        # Template questions from the bundled fact tables: no API key needed, and the last fallback otherwise
+        self.fact_generator = FactGenerator.load()
+
+        # MinHash/LSH index per guild of recently served questions, to skip reworded repeats
+        self.recent_questions = RecentQuestions(self.question_bank)
+
+        # Cog-owned keep-alive HTTP session for all OpenAI calls
+        self.http_stats = ConnectionStats()
+        self.session = None
+
+        # Degraded-API protection: per-guild circuit breakers and per-model latency windows for hedging
+        self._breakers = defaultdict(CircuitBreaker) # {guild_id: CircuitBreaker}
+        self._openai_latency = defaultdict(LatencyTracker) # {model: LatencyTracker}
+
+        # Cog-wide OpenAI concurrency/rate limits, and identical fetches shared between guilds
+        self.scheduler = GenerationScheduler()
+        self._coalesced = {} # {(topic, difficulty, count): (guild_id, asyncio.Task)}
+
+        # Latency/throughput histograms and counters, also exported as a Prometheus text file
+        self.metrics = Metrics()
+        self.metrics.add_collector(self._collect_metrics)
+        self._metrics_task = None
+
+        # Answer speed is timed on Discord's clock; these show how much the bot's own delays would have cost
+        self.loop_lag = LoopLagMonitor(on_sample=lambda lag: self.metrics.observe("boozybank_loop_lag_seconds", lag))
+        self.fairness = FairnessStats()
+
+    async def cog_load(self):
+        """Open the HTTP session and question bank, and restore the pre-generated question pool."""
+        self.session = create_session(self.http_stats)
+        self.question_bank.open()
+
+        global_conf = await self.config.all()
+        self.metrics.inc("boozybank_config_reads_total", op="global")
+        self.scheduler.configure(
+            global_conf["max_in_flight"], global_conf["requests_per_minute"], global_conf["tokens_per_minute"]
+        )
+
+        await self.daily_limits.start()
+        self.metrics.inc("boozybank_config_reads_total", op="daily_limits")
+
+        # Finish any stats batch that was interrupted by a crash or reload
+        try:
+            await self.stats_writer.replay()
+        except Exception as e:
+            log.error(f"Could not replay the stats journal: {e}")
+
+        path = cog_data_path(self) / "question_pool.json"
+        if path.exists():
+            try:
+                self.question_pool.load_json(path.read_text(encoding="utf-8"))
+            except Exception as e:
+                log.error(f"Could not restore the question pool: {e}")
+
+        # Pick interrupted games back up once the bot can see its channels again
+        self._resume_task = asyncio.create_task(self._resume_games())
+        self._metrics_task = asyncio.create_task(self._export_metrics_loop())
+        self.loop_lag.start()
+
+    async def red_delete_data_for_user(self, *, requester, user_id: int):
+        """Deletes a user's stats, daily counters and payout audit entries.
+        Game checkpoints also hold player IDs but are removed when the game ends or after an hour;
+        the served-question history is per guild and holds no user data.
+        """
+        await self.stats_writer.forget(user_id)
+        self.daily_limits.forget(user_id)
+        self.metrics.inc("boozybank_config_reads_total", op="delete")
+        for guild_id, members in (await self.config.all_members()).items():
+            if user_id in members:
+                await self.config.member_from_ids(guild_id, user_id).clear()
+                self.metrics.inc("boozybank_config_writes_total", op="delete")
+        self.leaderboards.forget(user_id)
+        await self.payout_audit.forget(user_id)
+
+    async def cog_unload(self):
+        """Stop background refills, persist the question pool and close the HTTP session."""
+        for task in self._pool_refills.values():
+            task.cancel()
+        self._pool_refills.clear()
+        if self._resume_task is not None:
+            self._resume_task.cancel()
+        if self._metrics_task is not None:
+            self._metrics_task.cancel()
+        self.loop_lag.stop()
+        await self._export_metrics()
+        self.engine.suspend() # Running games keep their checkpoints and resume after the reload
+        self.channel_actions.close()
+        self.answer_view.stop()
+        await self._save_pool()
+        self.question_bank.close()
+        await self.daily_limits.stop()
+        if self.session is not None:
+            await self.session.close()
+
+    async def _resume_games(self):
+        """Relaunches the games that were checkpointed when the cog was unloaded or the bot went down."""
+        await self.bot.wait_until_red_ready()
+        for data in self.engine.store.load_all():
+            try:
+                session = GameSession.from_dict(data)
+            except (KeyError, TypeError, ValueError) as e:
+                log.error(f"Discarding an unreadable game checkpoint: {e}")
+                self.engine.store.remove(data.get("channel_id"))
+                continue
+
+            channel = self.bot.get_channel(session.channel_id)
+            if channel is None or not self.engine.open(session):
+                self.engine.store.remove(session.channel_id)
+                continue
+
+            if session.kind == "quiz":
+                coro = self._play_quiz(channel, session)
+            elif session.state == TIEBREAK:
+                coro = self._finish_game(channel, session)
+            else:
+                coro = self._play_game(channel, session)
+
+            try:
+                resume_msg = await channel.send(
+                    f"♻️ **BoozyBank is back!** Resuming the game about **{session.topic}** "
+                    f"from round {min(session.round_index + 1, session.rounds)} of {session.rounds}..."
+                )
+            except discord.HTTPException:
+                coro.close()
+                self.engine.close(session)
+                continue
+            asyncio.create_task(self._delete_message_after(resume_msg, 10))
+            self.engine.launch(session, coro)
+            log.info(f"Resumed a {session.kind} in channel {session.channel_id} at round {session.round_index}")
+
+    async def _get_settings(self, guild: discord.Guild) -> GuildSettings:
+        """Returns the cached settings snapshot for a guild, loading it with a single Config read if needed."""
+        settings = self._settings_cache.get(guild.id)
+        if settings is None:
+            self.metrics.inc("boozybank_cache_requests_total", cache="settings", result="miss")
+            self.metrics.inc("boozybank_config_reads_total", op="settings")
+            settings = GuildSettings.from_config(await self.config.guild(guild).all())
+            self._settings_cache[guild.id] = settings
+        else:
+            self.metrics.inc("boozybank_cache_requests_total", cache="settings", result="hit")
+        return settings
+
+    async def _set_guild_setting(self, guild: discord.Guild, name: str, value):
+        """Writes one guild setting and drops the cached snapshot."""
+        await getattr(self.config.guild(guild), name).set(value)
+        self._settings_cache.pop(guild.id, None)
+        self.metrics.inc("boozybank_config_writes_total", op="settings")
 
-        # Active channel quizzes lock
-        self.active_quizzes = set()
-        self.running_tasks = {} # {channel_id: asyncio.Task}
+    async def cog_after_invoke(self, ctx):
+        # Every boozyquizset subcommand may have changed a setting (the topic list is edited in place)
+        if ctx.guild is not None and ctx.command.root_parent is self.boozyquizset:
+            self._settings_cache.pop(ctx.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        if message.guild is not None:
+            self.answer_router.route_message(message)
+
+    @commands.Cog.listener()
+    async def on_reaction_add(self, reaction: discord.Reaction, user):
+        self.answer_router.route_reaction(reaction, user)
 
     def _get_speed_multiplier(self, elapsed: float) -> tuple:
         """Returns the multiplier and a custom speed tier name based on response speed."""
@@ -77,27 +312,82 @@ class BoozyBank(commands.Cog):
         if is_admin:
             return True
 
-        daily_limit = await self.config.guild(ctx.guild).daily_limit()
+        daily_limit = (await self._get_settings(ctx.guild)).daily_limit
         if daily_limit <= 0:
             return True
 
-        import datetime
-        current_date = datetime.date.today().isoformat() # "YYYY-MM-DD"
-        
-        last_quiz_date = await self.config.member(ctx.author).last_quiz_date()
-        quizzes_today = await self.config.member(ctx.author).quizzes_today()
-
-        if last_quiz_date != current_date:
-            await self.config.member(ctx.author).last_quiz_date.set(current_date)
-            await self.config.member(ctx.author).quizzes_today.set(1)
-            return True
+        if not self.daily_limits.try_increment(ctx.guild.id, ctx.author.id, daily_limit):
+            await ctx.send(f"❌ {ctx.author.mention}, you have reached your daily limit of **{daily_limit}** trivia games started today! Try again tomorrow.")
+            return False
+        return True
+
+    async def _commit_stats(self, guild: discord.Guild, stats: StatsDelta):
+        """Writes a game's stats batch and keeps the leaderboard index in sync."""
+        totals = await self.stats_writer.commit(guild.id, stats)
+        # Older batches of other guilds may have been applied first
+        for (guild_id, member_id), (wins, earnings) in totals.items():
+            self.leaderboards.update(guild_id, member_id, wins, earnings)
+
+    async def _pay_out(self, ledger: PayoutLedger) -> dict:
+        """Commits a game's payout ledger and records it in the audit log. Returns {member_id: coins paid}."""
+        paid = await ledger.commit()
+        await self.payout_audit.record(ledger)
+        return paid
+
+    async def _get_leaderboard(self, guild: discord.Guild):
+        """Returns the guild's leaderboard index, building it from Config on first use."""
+        board = self.leaderboards.get(guild.id)
+        if board is None:
+            self.metrics.inc("boozybank_cache_requests_total", cache="leaderboard", result="miss")
+            self.metrics.inc("boozybank_config_reads_total", op="leaderboard")
+            board = self.leaderboards.load(guild.id, await self.config.all_members(guild))
         else:
-            if quizzes_today >= daily_limit:
-                await ctx.send(f"❌ {ctx.author.mention}, you have reached your daily limit of **{daily_limit}** trivia games started today! Try again tomorrow.")
-                return False
-            else:
-                await self.config.member(ctx.author).quizzes_today.set(quizzes_today + 1)
-                return True
+            self.metrics.inc("boozybank_cache_requests_total", cache="leaderboard", result="hit")
+        return board
+
+    def _collect_metrics(self):
+        """Copies the counters other components keep themselves into the metrics registry."""
+        self.metrics.set("boozybank_cache_requests_total", self.renderer.hits, cache="render", result="hit")
+        self.metrics.set("boozybank_cache_requests_total", self.renderer.misses, cache="render", result="miss")
+        self.metrics.set("boozybank_repeat_questions_total", self.recent_questions.rejected)
+        totals = self.batch_tuner.totals()
+        self.metrics.set("boozybank_generation_tokens_total", totals.tokens)
+        self.metrics.set("boozybank_questions_total", totals.generated, stage="generated")
+        self.metrics.set("boozybank_questions_total", totals.served, stage="served")
+        self.metrics.set("boozybank_config_writes_total", self.daily_limits.writes, op="daily_limits")
+        self.metrics.set("boozybank_config_reads_total", self.stats_writer.reads, op="stats")
+        self.metrics.set("boozybank_config_writes_total", self.stats_writer.writes, op="stats")
+
+    async def _export_metrics(self):
+        """Writes the metrics as a Prometheus text file to the cog data folder."""
+        path = cog_data_path(self) / "metrics.prom"
+        tmp = path.with_suffix(".tmp")
+        text = self.metrics.to_prometheus()
+        try:
+            await asyncio.to_thread(tmp.write_text, text, encoding="utf-8")
+            await asyncio.to_thread(tmp.replace, path)
+        except OSError as e:
+            log.error(f"Could not write the metrics file: {e}")
+
+    async def _save_pool(self):
+        """Writes the question pool to the cog data folder, so a crash loses at most a few minutes of it."""
+        path = cog_data_path(self) / "question_pool.json"
+        tmp = path.with_suffix(".tmp")
+        text = self.question_pool.to_json()
+        try:
+            await asyncio.to_thread(tmp.write_text, text, encoding="utf-8")
+            await asyncio.to_thread(tmp.replace, path)
+        except OSError as e:
+            log.error(f"Could not save the question pool: {e}")
+
+    async def _export_metrics_loop(self):
+        ticks = 0
+        while True:
+            await asyncio.sleep(60)
+            await self._export_metrics()
+            ticks += 1
+            if ticks % 5 == 0:
+                await self._save_pool()
 
     async def _delete_message_after(self, msg, delay: float):
         """Asynchronously deletes a message after a certain delay."""
@@ -107,111 +397,64 @@ class BoozyBank(commands.Cog):
         except Exception:
             pass
 
-    async def _run_lobby(self, ctx, topic: str, difficulty: str, rounds: int) -> list[discord.Member] | None:
+    async def _run_lobby(self, ctx, session: GameSession) -> list[discord.Member] | None:
         """Initiates an interactive matchmaking lobby for players to ready up.
-        Returns the list of joined Members, or None if timed out/cancelled.
+        Returns the list of joined Members, or None if timed out/stopped.
         """
-        min_players = await self.config.guild(ctx.guild).min_players()
-        joined_players = {ctx.author}
+        topic, difficulty, rounds = session.topic, session.difficulty, session.rounds
+        min_players = (await self._get_settings(ctx.guild)).min_players
+        lobby_started = time.perf_counter()
+
+        # Use the lobby phase to get the questions ready
+        await self._prefetch_questions(ctx.guild, topic, difficulty, rounds)
 
-        def make_lobby_embed():
+        def make_lobby_embed(joined_players):
             players_str = ", ".join(p.mention for p in joined_players) if joined_players else "No players joined yet."
             emb = discord.Embed(
                 title="🎮 **BoozyBank Trivia Lobby** 🎮",
                 color=discord.Color.blue(),
                 description=f"A new trivia game has been created!\n"
-                            f"Click 🟢 to join. At least **{min_players}** player(s) are required.\n"
-                            f"The host or an admin can click 🎮 to start the match!\n\n"
+                            f"Click 🟢 **Join** to join. At least **{min_players}** player(s) are required.\n"
+                            f"The host or an admin can click 🎮 **Start** to start the match!\n\n"
                             f"**Host:** {ctx.author.mention}\n"
                             f"**Joined Players ({len(joined_players)}):** {players_str}"
             )
             emb.add_field(name="Topic", value=topic, inline=True)
             emb.add_field(name="Difficulty", value=difficulty.capitalize(), inline=True)
             emb.add_field(name="Rounds", value="1 (Quick Quiz)" if rounds == 1 else str(rounds), inline=True)
-            emb.set_footer(text="Only the Host or an Admin can click 🎮 to start!")
+            emb.set_footer(text="Only the Host or an Admin can click Start!")
             return emb
 
-        lobby_emb = make_lobby_embed()
-        lobby_msg = await ctx.send(embed=lobby_emb)
+        def can_start(user):
+            permissions = ctx.channel.permissions_for(user)
+            return user == ctx.author or permissions.manage_guild or permissions.manage_messages
 
-        lobby_emojis = ["🟢", "🔘", "🔘", "🔘", "🎮"]
-        asyncio.create_task(self._add_reactions_background(ctx, lobby_msg, lobby_emojis))
+        view = LobbyView(ctx.author, min_players, can_start, make_lobby_embed)
+        lobby_emb = make_lobby_embed(list(view.players.values()))
+        lobby_msg = await ctx.send(embed=lobby_emb, view=view)
+        view.attach(RenderedMessage(lobby_msg, lobby_emb, view))
 
         timeout = 120
-        start_time = time.time()
-
         try:
-            while time.time() - start_time < timeout:
-                remaining = timeout - (time.time() - start_time)
-                if remaining <= 0:
-                    break
-
-                add_task = asyncio.create_task(self.bot.wait_for("reaction_add", check=lambda r, u: r.message.id == lobby_msg.id and not u.bot, timeout=remaining))
-                rem_task = asyncio.create_task(self.bot.wait_for("reaction_remove", check=lambda r, u: r.message.id == lobby_msg.id and not u.bot, timeout=remaining))
-
-                done, pending = await asyncio.wait([add_task, rem_task], return_when=asyncio.FIRST_COMPLETED, timeout=remaining)
-                for t in pending:
-                    t.cancel()
-
-                if not done:
-                    break
-
-                for completed in done:
-                    try:
-                        res = completed.result()
-                        # If a reaction was added
-                        if completed == add_task:
-                            reaction, user = res
-                            emoji_str = str(reaction.emoji)
-
-                            if emoji_str == "🟢":
-                                if user not in joined_players:
-                                    joined_players.add(user)
-                                    await lobby_msg.edit(embed=make_lobby_embed())
-                            elif emoji_str == "🎮":
-                                is_admin = ctx.channel.permissions_for(user).manage_guild or ctx.channel.permissions_for(user).manage_messages
-                                if user == ctx.author or is_admin:
-                                    if len(joined_players) < min_players:
-                                        warn = await ctx.send(f"⚠️ **Cannot start!** Need at least **{min_players}** player(s) to start (currently: {len(joined_players)}).")
-                                        asyncio.create_task(self._delete_message_after(warn, 4))
-                                        try:
-                                            await lobby_msg.remove_reaction("🎮", user)
-                                        except Exception:
-                                            pass
-                                    else:
-                                        try:
-                                            await lobby_msg.delete()
-                                        except Exception:
-                                            pass
-                                        return list(joined_players)
-                                else:
-                                    try:
-                                        await lobby_msg.remove_reaction("🎮", user)
-                                    except Exception:
-                                        pass
-                            elif emoji_str == "🔘":
-                                try:
-                                    await lobby_msg.remove_reaction("🔘", user)
-                                except Exception:
-                                    pass
-                        # If a reaction was removed
-                        elif completed == rem_task:
-                            reaction, user = res
-                            emoji_str = str(reaction.emoji)
-
-                            if emoji_str == "🟢":
-                                if user in joined_players and user != ctx.author:
-                                    joined_players.remove(user)
-                                    await lobby_msg.edit(embed=make_lobby_embed())
-
-                    except Exception:
-                        pass
-        except asyncio.CancelledError:
+            # One timer for the whole lobby; joins and leaves only touch the view's state
+            await session.guard(asyncio.wait_for(view.started.wait(), timeout=timeout))
+        except asyncio.TimeoutError:
+            pass
+        except GameStopped:
             try:
                 await lobby_msg.delete()
             except Exception:
                 pass
-            raise
+            return None
+        else:
+            try:
+                await lobby_msg.delete()
+            except Exception:
+                pass
+            return list(view.players.values())
+        finally:
+            view.close()
+            self.metrics.observe("boozybank_lobby_seconds", time.perf_counter() - lobby_started)
 
         # Timeout occurred
         timeout_emb = discord.Embed(
@@ -220,26 +463,26 @@ class BoozyBank(commands.Cog):
             description="The matchmaking lobby timed out after 2 minutes because the game was not started."
         )
         try:
-            await lobby_msg.edit(embed=timeout_emb)
-            try:
-                await lobby_msg.clear_reactions()
-            except Exception:
-                pass
+            await lobby_msg.edit(embed=timeout_emb, view=None)
             asyncio.create_task(self._delete_message_after(lobby_msg, 10))
         except Exception:
             pass
         return None
 
-    async def _cleanup_round_messages(self, ctx, question_msg, player_msgs):
-        """Safely bulk-deletes question embeds and player guesses to keep the channel clean."""
+    async def _cleanup_round_messages(self, channel, question_msg, player_msgs) -> int:
+        """Safely bulk-deletes question embeds and player guesses to keep the channel clean.
+        Returns how many delete requests were sent.
+        """
         try:
-            if not await self.config.guild(ctx.guild).cleanup_messages():
-                return
+            if not (await self._get_settings(channel.guild)).cleanup_messages:
+                return 0
         except Exception:
-            return
+            return 0
 
+        requests = 0
         # 1. Delete question message
         if question_msg:
+            requests += 1
             try:
                 await question_msg.delete()
             except discord.HTTPException:
@@ -247,36 +490,98 @@ class BoozyBank(commands.Cog):
 
         # 2. Bulk delete player guess messages
         if player_msgs:
-            permissions = ctx.channel.permissions_for(ctx.me)
+            permissions = channel.permissions_for(channel.guild.me)
             if permissions.manage_messages:
+                requests += 1
                 try:
-                    await ctx.channel.delete_messages(player_msgs)
+                    await channel.delete_messages(player_msgs)
                 except discord.HTTPException:
                     # Fallback to individual delete if bulk fails
                     for m in player_msgs:
+                        requests += 1
                         try:
                             await m.delete()
                         except discord.HTTPException:
                             pass
             else:
                 pass
+        return requests
+
+    def _question_footer(self, settings: GuildSettings, prompt: str, opened: bool = False) -> str:
+        if settings.reading_time > 0 and not opened:
+            return f"📖 Reading Time: {settings.reading_time}s | Answers locked!"
+        if settings.reading_time > 0:
+            return f"⚡ Answers are now OPEN! | Time limit: {settings.timeout}s"
+        return prompt
+
+    async def _post_question(self, channel, emb: discord.Embed, settings: GuildSettings, locked: bool) -> tuple:
+        """Sends a question with the guild's answer controls. Returns (RenderedMessage, answer view or None).
+        `locked` posts the buttons disabled until `_open_answers` (reading time).
+        """
+        if settings.answer_mode == "buttons":
+            answer_view = AnswerButtonsView(self, disabled=locked)
+            question_msg = await channel.send(embed=emb, view=answer_view)
+            return RenderedMessage(question_msg, emb, answer_view), answer_view
 
-    async def _add_reactions_background(self, ctx, message, emojis):
-        """Asynchronously adds emoji buttons in the background so the round starts instantly."""
-        for emoji in emojis:
-            try:
-                await message.add_reaction(emoji)
-            except discord.Forbidden:
-                log.warning(f"Missing 'Add Reactions' permission in guild {ctx.guild.name} (channel: {ctx.channel.name}). Emoji buttons could not be added.")
-                break
-            except discord.HTTPException:
-                pass
+        question_msg = await channel.send(embed=emb)
+        # Add emoji buttons in the background immediately!
+        self.channel_actions.get(channel).add_buttons(question_msg, list(EMOJI_TO_LETTER), tag=question_msg.id)
+        return RenderedMessage(question_msg, emb), None
+
+    async def _open_answers(self, channel, rendered: RenderedMessage, emb: discord.Embed, answer_view):
+        """Ends the reading time: unlocks the answer controls and shows the updated footer."""
+        try:
+            if answer_view is not None:
+                answer_view.set_disabled(False)
+                await rendered.edit(embed=emb, view=answer_view)
+                return
+            if channel.permissions_for(channel.guild.me).manage_messages:
+                # Clear early player reactions (queued behind the buttons, so they are all in place first)
+                await self.channel_actions.get(channel).clear_early_reactions(rendered.message, self.bot.user.id, tag=rendered.message.id)
+            await rendered.edit(embed=emb)
+        except discord.HTTPException:
+            pass
+
+    async def _reveal_answer_buttons(self, channel, rendered: RenderedMessage, answer_view, correct_answer: str):
+        """Disables the answer buttons and highlights the correct one, in one edit.
+        Skipped when the question message is about to be cleaned up anyway.
+        """
+        if answer_view is None or (await self._get_settings(channel.guild)).cleanup_messages:
+            return
+        answer_view.reveal(correct_answer)
+        try:
+            await rendered.edit(view=answer_view)
+        except discord.HTTPException:
+            pass
+
+    async def handle_answer_button(self, interaction: discord.Interaction, letter: str):
+        """Feeds an answer button click to the open round and replies privately to the player."""
+        # The interaction id carries the moment Discord received the click
+        sent_at = snowflake_ms(interaction.id)
+        self.answer_router.clock.observe(interaction.id, now_ms())
+        answer_round = self.answer_router.round_for_message(interaction.message.id)
+        if answer_round is None:
+            text = "⏰ This question is already closed."
+        elif answer_round.solved:
+            answer_round.offer(interaction.user, letter, sent_at=sent_at) # Turned away, but counted if it beat the winner
+            text = "⏱️ Too late, someone already got it!"
+        elif interaction.user.id not in answer_round.player_ids:
+            text = "🚫 Only players in this game can answer."
+        elif not answer_round.offer(interaction.user, letter, sent_at=sent_at):
+            text = "⚠️ You already answered this question."
+        elif letter == answer_round.correct_answer:
+            text = f"✅ **{letter}** is correct!"
+        elif answer_round.allow_second_guess:
+            text = f"❌ **{letter}** is wrong, try again!"
+        else:
+            text = f"❌ **{letter}** is wrong!"
+        await interaction.response.send_message(text, ephemeral=True)
 
     def _schedule_final_cleanup(self, guild: discord.Guild, message: discord.Message):
         """Schedules a non-blocking background task to delete a final result embed after the configured delay."""
         async def do_cleanup():
             try:
-                delay_minutes = await self.config.guild(guild).final_cleanup_delay()
+                delay_minutes = (await self._get_settings(guild)).final_cleanup_delay
                 if delay_minutes <= 0:
                     return
                 await asyncio.sleep(delay_minutes * 60)
@@ -289,125 +594,62 @@ class BoozyBank(commands.Cog):
         if message:
             asyncio.create_task(do_cleanup())
 
-    async def _generate_quiz(self, guild: discord.Guild, topic: str, difficulty: str) -> dict:
-        """Fetches a single quiz question from OpenAI via a non-blocking request."""
-        tokens = await self.bot.get_shared_api_tokens("openai")
-        api_key = tokens.get("api_key")
-        if not api_key:
-            raise ValueError(
-                "De OpenAI API-key is nog niet ingesteld!\n"
-                "Gebruik het commando `[p]set api openai api_key,<api_key>` om deze in te stellen."
-            )
+    def _get_session(self):
+        """Returns the cog's keep-alive HTTP session, recreating it if it was closed."""
+        if self.session is None or self.session.closed:
+            self.session = create_session(self.http_stats)
+        return self.session
 
-        model = await self.config.guild(guild).model()
+    def _estimate_tokens(self, payload: dict, questions: int) -> int:
+        """Rough token cost of a request (about 4 characters per token, ~150 tokens per generated question)."""
+        return sum(len(m["content"]) for m in payload["messages"]) // 4 + 150 * questions
 
-        url = "https://api.openai.com/v1/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
+    async def _post_openai(self, guild: discord.Guild, url: str, headers: dict, payload: dict, timeout: float, questions: int = 1) -> dict:
+        """POSTs a chat-completions request through the scheduler, with retries, optional hedging and the guild's circuit breaker."""
+        breaker = self._breakers[guild.id]
+        if not breaker.allow():
+            raise CircuitOpenError("OpenAI is failing repeatedly, skipping generation for now.")
 
-        system_prompt = (
-            "You are a professional trivia and quiz generator.\n"
-            "Your task is to generate a single, highly engaging, accurate multiple-choice question.\n"
-            "You MUST return the output as a valid JSON object. "
-            "Do not wrap it in markdown code blocks like ```json ... ```. Just return the raw JSON string.\n"
-            "The JSON object must have exactly the following structure:\n"
-            "{\n"
-            "  \"question\": \"The trivia question text\",\n"
-            "  \"options\": {\n"
-            "    \"A\": \"Option A content\",\n"
-            "    \"B\": \"Option B content\",\n"
-            "    \"C\": \"Option C content\",\n"
-            "    \"D\": \"Option D content\"\n"
-            "  },\n"
-            "  \"correct_answer\": \"B\", // MUST be the correct key ('A', 'B', 'C', or 'D')\n"
-            "  \"explanation\": \"A short, fun explanation of why this answer is correct.\"\n"
-            "}"
-        )
+        latency = self._openai_latency[payload["model"]]
+        hedge_after = None
+        if (await self._get_settings(guild)).hedge_requests and len(latency) >= 20:
+            hedge_after = max(1.0, latency.percentile(0.95))
 
-        user_prompt = (
-            f"Generate an engaging multiple-choice trivia question in English about the topic '{topic}'.\n"
-            f"Difficulty level: {difficulty}.\n"
-            f"Randomize which option letter (A, B, C, or D) holds the correct answer so it is never predictable. "
-            f"Ensure all choices are realistic but with only one objectively correct answer."
-        )
+        estimated_tokens = self._estimate_tokens(payload, questions)
 
-        payload = {
-            "model": model,
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            "response_format": {"type": "json_object"},
-            "temperature": 0.8
-        }
-
-        session = getattr(self.bot, "session", None)
-        if session is None or session.closed:
-            async with aiohttp.ClientSession() as temp_session:
-                async with temp_session.post(url, headers=headers, json=payload, timeout=20) as response:
-                    if response.status != 200:
-                        text = await response.text()
-                        raise RuntimeError(f"OpenAI API returned status {response.status}: {text}")
-                    data = await response.json()
-        else:
-            async with session.post(url, headers=headers, json=payload, timeout=20) as response:
-                if response.status != 200:
-                    text = await response.text()
-                    raise RuntimeError(f"OpenAI API returned status {response.status}: {text}")
-                data = await response.json()
+        async def attempt():
+            async with self.scheduler.slot(guild.id, estimated_tokens):
+                start = time.monotonic()
+                try:
+                    async with self._get_session().post(url, headers=headers, json=payload, timeout=timeout) as response:
+                        if response.status == 429 or response.status >= 500:
+                            text = await response.text()
+                            raise RetryableError(f"OpenAI API returned status {response.status}: {text}")
+                        if response.status != 200:
+                            text = await response.text()
+                            raise RuntimeError(f"OpenAI API returned status {response.status}: {text}")
+                        data = await response.json(loads=loads)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    raise RetryableError(f"OpenAI request failed: {e!r}") from e
+                elapsed = time.monotonic() - start
+                latency.add(elapsed)
+                self.metrics.observe("boozybank_openai_latency_seconds", elapsed, model=payload["model"], mode="batch")
+
+            used_tokens = data.get("usage", {}).get("total_tokens")
+            if used_tokens:
+                self.scheduler.tokens.adjust(used_tokens - estimated_tokens)
+            return data
 
         try:
-            content = data["choices"][0]["message"]["content"]
-            quiz_data = json.loads(content)
-        except (KeyError, IndexError, json.JSONDecodeError) as e:
-            raise RuntimeError(f"Could not parse the OpenAI response. Error: {e}")
-
-        # Validate quiz data structure
-        required_keys = ["question", "options", "correct_answer", "explanation"]
-        for key in required_keys:
-            if key not in quiz_data:
-                raise KeyError(f"Missing key '{key}' in OpenAI response.")
-
-        if not isinstance(quiz_data["options"], dict) or len(quiz_data["options"]) != 4:
-            raise ValueError("Options must be a dictionary with exactly 4 choices (A, B, C, D).")
-
-        ans = quiz_data["correct_answer"].strip().upper()
-        if ans not in ["A", "B", "C", "D"]:
-            raise ValueError(f"Correct answer '{ans}' is not A, B, C, or D.")
-
-        standard_options = {}
-        for letter in ["A", "B", "C", "D"]:
-            val = None
-            for k, v in quiz_data["options"].items():
-                if k.upper() == letter:
-                    val = v
-                    break
-            if val is None:
-                raise ValueError(f"Missing option '{letter}' in the options.")
-            standard_options[letter] = val
-
-        # Randomly shuffle choices in Python so that correct answer is never predictable!
-        correct_text = standard_options[ans]
-        choices = list(standard_options.values())
-        random.shuffle(choices)
-
-        shuffled_options = {}
-        new_ans = None
-        letters = ["A", "B", "C", "D"]
-        for i, val in enumerate(choices):
-            letter = letters[i]
-            shuffled_options[letter] = val
-            if val == correct_text:
-                new_ans = letter
-
-        quiz_data["options"] = shuffled_options
-        quiz_data["correct_answer"] = new_ans
-        return quiz_data
+            data = await with_retries(lambda: hedged(attempt, hedge_after))
+        except RetryableError:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+        return data
 
-    async def _generate_quiz_batch(self, guild: discord.Guild, topic: str, difficulty: str, rounds: int) -> list:
-        """Fetches a batch of quiz questions from OpenAI in a single JSON API call."""
+    async def _build_batch_request(self, guild: discord.Guild, topic: str, difficulty: str, rounds: int) -> tuple:
+        """Builds the URL, headers and JSON payload for a batch generation request."""
         tokens = await self.bot.get_shared_api_tokens("openai")
         api_key = tokens.get("api_key")
         if not api_key:
@@ -416,9 +658,11 @@ class BoozyBank(commands.Cog):
                 "Use the command `[p]set api openai api_key,<api_key>` to set it."
             )
 
-        model = await self.config.guild(guild).model()
+        model = (await self._get_settings(guild)).model
 
-        url = "https://api.openai.com/v1/chat/completions"
+        # `api_base` lets the cog talk to an OpenAI-compatible server, e.g. the local benchmark stub
+        api_base = tokens.get("api_base") or "https://api.openai.com/v1"
+        url = f"{api_base.rstrip('/')}/chat/completions"
         headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
@@ -463,101 +707,354 @@ class BoozyBank(commands.Cog):
             "response_format": {"type": "json_object"},
             "temperature": 0.8
         }
+        return url, headers, payload
 
-        session = getattr(self.bot, "session", None)
-        if session is None or session.closed:
-            async with aiohttp.ClientSession() as temp_session:
-                async with temp_session.post(url, headers=headers, json=payload, timeout=30) as response:
-                    if response.status != 200:
-                        text = await response.text()
-                        raise RuntimeError(f"OpenAI API returned status {response.status}: {text}")
-                    data = await response.json()
-        else:
-            async with session.post(url, headers=headers, json=payload, timeout=30) as response:
-                if response.status != 200:
-                    text = await response.text()
-                    raise RuntimeError(f"OpenAI API returned status {response.status}: {text}")
-                data = await response.json()
+    async def _generate_quiz_batch(self, guild: discord.Guild, topic: str, difficulty: str, rounds: int) -> list:
+        """Fetches a batch of quiz questions from OpenAI in a single JSON API call and validates them.
+        A quick quiz is simply a batch of 1.
+        """
+        url, headers, payload = await self._build_batch_request(guild, topic, difficulty, rounds)
+
+        data = await self._post_openai(guild, url, headers, payload, timeout=30, questions=rounds)
 
         try:
             content = data["choices"][0]["message"]["content"]
-            batch_data = json.loads(content)
-        except (KeyError, IndexError, json.JSONDecodeError) as e:
-            raise RuntimeError(f"Could not parse the OpenAI response. Error: {e}")
-
-        if "questions" not in batch_data or not isinstance(batch_data["questions"], list):
-            raise KeyError("Missing or invalid 'questions' array in OpenAI response.")
-
-        clean_questions = []
-        for index, quiz in enumerate(batch_data["questions"]):
-            required_keys = ["question", "options", "correct_answer", "explanation"]
-            for key in required_keys:
-                if key not in quiz:
-                    raise KeyError(f"Question #{index+1} is missing key '{key}'.")
-
-            if not isinstance(quiz["options"], dict) or len(quiz["options"]) != 4:
-                raise ValueError(f"Question #{index+1} options are not exactly 4 choices (A, B, C, D).")
-
-            ans = quiz["correct_answer"].strip().upper()
-            if ans not in ["A", "B", "C", "D"]:
-                raise ValueError(f"Question #{index+1} correct answer '{ans}' is not A, B, C, or D.")
-
-            standard_options = {}
-            for letter in ["A", "B", "C", "D"]:
-                val = None
-                for k, v in quiz["options"].items():
-                    if k.upper() == letter:
-                        val = v
-                        break
-                if val is None:
-                    raise ValueError(f"Question #{index+1} is missing option '{letter}'.")
-                standard_options[letter] = val
-
-            # Randomly shuffle choices in Python so that correct answer is never predictable!
-            correct_text = standard_options[ans]
-            choices = list(standard_options.values())
-            random.shuffle(choices)
-
-            shuffled_options = {}
-            new_ans = None
-            letters = ["A", "B", "C", "D"]
-            for i, val in enumerate(choices):
-                letter = letters[i]
-                shuffled_options[letter] = val
-                if val == correct_text:
-                    new_ans = letter
-
-            quiz["options"] = shuffled_options
-            quiz["correct_answer"] = new_ans
-            clean_questions.append(quiz)
-
-        return clean_questions
+        except (KeyError, IndexError, TypeError) as e:
+            raise QuestionError(f"Could not parse the OpenAI response. Error: {e}")
+
+        with self.metrics.timer("boozybank_parse_seconds", mode="batch"):
+            questions = self.question_pipeline.run_batch(content)
+        tokens = data.get("usage", {}).get("total_tokens") or self._estimate_tokens(payload, rounds)
+        self.batch_tuner.record_request(pool_key(guild.id, topic, difficulty), tokens, len(questions))
+        if not questions:
+            raise QuestionError("OpenAI did not return any valid questions.")
+        return questions
+
+    async def _stream_quiz_batch(self, guild: discord.Guild, topic: str, difficulty: str, rounds: int):
+        """Streams a batch from OpenAI and yields each question as soon as it is complete.
+        Connecting is retried and counted by the circuit breaker like a batch request.
+        Invalid questions are skipped instead of failing the whole batch.
+        """
+        url, headers, payload = await self._build_batch_request(guild, topic, difficulty, rounds)
+        payload["stream"] = True
 
-    @commands.command()
-    @commands.guild_only()
-    async def boozyquiz(self, ctx, *, topic_and_difficulty: str = None):
-        """Start a single AI-generated multiple-choice quiz.
+        breaker = self._breakers[guild.id]
+        if not breaker.allow():
+            raise CircuitOpenError("OpenAI is failing repeatedly, skipping generation for now.")
 
-        You can optionally specify a topic and/or difficulty.
-        If no topic is specified, a random default topic is chosen.
-        Difficulties: easy, medium, hard (default is medium).
+        parser = QuestionStreamParser()
+        index = valid = 0
+        timeout = aiohttp.ClientTimeout(total=60, sock_read=20)
+        estimated_tokens = self._estimate_tokens(payload, rounds)
 
-        Examples:
-        `[p]boozyquiz`
-        `[p]boozyquiz cocktails`
-        `[p]boozyquiz history hard`
-        `[p]boozyquiz Video Games easy`
-        """
-        channel = ctx.channel
+        async def connect():
+            # Holds the scheduler slot and the response until the stream is read; released on failure
+            stack = contextlib.AsyncExitStack()
+            try:
+                await stack.enter_async_context(self.scheduler.slot(guild.id, estimated_tokens))
+                start = time.monotonic()
+                try:
+                    response = await stack.enter_async_context(
+                        self._get_session().post(url, headers=headers, json=payload, timeout=timeout)
+                    )
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    raise RetryableError(f"OpenAI stream request failed: {e!r}") from e
+                # Same classification as _post_openai: only rate limits and server errors are retried
+                if response.status == 429 or response.status >= 500:
+                    text = await response.text()
+                    raise RetryableError(f"OpenAI API returned status {response.status}: {text}")
+                if response.status != 200:
+                    text = await response.text()
+                    raise RuntimeError(f"OpenAI API returned status {response.status}: {text}")
+                # Time to the response headers: the wait before the first question can arrive
+                self.metrics.observe(
+                    "boozybank_openai_latency_seconds", time.monotonic() - start, model=payload["model"], mode="stream"
+                )
+                return stack, response
+            except BaseException:
+                await stack.aclose()
+                raise
 
-        # Check daily limit
-        if not await self._check_and_increment_daily_limit(ctx):
+        try:
+            # Only the connection is retried; once questions were yielded, a retry would repeat them
+            stack, response = await with_retries(connect)
+        except RetryableError:
+            breaker.record_failure()
+            raise
+        # The API answered; record it now, since the consumer may close the stream early
+        breaker.record_success()
+        try:
+            async with stack:
+                async for delta in iter_sse_content(response):
+                    for quiz in parser.feed(delta):
+                        index += 1
+                        try:
+                            with self.metrics.timer("boozybank_parse_seconds", mode="stream"):
+                                quiz = self.question_pipeline.process(quiz)
+                        except QuestionError as e:
+                            log.warning(f"Skipping invalid streamed question #{index}: {e}")
+                            continue
+                        valid += 1
+                        yield quiz
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            breaker.record_failure()
+            raise
+        finally:
+            # Streams carry no usage data, so the cost is estimated from what was received
+            if index:
+                self.batch_tuner.record_request(
+                    pool_key(guild.id, topic, difficulty), self._estimate_tokens(payload, index), valid
+                )
+
+    def _pool_ready(self, guild: discord.Guild, topic: str, difficulty: str, count: int) -> bool:
+        """Returns True if the question pool can serve `count` questions without waiting."""
+        return self.question_pool.size(pool_key(guild.id, topic, difficulty)) >= count
+
+    async def _prefetch_questions(self, guild: discord.Guild, topic: str, difficulty: str, needed: int):
+        """Starts a background refill when the pool is below what the game needs or the low-water mark."""
+        key = pool_key(guild.id, topic, difficulty)
+        running = self._pool_refills.get(key)
+        if running and not running.done():
             return
 
-        if channel.id in self.active_quizzes:
-            await ctx.send("🍻 A quiz is already active in this channel! Solve that one first.")
+        settings = await self._get_settings(guild)
+        target = max(needed, settings.pool_low_water)
+        available = self.question_pool.size(key)
+        if available >= target:
             return
 
+        batch_size = self.batch_tuner.size(key, target - available, settings.batch_surplus)
+        self._pool_refills[key] = asyncio.create_task(self._refill_pool(guild, topic, difficulty, batch_size))
+
+    async def _fetch_questions(self, guild: discord.Guild, topic: str, difficulty: str, count: int, exclude=()) -> list:
+        """Gets questions for a topic, sharing one in-flight fetch when another guild asks for the same thing
+        with the same model and offline mode. A follower fetches whatever its own exclusions leave missing.
+        """
+        settings = await self._get_settings(guild)
+        key = (normalize_topic(topic), difficulty.lower(), count, settings.model, settings.offline_questions)
+        shared = self._coalesced.get(key)
+        if shared is not None and shared[0] != guild.id and not shared[1].done():
+            questions = await asyncio.shield(shared[1])
+            questions = [copy.deepcopy(q) for q in questions if quiz_fingerprint(q) not in exclude]
+            if len(questions) < count:
+                exclude = set(exclude) | {quiz_fingerprint(q) for q in questions}
+                questions.extend(await self._fetch_questions_uncoalesced(guild, topic, difficulty, count - len(questions), exclude))
+            return questions
+
+        task = asyncio.create_task(self._fetch_questions_uncoalesced(guild, topic, difficulty, count, exclude))
+        self._coalesced[key] = (guild.id, task)
+        try:
+            # Shielded so followers still get their questions if this caller is cancelled
+            return await asyncio.shield(task)
+        finally:
+            if self._coalesced.get(key, (None, None))[1] is task:
+                del self._coalesced[key]
+
+    async def _fetch_questions_uncoalesced(self, guild: discord.Guild, topic: str, difficulty: str, count: int, exclude=()) -> list:
+        """Gets never-served questions from the local bank first, then OpenAI for the remainder.
+        Freshly generated questions are written to the bank, and duplicates of known questions are dropped.
+        """
+        questions = await self.question_bank.draw(topic, difficulty, count, exclude, unserved_only=True)
+        if len(questions) < count and (await self._get_settings(guild)).offline_questions:
+            exclude = set(exclude) | {quiz_fingerprint(q) for q in questions}
+            questions.extend(self.fact_generator.generate(topic, difficulty, count - len(questions), exclude))
+        elif len(questions) < count:
+            fresh = await self._generate_quiz_batch(guild, topic, difficulty, count - len(questions))
+            questions.extend(await self.question_bank.add(topic, difficulty, fresh))
+        return questions
+
+    async def _refill_pool(self, guild: discord.Guild, topic: str, difficulty: str, count: int):
+        """Fetches a batch of questions in the background and stores them in the pool."""
+        key = pool_key(guild.id, topic, difficulty)
+        try:
+            pooled = {quiz_fingerprint(q) for q in self.question_pool.peek(key)}
+            questions = await self._drop_repeats(guild, await self._fetch_questions(guild, topic, difficulty, count, pooled))
+            self.question_pool.put(key, questions)
+            for quiz in questions:
+                self.renderer.prepare(quiz)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log.warning(f"Background question refill failed for '{topic}' ({difficulty}): {e}")
+        finally:
+            if self._pool_refills.get(key) is asyncio.current_task():
+                self._pool_refills.pop(key, None)
+
+    def _count_pool_lookup(self, key: tuple, served: int, wanted: int):
+        self.metrics.inc("boozybank_cache_requests_total", served, cache="pool", result="hit")
+        self.metrics.inc("boozybank_cache_requests_total", wanted - served, cache="pool", result="miss")
+        self.batch_tuner.record_pool_lookup(key, served, wanted)
+
+    async def _drop_repeats(self, guild: discord.Guild, questions: list) -> list:
+        """Drops questions the guild was served within its repeat window, reworded copies included."""
+        days = (await self._get_settings(guild)).repeat_window_days
+        if not days:
+            return questions
+        return await self.recent_questions.filter(guild.id, questions, days)
+
+    async def _mark_served(self, guild: discord.Guild, topic: str, difficulty: str, questions: list):
+        await self.question_bank.mark_served(questions)
+        self.batch_tuner.record_served(pool_key(guild.id, topic, difficulty), len(questions))
+        if (await self._get_settings(guild)).repeat_window_days:
+            await self.recent_questions.record(guild.id, questions)
+
+    async def _fallback_questions(self, guild: discord.Guild, topic: str, difficulty: str, count: int, exclude=()) -> list:
+        """Questions without OpenAI: the least recently served ones from the bank, then the fact tables.
+        Recent repeats are skipped unless nothing else is left, since a repeat beats no game at all.
+        """
+        drawn = await self.question_bank.draw(topic, difficulty, count * 3, exclude)
+        questions = (await self._drop_repeats(guild, drawn))[:count]
+        if len(questions) < count:
+            exclude = set(exclude) | {quiz_fingerprint(q) for q in questions}
+            facts = self.fact_generator.generate(topic, difficulty, (count - len(questions)) * 3, exclude)
+            questions.extend((await self._drop_repeats(guild, facts))[:count - len(questions)])
+        return questions or drawn[:count]
+
+    async def _take_questions(self, guild: discord.Guild, topic: str, difficulty: str, count: int) -> list:
+        """Serves questions from the pool, waiting for an in-flight refill or generating the shortfall directly."""
+        key = pool_key(guild.id, topic, difficulty)
+        if self.question_pool.size(key) < count:
+            running = self._pool_refills.get(key)
+            if running and not running.done():
+                # Shielded so a cancelled game does not kill the shared refill
+                await asyncio.shield(running)
+
+        questions = await self._drop_repeats(guild, self.question_pool.take(key, count))
+        self._count_pool_lookup(key, len(questions), count)
+        if len(questions) < count:
+            missing = count - len(questions)
+            exclude = {quiz_fingerprint(q) for q in questions + self.question_pool.peek(key)}
+            error = None
+            # Ask for a surplus: the extra questions wait in the pool for the next game
+            batch_size = self.batch_tuner.size(key, missing, (await self._get_settings(guild)).batch_surplus)
+            try:
+                fetched = await self._drop_repeats(guild, await self._fetch_questions(guild, topic, difficulty, batch_size, exclude))
+            except Exception as e:
+                error = e
+                fetched = []
+                log.warning(f"Question generation failed, falling back to stored questions: {e}")
+
+            if len(fetched) < missing:
+                exclude |= {quiz_fingerprint(q) for q in fetched}
+                fetched.extend(await self._fallback_questions(guild, topic, difficulty, missing - len(fetched), exclude))
+            if error and not fetched and not questions:
+                raise error
+            questions.extend(fetched[:missing])
+            if fetched[missing:]:
+                self.question_pool.put(key, fetched[missing:])
+                for quiz in fetched[missing:]:
+                    self.renderer.prepare(quiz)
+
+        if not questions:
+            raise RuntimeError("OpenAI did not return any new questions.")
+
+        await self._mark_served(guild, topic, difficulty, questions)
+
+        # Top the pool back up for the next game
+        await self._prefetch_questions(guild, topic, difficulty, 0)
+        return questions
+
+    async def _produce_questions(self, guild: discord.Guild, topic: str, difficulty: str, count: int, queue: asyncio.Queue):
+        """Feeds a game's round loop through `queue`.
+        Pooled and banked questions go in first, then questions streamed from OpenAI as each one completes.
+        Whatever the stream leaves missing is topped up from a regular batch and then stored questions.
+        Puts an Exception if nothing could be served, and always finishes with None.
+        """
+        served = 0
+        exclude = set() # fingerprints queued for this game or waiting in the pool
+        try:
+            settings = await self._get_settings(guild)
+            if not settings.stream_questions or settings.offline_questions:
+                for quiz in await self._take_questions(guild, topic, difficulty, count):
+                    await queue.put(quiz)
+                return
+
+            key = pool_key(guild.id, topic, difficulty)
+            running = self._pool_refills.get(key)
+            if self.question_pool.size(key) < count and running and not running.done():
+                # The lobby prefetch already had a head start, so it beats a fresh request
+                await asyncio.shield(running)
+
+            ready = await self._drop_repeats(guild, self.question_pool.take(key, count))
+            self._count_pool_lookup(key, len(ready), count)
+            exclude |= {quiz_fingerprint(q) for q in ready + self.question_pool.peek(key)}
+            if len(ready) < count:
+                banked = await self.question_bank.draw(topic, difficulty, count - len(ready), exclude, unserved_only=True)
+                ready.extend(await self._drop_repeats(guild, banked))
+                exclude |= {quiz_fingerprint(q) for q in banked}
+            await self._mark_served(guild, topic, difficulty, ready)
+            for quiz in ready:
+                await queue.put(quiz)
+            served = len(ready)
+
+            if served < count:
+                stream = self._stream_quiz_batch(guild, topic, difficulty, count - served)
+                try:
+                    async for quiz in stream:
+                        if not await self.question_bank.add(topic, difficulty, [quiz]):
+                            continue # Already known, don't serve the same trivia again
+                        if not await self._drop_repeats(guild, [quiz]):
+                            continue # A rewording of something this guild played recently
+                        await self._mark_served(guild, topic, difficulty, [quiz])
+                        await queue.put(quiz)
+                        exclude.add(quiz_fingerprint(quiz))
+                        served += 1
+                        if served >= count:
+                            break
+                finally:
+                    await stream.aclose()
+
+            if served < count:
+                # The stream ended early: some of its questions were known, repeats or invalid
+                served = await self._top_up_questions(guild, topic, difficulty, count, served, exclude, queue)
+
+            await self._prefetch_questions(guild, topic, difficulty, 0)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log.warning(f"Streaming question generation failed after {served} question(s): {e}")
+            if served < count:
+                served = await self._top_up_questions(
+                    guild, topic, difficulty, count, served, exclude, queue, batch=not isinstance(e, CircuitOpenError)
+                )
+            if served == 0:
+                await queue.put(e)
+        finally:
+            queue.put_nowait(None)
+
+    async def _top_up_questions(self, guild: discord.Guild, topic: str, difficulty: str, count: int, served: int,
+                                exclude: set, queue: asyncio.Queue, batch: bool = True) -> int:
+        """Queues what a game is still missing after the stream: a regular batch (retries and hedging), then
+        stored questions. `exclude` is updated with everything queued. Returns the new number of questions served.
+        """
+        if batch:
+            try:
+                fetched = await self._fetch_questions(guild, topic, difficulty, count - served, exclude)
+                for quiz in (await self._drop_repeats(guild, fetched))[:count - served]:
+                    await self._mark_served(guild, topic, difficulty, [quiz])
+                    await queue.put(quiz)
+                    exclude.add(quiz_fingerprint(quiz))
+                    served += 1
+            except Exception as e:
+                log.warning(f"Batch top-up after the stream failed: {e}")
+        if served < count:
+            for quiz in await self._fallback_questions(guild, topic, difficulty, count - served, exclude):
+                await self._mark_served(guild, topic, difficulty, [quiz])
+                await queue.put(quiz)
+                exclude.add(quiz_fingerprint(quiz))
+                served += 1
+        return served
+
+    async def _warn_uncovered_topic(self, ctx, topic: str):
+        """Tells the channel when offline questions for the topic will be general trivia."""
+        if (await self._get_settings(ctx.guild)).offline_questions and not self.fact_generator.covers(topic):
+            await ctx.send(
+                f"🗂️ Offline questions are on and no fact table covers **{topic}**. "
+                f"Unless stored questions on it are left, you will get general trivia instead."
+            )
+
+    async def _parse_topic_and_difficulty(self, guild: discord.Guild, topic_and_difficulty: str) -> tuple:
+        """Splits the optional `topic difficulty` argument. Falls back to a random default topic."""
         topic = None
         difficulty = "medium"
 
@@ -573,227 +1070,213 @@ class BoozyBank(commands.Cog):
                 topic = topic_and_difficulty.strip()
 
         if not topic:
-            default_topics = await self.config.guild(ctx.guild).default_topics()
+            default_topics = (await self._get_settings(guild)).default_topics
             topic = random.choice(default_topics) if default_topics else "General Knowledge"
+        return topic, difficulty
+
+    def _answers_opened_ms(self, rendered: RenderedMessage, after_reading: bool) -> int:
+        """Discord's time at which players could start answering, in ms."""
+        if not after_reading:
+            return snowflake_ms(rendered.message.id)
+        if rendered.edited_at is not None:
+            return int(rendered.edited_at.timestamp() * 1000)
+        return self.answer_router.clock.to_discord_ms(now_ms())
+
+    def _answer_seconds(self, sent_at: int, opened_at: int, local_elapsed: float, timeout: int) -> float:
+        """Answer time on Discord's clock, or as measured locally when the timestamps are unusable."""
+        if sent_at is None:
+            return local_elapsed
+        seconds = (sent_at - opened_at) / 1000
+        if -1.0 < seconds <= timeout + 1.0:
+            return max(0.0, seconds)
+        return local_elapsed
+
+    async def _play_round(self, channel, session: GameSession, quiz: dict, emb: discord.Embed, player_ids, prompt: str, reading: bool = True) -> tuple:
+        """Posts one question and collects guesses until someone is right or time runs out.
+        Returns (winner, elapsed seconds); the winner is None if nobody answered correctly.
+        """
+        settings = await self._get_settings(channel.guild)
+        timeout = settings.timeout
+        reading_time = settings.reading_time if reading else 0
+        correct_answer = quiz["correct_answer"]
+        actions = self.channel_actions.get(channel)
+        actions_before = actions.sent
 
-        self.active_quizzes.add(channel.id)
-        self.running_tasks[channel.id] = asyncio.current_task()
-
-        # Run matchmaking lobby
-        joined_players = await self._run_lobby(ctx, topic, difficulty, 1)
-        if not joined_players:
-            self.active_quizzes.discard(channel.id)
-            self.running_tasks.pop(channel.id, None)
-            return
+        rendered, answer_view = await self._post_question(channel, emb, settings, locked=reading_time > 0)
+        question_msg = rendered.message
 
-        emoji_beer = "🍻"
-        generating_msg = await ctx.send(
-            f"{emoji_beer} Generating an **{difficulty}** quiz question about **{topic}** via OpenAI... Please wait!"
-        )
+        player_msgs = []
+        winner = None
+        elapsed = 0.0
 
         try:
-            quiz_data = await self._generate_quiz(ctx.guild, topic, difficulty)
-        except Exception as e:
-            self.active_quizzes.discard(channel.id)
-            self.running_tasks.pop(channel.id, None)
-            await generating_msg.delete()
-            log.error(f"Error generating quiz: {e}", exc_info=True)
-            await ctx.send(f"❌ An error occurred while retrieving the quiz:\n{e}")
-            return
-
-        await generating_msg.delete()
-
-        question = quiz_data["question"]
-        options = quiz_data["options"]
-        correct_answer = quiz_data["correct_answer"]
-        explanation = quiz_data["explanation"]
-
-        choices_str = ""
-        for letter, opt in options.items():
-            choices_str += f"**{letter}**: {opt}\n"
-
-        emb = discord.Embed(
-            title=f"🍻 BoozyBank Trivia! 🍻",
-            color=discord.Color.gold(),
-            description=f"**Topic:** {topic} | **Difficulty:** {difficulty.capitalize()}\n\n"
-                        f"**QUESTION:**\n{question}\n\n"
-                        f"**CHOICES:**\n{choices_str}"
-        )
-
-        timeout = await self.config.guild(ctx.guild).timeout()
-        allow_second_guess = await self.config.guild(ctx.guild).allow_second_guess()
-        currency_name = await bank.get_currency_name(ctx.guild)
-
-        reading_time = await self.config.guild(ctx.guild).reading_time()
-        if reading_time > 0:
-            emb.set_footer(text=f"📖 Reading Time: {reading_time}s | Answers locked!")
-        else:
-            emb.set_footer(text=f"Click a button below or type A, B, C, D! | Time limit: {timeout}s")
-
-        question_msg = await ctx.send(embed=emb)
+            if reading_time > 0:
+                await session.sleep(reading_time)
+                emb.set_footer(text=self._question_footer(settings, prompt, opened=True))
+                await self._open_answers(channel, rendered, emb, answer_view)
+
+            # Guesses are routed here by the cog's listeners and the answer buttons
+            answer_round = self.answer_router.open(channel.id, player_ids, settings.allow_second_guess, question_msg.id, correct_answer)
+            start_time = time.monotonic()
+            opened_at = self._answers_opened_ms(rendered, reading_time > 0)
+            lag_mark = self.loop_lag.count
+            delays = []
+            local_elapsed = None
 
-        # Add emoji buttons in the background immediately!
-        emoji_buttons = ["🇦", "🇧", "🇨", "🇩"]
-        emoji_to_letter = {"🇦": "A", "🇧": "B", "🇨": "C", "🇩": "D"}
-        asyncio.create_task(self._add_reactions_background(ctx, question_msg, emoji_buttons))
-
-        if reading_time > 0:
-            await asyncio.sleep(reading_time)
-            # Clear early player reactions
-            try:
-                question_msg = await ctx.channel.fetch_message(question_msg.id)
-                for rxn in question_msg.reactions:
-                    async for r_user in rxn.users():
-                        if r_user.id != self.bot.user.id:
-                            try:
-                                await rxn.remove(r_user)
-                            except Exception:
-                                pass
-            except Exception:
-                pass
-
-            emb.set_footer(text=f"⚡ Answers are now OPEN! | Time limit: {timeout}s")
             try:
-                await question_msg.edit(embed=emb)
-            except discord.HTTPException:
-                pass
+                while True:
+                    answer = await session.guard(answer_round.next_answer(timeout - (time.monotonic() - start_time)))
+                    if answer is None:
+                        break
 
-        answered_users = set()
-        player_msgs = []
-        start_time = time.time()
-        winner = None
-        elapsed = 0.0
+                    answered_user, ans_attempt, trigger_msg, trigger_rxn, sent_at = answer
+                    if sent_at is not None:
+                        delay = (self.answer_router.clock.to_discord_ms(now_ms()) - sent_at) / 1000
+                        delays.append(max(0.0, delay))
+                        self.metrics.observe("boozybank_answer_delay_seconds", max(0.0, delay))
+                    if trigger_msg:
+                        player_msgs.append(trigger_msg)
 
-        joined_ids = {p.id for p in joined_players}
-
-        def check_msg(m):
-            if m.channel.id != ctx.channel.id:
-                return False
-            if m.author.bot:
-                return False
-            if m.author.id not in joined_ids:
-                return False
-            ans_attempt = m.content.strip().upper()
-            if ans_attempt not in ["A", "B", "C", "D"]:
-                return False
-            if not allow_second_guess and m.author.id in answered_users:
-                return False
-            return True
+                    if ans_attempt == correct_answer:
+                        winner = answered_user
+                        local_elapsed = time.monotonic() - start_time
+                        elapsed = self._answer_seconds(sent_at, opened_at, local_elapsed, timeout)
+                        if trigger_msg:
+                            actions.add_reaction(trigger_msg, "✅")
+                        break
+                    else:
+                        if trigger_msg:
+                            actions.add_reaction(trigger_msg, "❌", tag=question_msg.id)
+                        elif trigger_rxn:
+                            # Auto-remove player's wrong reaction emoji button
+                            permissions = channel.permissions_for(channel.guild.me)
+                            if permissions.manage_messages:
+                                actions.remove_reaction(question_msg, trigger_rxn.emoji, answered_user, tag=question_msg.id)
+            finally:
+                self.answer_router.close(answer_round)
+                self.metrics.inc("boozybank_answer_inversions_total", answer_round.inversions)
+                self.fairness.add(RoundFairness(
+                    len(delays), delays, elapsed if winner else None, local_elapsed,
+                    answer_round.inversions, self.loop_lag.max_since(lag_mark)
+                ))
+        finally:
+            actions.drop(question_msg.id) # Anything still queued for this round is stale now
+            if answer_view is not None:
+                answer_view.stop()
+
+        await self._reveal_answer_buttons(channel, rendered, answer_view, correct_answer)
+        # Cleanup round messages
+        cleanup_requests = await self._cleanup_round_messages(channel, question_msg, player_msgs)
 
-        def check_rxn(reaction, user):
-            if reaction.message.id != question_msg.id:
-                return False
-            if user.bot:
-                return False
-            if user.id not in joined_ids:
-                return False
-            emoji_str = str(reaction.emoji)
-            if emoji_str not in emoji_buttons:
-                return False
-            if not allow_second_guess and user.id in answered_users:
-                return False
-            return True
+        # The question itself, its edits, the queued reactions/marks and the cleanup
+        rest_calls = 1 + rendered.edits + (actions.sent - actions_before) + cleanup_requests
+        self.metrics.observe("boozybank_round_rest_calls", rest_calls)
+        return winner, elapsed
 
-        try:
-            while time.time() - start_time < timeout:
-                remaining = timeout - (time.time() - start_time)
-                if remaining <= 0:
-                    break
+    @commands.command()
+    @commands.guild_only()
+    async def boozyquiz(self, ctx, *, topic_and_difficulty: str = None):
+        """Start a single AI-generated multiple-choice quiz.
 
-                # Concurrent wait tasks
-                msg_task = asyncio.create_task(self.bot.wait_for("message", check=check_msg, timeout=remaining))
-                rxn_task = asyncio.create_task(self.bot.wait_for("reaction_add", check=check_rxn, timeout=remaining))
+        You can optionally specify a topic and/or difficulty.
+        If no topic is specified, a random default topic is chosen.
+        Difficulties: easy, medium, hard (default is medium).
 
-                done, pending = await asyncio.wait(
-                    [msg_task, rxn_task],
-                    return_when=asyncio.FIRST_COMPLETED,
-                    timeout=remaining
-                )
+        Examples:
+        `[p]boozyquiz`
+        `[p]boozyquiz cocktails`
+        `[p]boozyquiz history hard`
+        `[p]boozyquiz Video Games easy`
+        """
+        channel = ctx.channel
 
-                for t in pending:
-                    t.cancel()
+        # Check daily limit
+        if not await self._check_and_increment_daily_limit(ctx):
+            return
 
-                answered_user = None
-                ans_attempt = None
-                trigger_msg = None
-                trigger_rxn = None
+        topic, difficulty = await self._parse_topic_and_difficulty(ctx.guild, topic_and_difficulty)
+        await self._warn_uncovered_topic(ctx, topic)
+        session = GameSession("quiz", ctx.guild.id, channel.id, ctx.author.id, topic, difficulty, 1)
+        if not self.engine.open(session):
+            await ctx.send("🍻 A quiz is already active in this channel! Solve that one first.")
+            return
 
-                for completed in done:
-                    try:
-                        result = completed.result()
-                        if isinstance(result, discord.Message):
-                            trigger_msg = result
-                            answered_user = result.author
-                            ans_attempt = result.content.strip().upper()
-                            player_msgs.append(result)
-                        else:
-                            reaction, user = result
-                            trigger_rxn = reaction
-                            answered_user = user
-                            ans_attempt = emoji_to_letter[str(reaction.emoji)]
-                    except Exception:
-                        pass
+        # Run matchmaking lobby
+        joined_players = await self._run_lobby(ctx, session)
+        if not joined_players:
+            self.engine.close(session)
+            return
 
-                if not answered_user or not ans_attempt:
-                    break
+        session.player_ids = [p.id for p in joined_players]
+        self.engine.launch(session, self._play_quiz(channel, session))
+
+    async def _play_quiz(self, channel, session: GameSession):
+        """Plays a quick quiz: one question, paid out straight away to the fastest correct player."""
+        guild = channel.guild
+        topic, difficulty = session.topic, session.difficulty
+        session.state = LOADING
+        loading_started = time.perf_counter()
+
+        if not session.questions:
+            emoji_beer = "🍻"
+            generating_msg = None
+            if not self._pool_ready(guild, topic, difficulty, 1):
+                generating_msg = await channel.send(
+                    f"{emoji_beer} Generating an **{difficulty}** quiz question about **{topic}** via OpenAI... Please wait!"
+                )
 
-                answered_users.add(answered_user.id)
+            try:
+                session.questions = await session.guard(self._take_questions(guild, topic, difficulty, 1))
+            except GameStopped:
+                raise
+            except Exception as e:
+                log.error(f"Error generating quiz: {e}", exc_info=True)
+                await channel.send(f"❌ An error occurred while retrieving the quiz:\n{e}")
+                return
+            finally:
+                if generating_msg:
+                    await generating_msg.delete()
+            await self.engine.save(session)
 
-                if ans_attempt == correct_answer:
-                    winner = answered_user
-                    elapsed = time.time() - start_time
-                    if trigger_msg:
-                        try:
-                            await trigger_msg.add_reaction("✅")
-                        except discord.HTTPException:
-                            pass
-                    break
-                else:
-                    if trigger_msg:
-                        try:
-                            await trigger_msg.add_reaction("❌")
-                        except discord.HTTPException:
-                            pass
-                    elif trigger_rxn:
-                        # Auto-remove player's wrong reaction emoji button
-                        permissions = ctx.channel.permissions_for(ctx.me)
-                        if permissions.manage_messages:
-                            try:
-                                await question_msg.remove_reaction(trigger_rxn.emoji, answered_user)
-                            except discord.HTTPException:
-                                pass
+        quiz_data = session.questions[0]
+        question = quiz_data["question"]
+        options = quiz_data["options"]
+        correct_answer = quiz_data["correct_answer"]
+        explanation = quiz_data["explanation"]
 
-        except asyncio.CancelledError:
-            self.active_quizzes.discard(channel.id)
-            self.running_tasks.pop(channel.id, None)
-            raise
+        settings = await self._get_settings(guild)
+        currency_name = await bank.get_currency_name(guild)
 
-        self.active_quizzes.discard(channel.id)
-        self.running_tasks.pop(channel.id, None)
+        prompt = f"Click a button below or type A, B, C, D! | Time limit: {settings.timeout}s"
+        emb = self.renderer.question_embed(
+            quiz_data,
+            title="🍻 BoozyBank Trivia! 🍻",
+            color=discord.Color.gold(),
+            header=f"**Topic:** {topic} | **Difficulty:** {difficulty.capitalize()}\n\n",
+            footer=self._question_footer(settings, prompt),
+        )
 
-        # Cleanup round messages
-        await self._cleanup_round_messages(ctx, question_msg, player_msgs)
+        session.state = PLAYING
+        self.metrics.observe("boozybank_first_question_seconds", time.perf_counter() - loading_started)
+        winner, elapsed = await self._play_round(channel, session, quiz_data, emb, session.player_ids, prompt)
+        session.round_index = 1
+        self.engine.close(session)
 
         if winner:
-            base_reward = await self.config.guild(ctx.guild).quiz_reward()
-            
+            base_reward = settings.quiz_reward
+
             # Apply reflex multiplier
             multiplier, speed_tier = self._get_speed_multiplier(elapsed)
             reward = int(base_reward * multiplier)
 
-            deposit_success = True
-            max_bal = 0
-            try:
-                await bank.deposit_credits(winner, reward)
-            except bank.errors.BalanceTooHigh:
-                deposit_success = False
-                max_bal = await bank.get_max_balance(ctx.guild)
+            ledger = PayoutLedger(guild, "boozyquiz")
+            ledger.credit(winner, reward)
+            paid = (await self._pay_out(ledger))[winner.id]
 
             # Update database
-            current_wins = await self.config.member(winner).wins()
-            current_earnings = await self.config.member(winner).earnings()
-            await self.config.member(winner).wins.set(current_wins + 1)
-            await self.config.member(winner).earnings.set(current_earnings + reward)
+            stats = StatsDelta()
+            stats.add(winner.id, wins=1, earnings=paid)
+            await self._commit_stats(guild, stats)
 
             winner_emb = discord.Embed(
                 title="🎉 We have a winner! 🎉",
@@ -806,15 +1289,14 @@ class BoozyBank(commands.Cog):
                             f"💰 **Reward:** `{reward}` {currency_name} *(Multiplier: {multiplier}x)*"
             )
 
-            if not deposit_success:
+            if ledger.capped:
                 winner_emb.add_field(
                     name="⚠️ Wallet Full",
-                    value=f"You did not receive your reward because your bank account has reached the limit of `{max_bal}` {currency_name}!",
+                    value=f"You did not receive your reward because your bank account has reached the limit of `{ledger.max_balance}` {currency_name}!",
                     inline=False
                 )
 
-            show_explanation = await self.config.guild(ctx.guild).show_explanation()
-            if show_explanation and explanation:
+            if settings.show_explanation and explanation:
                 winner_emb.add_field(
                     name="ℹ️ Explanation",
                     value=explanation,
@@ -823,9 +1305,9 @@ class BoozyBank(commands.Cog):
 
             avatar_url = winner.display_avatar.url if hasattr(winner, "display_avatar") else winner.avatar_url
             winner_emb.set_thumbnail(url=avatar_url)
-            
-            final_msg = await ctx.send(embed=winner_emb)
-            self._schedule_final_cleanup(ctx.guild, final_msg)
+
+            final_msg = await channel.send(embed=winner_emb)
+            self._schedule_final_cleanup(guild, final_msg)
 
         else:
             timeout_emb = discord.Embed(
@@ -836,16 +1318,15 @@ class BoozyBank(commands.Cog):
                             f"**Correct Answer:** **{correct_answer}** ({options[correct_answer]})"
             )
 
-            show_explanation = await self.config.guild(ctx.guild).show_explanation()
-            if show_explanation and explanation:
+            if settings.show_explanation and explanation:
                 timeout_emb.add_field(
                     name="ℹ️ Explanation",
                     value=explanation,
                     inline=False
                 )
 
-            final_msg = await ctx.send(embed=timeout_emb)
-            self._schedule_final_cleanup(ctx.guild, final_msg)
+            final_msg = await channel.send(embed=timeout_emb)
+            self._schedule_final_cleanup(guild, final_msg)
 
     @commands.command()
     @commands.guild_only()
@@ -872,246 +1353,125 @@ class BoozyBank(commands.Cog):
             await ctx.send("❌ Number of rounds must be between 1 and 10.")
             return
 
-        if channel.id in self.active_quizzes:
+        topic, difficulty = await self._parse_topic_and_difficulty(ctx.guild, topic_and_difficulty)
+        await self._warn_uncovered_topic(ctx, topic)
+        session = GameSession("game", ctx.guild.id, channel.id, ctx.author.id, topic, difficulty, rounds)
+        if not self.engine.open(session):
             await ctx.send("🍻 A game or quiz is already active in this channel! Solve that one first.")
             return
 
-        topic = None
-        difficulty = "medium"
-
-        if topic_and_difficulty:
-            words = topic_and_difficulty.strip().split()
-            if words[0].lower() in ["easy", "medium", "hard"]:
-                difficulty = words[0].lower()
-                topic = " ".join(words[1:]).strip() if len(words) > 1 else None
-            elif words[-1].lower() in ["easy", "medium", "hard"]:
-                difficulty = words[-1].lower()
-                topic = " ".join(words[:-1]).strip() if len(words) > 1 else None
-            else:
-                topic = topic_and_difficulty.strip()
-
-        if not topic:
-            default_topics = await self.config.guild(ctx.guild).default_topics()
-            topic = random.choice(default_topics) if default_topics else "General Knowledge"
-
-        self.active_quizzes.add(channel.id)
-        self.running_tasks[channel.id] = asyncio.current_task()
-
         # Run matchmaking lobby
-        joined_players = await self._run_lobby(ctx, topic, difficulty, rounds)
+        joined_players = await self._run_lobby(ctx, session)
         if not joined_players:
-            self.active_quizzes.discard(channel.id)
-            self.running_tasks.pop(channel.id, None)
+            self.engine.close(session)
             return
 
-        joined_ids = {p.id for p in joined_players}
-
-        generating_msg = await ctx.send(
-            f"🍻 Lobby filled! Preparing a **{rounds}-round** fast-paced game about **{topic}** ({difficulty})...\n"
-            f"Fetching all questions in advance for a lightning-fast experience! Please wait..."
-        )
+        session.player_ids = [p.id for p in joined_players]
+        self.engine.launch(session, self._play_game(channel, session))
+
+    async def _play_game(self, channel, session: GameSession):
+        """Plays a multi-round game from the session's current round, then finishes it with `_finish_game`."""
+        guild = channel.guild
+        topic, difficulty, rounds = session.topic, session.difficulty, session.rounds
+        session.state = LOADING
+        loading_started = time.perf_counter()
+
+        # Questions arrive through a queue so round 1 can start before the whole batch is generated
+        question_queue = asyncio.Queue()
+        producer = None
+        generating_msg = None
+        missing = rounds - len(session.questions)
+        if missing > 0:
+            if not self._pool_ready(guild, topic, difficulty, missing):
+                generating_msg = await channel.send(
+                    f"🍻 Lobby filled! Preparing a **{rounds}-round** fast-paced game about **{topic}** ({difficulty})...\n"
+                    f"Fetching the questions for a lightning-fast experience! Please wait..."
+                )
+            producer = asyncio.create_task(self._produce_questions(guild, topic, difficulty, missing, question_queue))
+
+        async def next_question():
+            """The question for the next round; None (or an Exception) once the supply ran out."""
+            if session.round_index < len(session.questions):
+                return session.questions[session.round_index]
+            if producer is None:
+                return None
+            quiz = await session.guard(question_queue.get())
+            if isinstance(quiz, dict):
+                session.questions.append(quiz)
+            return quiz
+
+        def checkpoint_questions():
+            """Moves questions already waiting in the queue into the session, so a checkpoint keeps them."""
+            while not question_queue.empty():
+                quiz = question_queue.get_nowait()
+                if not isinstance(quiz, dict):
+                    question_queue.put_nowait(quiz) # The end marker stays last
+                    break
+                session.questions.append(quiz)
 
         try:
-            questions = await self._generate_quiz_batch(ctx.guild, topic, difficulty, rounds)
-        except Exception as e:
-            self.active_quizzes.discard(channel.id)
-            self.running_tasks.pop(channel.id, None)
-            await generating_msg.delete()
-            log.error(f"Error batch-generating quiz game: {e}", exc_info=True)
-            await ctx.send(f"❌ Failed to load the trivia game: {e}")
-            return
-
-        await generating_msg.delete()
+            try:
+                # A game resumed after its last round goes straight to the podium
+                if session.round_index < rounds:
+                    first_quiz = await next_question()
+                    if first_quiz is None:
+                        raise RuntimeError("OpenAI did not return any new questions.")
+                    if isinstance(first_quiz, Exception):
+                        raise first_quiz
+            except GameStopped:
+                raise
+            except Exception as e:
+                log.error(f"Error batch-generating quiz game: {e}", exc_info=True)
+                await channel.send(f"❌ Failed to load the trivia game: {e}")
+                return
+            finally:
+                if generating_msg:
+                    await generating_msg.delete()
+
+            settings = await self._get_settings(guild)
+            show_explanation = settings.show_explanation
+            session.state = PLAYING
+
+            if session.round_index == 0:
+                start_msg = await channel.send(
+                    f"🎉 **BoozyGame Started!** 🎉\n"
+                    f"**Topic:** {topic} | **Difficulty:** {difficulty.capitalize()} | **Rounds:** {rounds}\n"
+                    f"Get ready, Round 1 is starting in 3 seconds..."
+                )
+                await session.sleep(3.0)
+                try:
+                    await start_msg.delete()
+                except discord.HTTPException:
+                    pass
 
-        game_scores = {} # Scoreboard points: {Member: total_points}
-        game_wins = {} # Scoreboard rounds won: {Member: correct_answers_count}
-        game_speeds = {} # Speed tracking: {Member: [speeds_list]}
-        game_multipliers = {} # Multiplier tracking: {Member: [multipliers_list]}
-        currency_name = await bank.get_currency_name(ctx.guild)
-        
-        timeout = await self.config.guild(ctx.guild).timeout()
-        allow_second_guess = await self.config.guild(ctx.guild).allow_second_guess()
-        show_explanation = await self.config.guild(ctx.guild).show_explanation()
-
-        start_msg = await ctx.send(
-            f"🎉 **BoozyGame Started!** 🎉\n"
-            f"**Topic:** {topic} | **Difficulty:** {difficulty.capitalize()} | **Rounds:** {rounds}\n"
-            f"Get ready, Round 1 is starting in 3 seconds..."
-        )
-        await asyncio.sleep(3.0)
-        try:
-            await start_msg.delete()
-        except discord.HTTPException:
-            pass
+            round_prompt = f"Click a button below or type A, B, C, D! | Round limit: {settings.timeout}s"
 
-        emoji_buttons = ["🇦", "🇧", "🇨", "🇩"]
-        emoji_to_letter = {"🇦": "A", "🇧": "B", "🇨": "C", "🇩": "D"}
+            first_round = session.round_index + 1
+            for index in range(first_round, rounds + 1):
+                await session.checkpoint()
 
-        try:
-            for index, quiz in enumerate(questions, start=1):
-                if channel.id not in self.active_quizzes:
+                quiz = await next_question()
+                if quiz is None or isinstance(quiz, Exception):
                     break
 
-                question = quiz["question"]
                 options = quiz["options"]
                 correct_answer = quiz["correct_answer"]
                 explanation = quiz["explanation"]
 
-                choices_str = ""
-                for letter, opt in options.items():
-                    choices_str += f"**{letter}**: {opt}\n"
-
-                emb = discord.Embed(
+                emb = self.renderer.question_embed(
+                    quiz,
                     title=f"🍻 BoozyGame - Round {index} of {rounds} 🍻",
                     color=discord.Color.orange(),
-                    description=f"**QUESTION:**\n{question}\n\n**CHOICES:**\n{choices_str}"
+                    footer=self._question_footer(settings, round_prompt),
                 )
-                reading_time = await self.config.guild(ctx.guild).reading_time()
-                if reading_time > 0:
-                    emb.set_footer(text=f"📖 Reading Time: {reading_time}s | Answers locked!")
-                else:
-                    emb.set_footer(text=f"Click a button below or type A, B, C, D! | Round limit: {timeout}s")
-
-                round_msg = await ctx.send(embed=emb)
-
-                # Add emoji buttons in the background immediately!
-                asyncio.create_task(self._add_reactions_background(ctx, round_msg, emoji_buttons))
-
-                if reading_time > 0:
-                    await asyncio.sleep(reading_time)
-                    # Clear early player reactions
-                    try:
-                        round_msg = await ctx.channel.fetch_message(round_msg.id)
-                        for rxn in round_msg.reactions:
-                            async for r_user in rxn.users():
-                                if r_user.id != self.bot.user.id:
-                                    try:
-                                        await rxn.remove(r_user)
-                                    except Exception:
-                                        pass
-                    except Exception:
-                        pass
-
-                    emb.set_footer(text=f"⚡ Answers are now OPEN! | Time limit: {timeout}s")
-                    try:
-                        await round_msg.edit(embed=emb)
-                    except discord.HTTPException:
-                        pass
-
-                answered_users = set()
-                player_msgs = []
-                start_time = time.time()
-                winner = None
-                elapsed = 0.0
-
-                def check_msg(m):
-                    if m.channel.id != ctx.channel.id:
-                        return False
-                    if m.author.bot:
-                        return False
-                    if m.author.id not in joined_ids:
-                        return False
-                    ans_attempt = m.content.strip().upper()
-                    if ans_attempt not in ["A", "B", "C", "D"]:
-                        return False
-                    if not allow_second_guess and m.author.id in answered_users:
-                        return False
-                    return True
-
-                def check_rxn(reaction, user):
-                    if reaction.message.id != round_msg.id:
-                        return False
-                    if user.bot:
-                        return False
-                    if user.id not in joined_ids:
-                        return False
-                    emoji_str = str(reaction.emoji)
-                    if emoji_str not in emoji_buttons:
-                        return False
-                    if not allow_second_guess and user.id in answered_users:
-                        return False
-                    return True
-
-                while time.time() - start_time < timeout:
-                    remaining = timeout - (time.time() - start_time)
-                    if remaining <= 0:
-                        break
-
-                    # Concurrent message/reaction wait
-                    msg_task = asyncio.create_task(self.bot.wait_for("message", check=check_msg, timeout=remaining))
-                    rxn_task = asyncio.create_task(self.bot.wait_for("reaction_add", check=check_rxn, timeout=remaining))
-
-                    done, pending = await asyncio.wait(
-                        [msg_task, rxn_task],
-                        return_when=asyncio.FIRST_COMPLETED,
-                        timeout=remaining
-                    )
-
-                    for t in pending:
-                        t.cancel()
-
-                    answered_user = None
-                    ans_attempt = None
-                    trigger_msg = None
-                    trigger_rxn = None
-
-                    for completed in done:
-                        try:
-                            result = completed.result()
-                            if isinstance(result, discord.Message):
-                                trigger_msg = result
-                                answered_user = result.author
-                                ans_attempt = result.content.strip().upper()
-                                player_msgs.append(result)
-                            else:
-                                reaction, user = result
-                                trigger_rxn = reaction
-                                answered_user = user
-                                ans_attempt = emoji_to_letter[str(reaction.emoji)]
-                        except Exception:
-                            pass
-
-                    if not answered_user or not ans_attempt:
-                        break
-
-                    answered_users.add(answered_user.id)
-
-                    if ans_attempt == correct_answer:
-                        winner = answered_user
-                        elapsed = time.time() - start_time
-                        if trigger_msg:
-                            try:
-                                await trigger_msg.add_reaction("✅")
-                            except discord.HTTPException:
-                                pass
-                        break
-                    else:
-                        if trigger_msg:
-                            try:
-                                await trigger_msg.add_reaction("❌")
-                            except discord.HTTPException:
-                                pass
-                        elif trigger_rxn:
-                            # Auto-remove player's wrong reaction emoji button
-                            permissions = ctx.channel.permissions_for(ctx.me)
-                            if permissions.manage_messages:
-                                try:
-                                    await round_msg.remove_reaction(trigger_rxn.emoji, answered_user)
-                                except discord.HTTPException:
-                                    pass
-
-                # Round message cleanup
-                await self._cleanup_round_messages(ctx, round_msg, player_msgs)
+                if index == first_round:
+                    self.metrics.observe("boozybank_first_question_seconds", time.perf_counter() - loading_started)
+                winner, elapsed = await self._play_round(channel, session, quiz, emb, session.player_ids, round_prompt)
 
                 if winner:
                     multiplier, speed_tier = self._get_speed_multiplier(elapsed)
-                    points_earned = int(100 * multiplier)
-                    
                     # Track score and stats
-                    game_scores[winner] = game_scores.get(winner, 0) + points_earned
-                    game_wins[winner] = game_wins.get(winner, 0) + 1
-                    game_speeds.setdefault(winner, []).append(elapsed)
-                    game_multipliers.setdefault(winner, []).append(multiplier)
+                    points_earned = session.record_win(winner.id, elapsed, multiplier)
 
                     round_win_emb = discord.Embed(
                         title=f"🎯 Round {index} Won!",
@@ -1124,9 +1484,9 @@ class BoozyBank(commands.Cog):
                     )
                     if show_explanation and explanation:
                         round_win_emb.add_field(name="ℹ️ Explanation", value=explanation, inline=False)
-                    
-                    round_final_msg = await ctx.send(embed=round_win_emb)
-                    self._schedule_final_cleanup(ctx.guild, round_final_msg)
+
+                    round_final_msg = await channel.send(embed=round_win_emb)
+                    self._schedule_final_cleanup(guild, round_final_msg)
                 else:
                     round_timeout_emb = discord.Embed(
                         title=f"⏰ Round {index} - Time is up!",
@@ -1136,34 +1496,49 @@ class BoozyBank(commands.Cog):
                     )
                     if show_explanation and explanation:
                         round_timeout_emb.add_field(name="ℹ️ Explanation", value=explanation, inline=False)
-                    
-                    round_final_msg = await ctx.send(embed=round_timeout_emb)
-                    self._schedule_final_cleanup(ctx.guild, round_final_msg)
+
+                    round_final_msg = await channel.send(embed=round_timeout_emb)
+                    self._schedule_final_cleanup(guild, round_final_msg)
+
+                session.round_index = index
+                checkpoint_questions()
+                await self.engine.save(session)
 
                 if index < rounds:
-                    next_round_msg = await ctx.send(f"Round {index+1} is starting in 5 seconds...")
-                    await asyncio.sleep(5.0)
+                    next_round_msg = await channel.send(f"Round {index+1} is starting in 5 seconds...")
+                    await session.sleep(5.0)
                     try:
                         await next_round_msg.delete()
                     except discord.HTTPException:
                         pass
-
-        except asyncio.CancelledError:
-            self.active_quizzes.discard(channel.id)
-            self.running_tasks.pop(channel.id, None)
-            raise
-
-        if not game_scores:
-            self.active_quizzes.discard(channel.id)
-            self.running_tasks.pop(channel.id, None)
-            game_over_msg = await ctx.send("🏁 **Game Over!** Nobody won any rounds, so no coins will be distributed.")
-            self._schedule_final_cleanup(ctx.guild, game_over_msg)
+        finally:
+            if producer is not None:
+                producer.cancel()
+
+        await self._finish_game(channel, session)
+
+    async def _finish_game(self, channel, session: GameSession):
+        """Breaks a tie for first place if needed, pays out the End Game Reward and posts the podium."""
+        guild = channel.guild
+        topic, difficulty = session.topic, session.difficulty
+        settings = await self._get_settings(guild)
+        timeout = settings.timeout
+        show_explanation = settings.show_explanation
+        currency_name = await bank.get_currency_name(guild)
+
+        if not session.scores:
+            self.engine.close(session)
+            game_over_msg = await channel.send("🏁 **Game Over!** Nobody won any rounds, so no coins will be distributed.")
+            self._schedule_final_cleanup(guild, game_over_msg)
             return
 
+        # Players are kept by ID in the session; members who left the server can't be paid
+        members = {member_id: guild.get_member(member_id) for member_id in session.scores}
+
         # Find top score and check for TIE
-        sorted_scores = sorted(game_scores.items(), key=lambda x: x[1], reverse=True)
+        sorted_scores = session.standings()
         max_score = sorted_scores[0][1]
-        grand_winners = [member for member, score in sorted_scores if score == max_score]
+        grand_winners = [members[member_id] for member_id, score in sorted_scores if score == max_score and members[member_id]]
 
         # ⚔️ SUDDEN DEATH TIE-BREAKER ⚔️
         tie_broken = False
@@ -1171,32 +1546,37 @@ class BoozyBank(commands.Cog):
         max_tie_breakers = 3
 
         if len(grand_winners) > 1:
+            session.enter(TIEBREAK)
+            await self.engine.save(session)
             champs_mentions = ", ".join(c.mention for c in grand_winners)
-            tb_start_msg = await ctx.send(
+            tb_start_msg = await channel.send(
                 f"⚔️ **SUDDEN DEATH TIE-BREAKER!** ⚔️\n"
                 f"We have a tie! {champs_mentions} both finished with **{max_score} points**!\n"
                 f"I will generate tie-breaker questions. **Only** these players can answer! Get ready..."
             )
-            await asyncio.sleep(4.0)
+            await session.sleep(4.0)
             try:
                 await tb_start_msg.delete()
             except discord.HTTPException:
                 pass
 
             while len(grand_winners) > 1 and tie_breaker_attempts < max_tie_breakers:
+                await session.checkpoint()
                 tie_breaker_attempts += 1
-                tb_gen_msg = await ctx.send(f"Generating Tie-Breaker Question #{tie_breaker_attempts}...")
+                tb_gen_msg = await channel.send(f"Generating Tie-Breaker Question #{tie_breaker_attempts}...")
 
                 try:
-                    tb_quiz = await self._generate_quiz(ctx.guild, topic, difficulty)
+                    tb_quiz = (await session.guard(self._take_questions(guild, topic, difficulty, 1)))[0]
+                except GameStopped:
+                    raise
                 except Exception as e:
                     log.error(f"Error generating tie breaker question: {e}")
                     try:
                         await tb_gen_msg.delete()
                     except discord.HTTPException:
                         pass
-                    fail_msg = await ctx.send("❌ Failed to generate tie-breaker. Skipping to final draw.")
-                    self._schedule_final_cleanup(ctx.guild, fail_msg)
+                    fail_msg = await channel.send("❌ Failed to generate tie-breaker. Skipping to final draw.")
+                    self._schedule_final_cleanup(guild, fail_msg)
                     break
 
                 try:
@@ -1204,131 +1584,29 @@ class BoozyBank(commands.Cog):
                 except discord.HTTPException:
                     pass
 
-                tb_question = tb_quiz["question"]
                 tb_options = tb_quiz["options"]
                 tb_correct = tb_quiz["correct_answer"]
                 tb_explanation = tb_quiz["explanation"]
 
-                tb_choices = ""
-                for letter, opt in tb_options.items():
-                    tb_choices += f"**{letter}**: {opt}\n"
-
-                tb_emb = discord.Embed(
+                tb_prompt = f"Tied players: Tap a button or type A, B, C, D! | Time: {timeout}s"
+                tb_emb = self.renderer.question_embed(
+                    tb_quiz,
                     title=f"⚔️ Tie-Breaker Round {tie_breaker_attempts} ⚔️",
                     color=discord.Color.red(),
-                    description=f"**ONLY TIE CONTENDERS CAN ANSWER!**\n\n"
-                                f"**QUESTION:**\n{tb_question}\n\n**CHOICES:**\n{tb_choices}"
+                    header="**ONLY TIE CONTENDERS CAN ANSWER!**\n\n",
+                    footer=tb_prompt,
                 )
-                tb_emb.set_footer(text=f"Tied players: Tap a button or type A, B, C, D! | Time: {timeout}s")
-
-                tb_msg = await ctx.send(embed=tb_emb)
-                asyncio.create_task(self._add_reactions_background(ctx, tb_msg, emoji_buttons))
-
-                answered_users = set()
-                tb_player_msgs = []
-                tb_start = time.time()
-                tb_winner = None
-                tb_elapsed = 0.0
-
-                def check_tb_msg(m):
-                    if m.channel.id != ctx.channel.id:
-                        return False
-                    if m.author not in grand_winners:
-                        return False
-                    ans_attempt = m.content.strip().upper()
-                    if ans_attempt not in ["A", "B", "C", "D"]:
-                        return False
-                    if not allow_second_guess and m.author.id in answered_users:
-                        return False
-                    return True
-
-                def check_tb_rxn(reaction, user):
-                    if reaction.message.id != tb_msg.id:
-                        return False
-                    if user not in grand_winners:
-                        return False
-                    emoji_str = str(reaction.emoji)
-                    if emoji_str not in emoji_buttons:
-                        return False
-                    if not allow_second_guess and user.id in answered_users:
-                        return False
-                    return True
-
-                while time.time() - tb_start < timeout:
-                    rem = timeout - (time.time() - tb_start)
-                    if rem <= 0:
-                        break
-
-                    m_task = asyncio.create_task(self.bot.wait_for("message", check=check_tb_msg, timeout=rem))
-                    r_task = asyncio.create_task(self.bot.wait_for("reaction_add", check=check_tb_rxn, timeout=rem))
-
-                    d, p = await asyncio.wait([m_task, r_task], return_when=asyncio.FIRST_COMPLETED, timeout=rem)
-                    for pending_t in p:
-                        pending_t.cancel()
-
-                    ans_user = None
-                    ans_val = None
-                    trig_m = None
-                    trig_r = None
-
-                    for comp in d:
-                        try:
-                            res = comp.result()
-                            if isinstance(res, discord.Message):
-                                trig_m = res
-                                ans_user = res.author
-                                ans_val = res.content.strip().upper()
-                                tb_player_msgs.append(res)
-                            else:
-                                rxn, u = res
-                                trig_r = rxn
-                                ans_user = u
-                                ans_val = emoji_to_letter[str(rxn.emoji)]
-                        except Exception:
-                            pass
-
-                    if not ans_user or not ans_val:
-                        break
 
-                    answered_users.add(ans_user.id)
-
-                    if ans_val == tb_correct:
-                        tb_winner = ans_user
-                        tb_elapsed = time.time() - tb_start
-                        if trig_m:
-                            try:
-                                await trig_m.add_reaction("✅")
-                            except discord.HTTPException:
-                                pass
-                        break
-                    else:
-                        if trig_m:
-                            try:
-                                await trig_m.add_reaction("❌")
-                            except discord.HTTPException:
-                                pass
-                        elif trig_r:
-                            perm = ctx.channel.permissions_for(ctx.me)
-                            if perm.manage_messages:
-                                try:
-                                    await tb_msg.remove_reaction(trig_r.emoji, ans_user)
-                                except discord.HTTPException:
-                                    pass
-
-                # Cleanup tie-breaker messages
-                await self._cleanup_round_messages(ctx, tb_msg, tb_player_msgs)
+                tied_ids = {c.id for c in grand_winners}
+                tb_winner, tb_elapsed = await self._play_round(channel, session, tb_quiz, tb_emb, tied_ids, tb_prompt, reading=False)
 
                 if tb_winner:
                     grand_winners = [tb_winner] # Tie successfully broken!
                     tie_broken = True
-                    
+
                     # Log final tie win stats
                     multiplier, speed_tier = self._get_speed_multiplier(tb_elapsed)
-                    points_earned = int(100 * multiplier)
-                    game_scores[tb_winner] = game_scores.get(tb_winner, 0) + points_earned
-                    game_wins[tb_winner] = game_wins.get(tb_winner, 0) + 1
-                    game_speeds.setdefault(tb_winner, []).append(tb_elapsed)
-                    game_multipliers.setdefault(tb_winner, []).append(multiplier)
+                    session.record_win(tb_winner.id, tb_elapsed, multiplier)
 
                     tb_win_emb = discord.Embed(
                         title="🎯 Tie-Breaker Solved!",
@@ -1339,69 +1617,44 @@ class BoozyBank(commands.Cog):
                     )
                     if show_explanation and tb_explanation:
                         tb_win_emb.add_field(name="ℹ️ Explanation", value=tb_explanation, inline=False)
-                    
-                    tb_final = await ctx.send(embed=tb_win_emb)
-                    self._schedule_final_cleanup(ctx.guild, tb_final)
+
+                    tb_final = await channel.send(embed=tb_win_emb)
+                    self._schedule_final_cleanup(guild, tb_final)
                     break
                 else:
-                    no_ans_msg = await ctx.send("❌ Tie-breaker timed out or had no correct answers.")
+                    no_ans_msg = await channel.send("❌ Tie-breaker timed out or had no correct answers.")
                     asyncio.create_task(self._delete_message_after(no_ans_msg, 4))
                     if tie_breaker_attempts < max_tie_breakers:
-                        await asyncio.sleep(3.0)
+                        await session.sleep(3.0)
 
             if not tie_broken:
-                draw_msg = await ctx.send("🏳️ All tie-breaker attempts failed! We declare a shared draw.")
-                self._schedule_final_cleanup(ctx.guild, draw_msg)
+                draw_msg = await channel.send("🏳️ All tie-breaker attempts failed! We declare a shared draw.")
+                self._schedule_final_cleanup(guild, draw_msg)
 
-        self.active_quizzes.discard(channel.id)
-        self.running_tasks.pop(channel.id, None)
+        self.engine.close(session)
 
         # Final end reward distribution
-        end_reward_key = f"{difficulty}_endreward"
-        base_end_reward = await self.config.guild(ctx.guild).get_attr(end_reward_key)()
+        base_end_reward = settings.end_reward(difficulty)
 
-        payout_results = {}
         champions_list = grand_winners # Can be multiple if draw occurred
 
-        # Calculate flat payouts for the champions (divided equally for draws)
-        payouts_by_winner = {}
-        total_payout_requested = 0
-        num_champs = len(champions_list)
-
-        for champ in champions_list:
-            final_payout = int(base_end_reward / num_champs)
-            payouts_by_winner[champ] = final_payout
-            total_payout_requested += final_payout
-
-        # Safety Cap
-        max_game_payout = await self.config.guild(ctx.guild).max_game_payout()
-        scaling_factor = 1.0
-        if total_payout_requested > max_game_payout:
-            scaling_factor = max_game_payout / total_payout_requested
-
-        # Distribute coins and save to database
+        # Flat payouts for the champions (divided equally for draws), scaled down together past the guild cap
+        max_game_payout = settings.max_game_payout
+        ledger = PayoutLedger(guild, f"boozygame ({len(champions_list)} champion(s))", cap=max_game_payout)
         for champ in champions_list:
-            unscaled_payout = payouts_by_winner[champ]
-            final_coins = int(unscaled_payout * scaling_factor)
-            payout_results[champ] = final_coins
-
-            try:
-                await bank.deposit_credits(champ, final_coins)
-            except bank.errors.BalanceTooHigh:
-                pass
+            ledger.credit(champ, int(base_end_reward / len(champions_list)))
+        total_payout_requested = ledger.requested
+        scaling_factor = ledger.scaling_factor
+        payout_results = await self._pay_out(ledger) # {member_id: coins}
 
-        # Update stats
-        for player, score in game_scores.items():
-            current_wins = await self.config.member(player).wins()
-            current_earnings = await self.config.member(player).earnings()
-            
-            winnings_won = payout_results.get(player, 0)
-            rounds_won_count = game_wins.get(player, 0)
-            await self.config.member(player).wins.set(current_wins + rounds_won_count)
-            await self.config.member(player).earnings.set(current_earnings + winnings_won)
+        # Update stats in one batch
+        stats = StatsDelta()
+        for member_id in session.scores:
+            stats.add(member_id, wins=session.wins.get(member_id, 0), earnings=payout_results.get(member_id, 0))
+        await self._commit_stats(guild, stats)
 
         # Re-sort final scores for podium
-        final_scores = sorted(game_scores.items(), key=lambda x: x[1], reverse=True)
+        final_scores = session.standings()
 
         # Final embed
         podium_emb = discord.Embed(
@@ -1412,24 +1665,27 @@ class BoozyBank(commands.Cog):
         )
 
         podium_text = ""
-        for rank, (player, score) in enumerate(final_scores, start=1):
+        champion_ids = {c.id for c in champions_list}
+        for rank, (member_id, score) in enumerate(final_scores, start=1):
             medal = "🥇 " if rank == 1 else "🥈 " if rank == 2 else "🥉 " if rank == 3 else f"#{rank} "
-            
-            is_champ = player in champions_list
+
+            is_champ = member_id in champion_ids
             champ_badge = "👑 **CHAMPION** " if is_champ else ""
-            
-            winnings = payout_results.get(player, 0)
-            
-            player_speeds = game_speeds.get(player, [])
+
+            winnings = payout_results.get(member_id, 0)
+            player = members.get(member_id) or guild.get_member(member_id)
+            player_name = player.display_name if player else "Unknown player"
+
+            player_speeds = session.speeds.get(member_id, [])
             if player_speeds:
                 avg_speed = sum(player_speeds) / len(player_speeds)
-                multipliers = game_multipliers.get(player, [1.0])
+                multipliers = session.multipliers.get(member_id, [1.0])
                 mults_str = ", ".join(f"{m:.2f}x" for m in multipliers)
                 speed_str = f"Avg. Speed: `{avg_speed:.2f}s` | Round Multipliers: `{mults_str}`"
             else:
                 speed_str = "No rounds won"
-                
-            podium_text += f"{medal}{champ_badge}**{player.display_name}** - `{score}` points\n" \
+
+            podium_text += f"{medal}{champ_badge}**{player_name}** - `{score}` points\n" \
                            f"   ↳ *{speed_str}* | Won `{winnings}` {currency_name}\n"
 
         podium_emb.description = f"{podium_emb.description}{podium_text}"
@@ -1440,16 +1696,24 @@ class BoozyBank(commands.Cog):
                 value=f"The total game payout reached `{total_payout_requested}` {currency_name}, which exceeded the guild cap of `{max_game_payout}`. Payouts were scaled down by `{scaling_factor:.2%}`.",
                 inline=False
             )
-            
+
+        if ledger.capped:
+            capped_mentions = ", ".join(f"<@{member_id}>" for member_id in sorted(ledger.capped))
+            podium_emb.add_field(
+                name="⚠️ Wallet Full",
+                value=f"{capped_mentions} reached the bank limit of `{ledger.max_balance}` {currency_name} and did not receive their payout.",
+                inline=False
+            )
+
         if len(champions_list) == 1:
             champion = champions_list[0]
             podium_emb.set_thumbnail(url=champion.display_avatar.url if hasattr(champion, "display_avatar") else champion.avatar_url)
             podium_emb.add_field(
                 name="🏆 Overall Grand Winner!",
-                value=f"{champion.mention} receives the End Game Reward of **`{payout_results[champion]}` {currency_name}**!",
+                value=f"{champion.mention} receives the End Game Reward of **`{payout_results[champion.id]}` {currency_name}**!",
                 inline=False
             )
-        else:
+        elif champions_list:
             champs_mention = ", ".join(c.mention for c in champions_list)
             podium_emb.add_field(
                 name="🏆 Overall Grand Winners (Tie!)",
@@ -1457,25 +1721,59 @@ class BoozyBank(commands.Cog):
                 inline=False
             )
 
-        podium_msg = await ctx.send(embed=podium_emb)
-        self._schedule_final_cleanup(ctx.guild, podium_msg)
+        podium_msg = await channel.send(embed=podium_emb)
+        self._schedule_final_cleanup(guild, podium_msg)
+
+    def _can_manage_session(self, ctx, session: GameSession) -> bool:
+        """The host of a game, or anyone who can manage messages here, may pause or resume it."""
+        permissions = ctx.channel.permissions_for(ctx.author)
+        return ctx.author.id == session.host_id or permissions.manage_guild or permissions.manage_messages
+
+    @commands.command()
+    @commands.guild_only()
+    async def boozypause(self, ctx):
+        """Pause the game in this channel after the current round (host or admin)."""
+        session = self.engine.get(ctx.channel.id)
+        if session is None:
+            await ctx.send("❌ There is no active quiz or game running in this channel.")
+            return
+        if not self._can_manage_session(ctx, session):
+            await ctx.send("🚫 Only the host or an admin can pause the game.")
+            return
+        if not session.pause():
+            await ctx.send("⚠️ Only a multi-round game can be paused, and only while its rounds are being played.")
+            return
+        await ctx.send(f"⏸️ The game will pause after the current round. Use `{ctx.clean_prefix}boozyresume` to continue.")
+
+    @commands.command()
+    @commands.guild_only()
+    async def boozyresume(self, ctx):
+        """Resume a paused game in this channel (host or admin)."""
+        session = self.engine.get(ctx.channel.id)
+        if session is None:
+            await ctx.send("❌ There is no active quiz or game running in this channel.")
+            return
+        if not self._can_manage_session(ctx, session):
+            await ctx.send("🚫 Only the host or an admin can resume the game.")
+            return
+        if not session.resume():
+            await ctx.send("⚠️ The game in this channel is not paused.")
+            return
+        await ctx.send("▶️ The game continues!")
 
     @commands.command()
     @commands.guild_only()
     @commands.admin_or_permissions(manage_messages=True)
     async def boozystop(self, ctx):
         """Forcefully stops any active quiz or game in the current channel."""
-        channel = ctx.channel
-        if channel.id not in self.active_quizzes:
+        session = self.engine.get(ctx.channel.id)
+        if session is None:
             await ctx.send("❌ There is no active quiz or game running in this channel.")
             return
 
-        task = self.running_tasks.get(channel.id)
-        if task:
-            task.cancel()
-            self.running_tasks.pop(channel.id, None)
-
-        self.active_quizzes.discard(channel.id)
+        # The game notices the stop at its next wait and ends itself; the channel is free right away
+        session.stop()
+        self.engine.close(session)
         await ctx.send("🛑 The active quiz/game has been forcefully stopped, and all locks have been released.")
 
     @commands.group()
@@ -1491,7 +1789,7 @@ class BoozyBank(commands.Cog):
         if amount < 0:
             await ctx.send("Reward cannot be negative.")
             return
-        await self.config.guild(ctx.guild).quiz_reward.set(amount)
+        await self._set_guild_setting(ctx.guild, "quiz_reward", amount)
         await ctx.send(f"Quiz question reward set to `{amount}` coins.")
 
     @boozyquizset.command()
@@ -1500,7 +1798,7 @@ class BoozyBank(commands.Cog):
         if seconds < 10 or seconds > 120:
             await ctx.send("Choose a time limit between 10 and 120 seconds.")
             return
-        await self.config.guild(ctx.guild).timeout.set(seconds)
+        await self._set_guild_setting(ctx.guild, "timeout", seconds)
         await ctx.send(f"Answer time limit set to `{seconds}` seconds.")
 
     @boozyquizset.command()
@@ -1509,7 +1807,7 @@ class BoozyBank(commands.Cog):
         if seconds < 0 or seconds > 20:
             await ctx.send("Please choose a reading time between 0 and 20 seconds (0 to disable).")
             return
-        await self.config.guild(ctx.guild).reading_time.set(seconds)
+        await self._set_guild_setting(ctx.guild, "reading_time", seconds)
         if seconds == 0:
             await ctx.send("Reading time delay has been **disabled**.")
         else:
@@ -1518,27 +1816,27 @@ class BoozyBank(commands.Cog):
     @boozyquizset.command()
     async def model(self, ctx, model_name: str):
         """Set the OpenAI model (e.g. gpt-4o-mini, gpt-4o)."""
-        await self.config.guild(ctx.guild).model.set(model_name)
+        await self._set_guild_setting(ctx.guild, "model", model_name)
         await ctx.send(f"OpenAI model set to `{model_name}`.")
 
     @boozyquizset.command()
     async def secondguess(self, ctx, toggle: bool):
         """Set whether players can make a second guess if they are wrong."""
-        await self.config.guild(ctx.guild).allow_second_guess.set(toggle)
+        await self._set_guild_setting(ctx.guild, "allow_second_guess", toggle)
         status = "allowed" if toggle else "not allowed"
         await ctx.send(f"A second guess is now **{status}**.")
 
     @boozyquizset.command()
     async def showexplanation(self, ctx, toggle: bool):
         """Set whether to show the explanation after the quiz ends."""
-        await self.config.guild(ctx.guild).show_explanation.set(toggle)
+        await self._set_guild_setting(ctx.guild, "show_explanation", toggle)
         status = "on" if toggle else "off"
         await ctx.send(f"Showing explanations is now **{status}**.")
 
     @boozyquizset.command()
     async def cleanup(self, ctx, toggle: bool):
         """Toggle whether to auto-delete question embeds and wrong answers after rounds."""
-        await self.config.guild(ctx.guild).cleanup_messages.set(toggle)
+        await self._set_guild_setting(ctx.guild, "cleanup_messages", toggle)
         status = "enabled" if toggle else "disabled"
         await ctx.send(f"Message cleanup is now **{status}**.")
 
@@ -1548,7 +1846,7 @@ class BoozyBank(commands.Cog):
         if minutes < 0:
             await ctx.send("Delay cannot be negative.")
             return
-        await self.config.guild(ctx.guild).final_cleanup_delay.set(minutes)
+        await self._set_guild_setting(ctx.guild, "final_cleanup_delay", minutes)
         if minutes == 0:
             await ctx.send("Final message cleanup has been **disabled**.")
         else:
@@ -1560,7 +1858,7 @@ class BoozyBank(commands.Cog):
         if amount < 100:
             await ctx.send("The game payout limit should be at least 100 coins.")
             return
-        await self.config.guild(ctx.guild).max_game_payout.set(amount)
+        await self._set_guild_setting(ctx.guild, "max_game_payout", amount)
         await ctx.send(f"Maximum game payout limit set to `{amount}` coins.")
 
     @boozyquizset.command()
@@ -1569,7 +1867,7 @@ class BoozyBank(commands.Cog):
         if amount < 0:
             await ctx.send("Limit cannot be negative.")
             return
-        await self.config.guild(ctx.guild).daily_limit.set(amount)
+        await self._set_guild_setting(ctx.guild, "daily_limit", amount)
         if amount == 0:
             await ctx.send("Daily starts limit has been **disabled**.")
         else:
@@ -1581,9 +1879,234 @@ class BoozyBank(commands.Cog):
         if amount < 1 or amount > 10:
             await ctx.send("Please choose a player limit between 1 and 10.")
             return
-        await self.config.guild(ctx.guild).min_players.set(amount)
+        await self._set_guild_setting(ctx.guild, "min_players", amount)
         await ctx.send(f"Minimum players required to start matchmaking set to `{amount}`.")
 
+    @boozyquizset.command()
+    async def poollowwater(self, ctx, amount: int):
+        """Set how many pre-generated questions to keep ready per topic (0 to 10, 0 to only fetch on demand)."""
+        if amount < 0 or amount > 10:
+            await ctx.send("Please choose a low-water mark between 0 and 10.")
+            return
+        await self._set_guild_setting(ctx.guild, "pool_low_water", amount)
+        if amount == 0:
+            await ctx.send("Background question refills have been **disabled**.")
+        else:
+            await ctx.send(f"The question pool will be refilled below `{amount}` questions per topic.")
+
+    @boozyquizset.command()
+    async def surplus(self, ctx, amount: int):
+        """Set how many extra questions each OpenAI request asks for, kept for later games (0 to 9).
+
+        The surplus shrinks by itself for topics whose extra questions mostly go unplayed.
+        """
+        if amount < 0 or amount >= MAX_BATCH:
+            await ctx.send(f"Please choose a surplus between 0 and {MAX_BATCH - 1}.")
+            return
+        await self._set_guild_setting(ctx.guild, "batch_surplus", amount)
+        if amount == 0:
+            await ctx.send("OpenAI requests now ask for **exactly** the questions a game needs.")
+        else:
+            await ctx.send(f"OpenAI requests now ask for up to `{amount}` extra questions.")
+
+    @boozyquizset.command()
+    async def batching(self, ctx):
+        """Show the generation cost per served question and the pool hit rate for this server's topics."""
+        settings = await self._get_settings(ctx.guild)
+        rows = self.batch_tuner.for_guild(ctx.guild.id)
+        if not rows:
+            await ctx.send("No questions have been generated or served here since the cog loaded.")
+            return
+
+        def fmt(value, spec):
+            return "n/a" if value is None else format(value, spec)
+
+        lines = []
+        for key, cost in rows[:10]:
+            lines.append(
+                f"**{key[1]}** ({key[2]}): {cost.requests} requests, {cost.generated} generated, {cost.served} served\n"
+                f"↳ `{fmt(cost.tokens_per_served, '.0f')}` tokens/served | pool hits `{fmt(cost.pool_hit_ratio, '.0%')}` | "
+                f"surplus `{self.batch_tuner.surplus(key, settings.batch_surplus)}`"
+            )
+        emb = discord.Embed(
+            title="📦 Batching & Generation Cost",
+            description="\n".join(lines),
+            color=discord.Color.teal()
+        )
+        emb.set_footer(text=f"Configured surplus: {settings.batch_surplus} extra question(s) per request")
+        await ctx.send(embed=emb)
+
+    @boozyquizset.command()
+    async def streaming(self, ctx, toggle: bool):
+        """Toggle whether multi-round games start while later questions are still being generated."""
+        await self._set_guild_setting(ctx.guild, "stream_questions", toggle)
+        status = "enabled" if toggle else "disabled"
+        await ctx.send(f"Streaming question generation is now **{status}**.")
+
+    @boozyquizset.command()
+    async def hedging(self, ctx, toggle: bool):
+        """Toggle sending a backup OpenAI request when the first one is slower than usual (p95)."""
+        await self._set_guild_setting(ctx.guild, "hedge_requests", toggle)
+        status = "enabled" if toggle else "disabled"
+        await ctx.send(f"Hedged OpenAI requests are now **{status}**.")
+
+    @boozyquizset.command()
+    async def answermode(self, ctx, mode: str):
+        """Choose how players answer: `reactions` (emoji buttons) or `buttons` (A/B/C/D buttons, fewer API calls).
+        Typing A, B, C or D works in both modes.
+        """
+        mode = mode.lower()
+        if mode not in ("reactions", "buttons"):
+            await ctx.send("Answer mode must be `reactions` or `buttons`.")
+            return
+        await self._set_guild_setting(ctx.guild, "answer_mode", mode)
+        await ctx.send(f"Players now answer with **{mode}**.")
+
+    @boozyquizset.command()
+    async def offline(self, ctx, toggle: bool):
+        """Toggle building questions from the bundled fact tables (capitals, cocktails, ...) instead of OpenAI.
+        Stored questions are still served first. Fact questions are also the fallback when OpenAI is unavailable.
+        """
+        await self._set_guild_setting(ctx.guild, "offline_questions", toggle)
+        status = "enabled" if toggle else "disabled"
+        await ctx.send(f"Offline question generation is now **{status}**.")
+
+    @boozyquizset.command()
+    async def repeatwindow(self, ctx, days: int):
+        """Set for how many days questions similar to ones already played here are skipped (0 to disable)."""
+        if days < 0 or days > MAX_WINDOW_DAYS:
+            await ctx.send(f"Please choose a window between 0 and {MAX_WINDOW_DAYS} days.")
+            return
+        await self._set_guild_setting(ctx.guild, "repeat_window_days", days)
+        if days == 0:
+            await ctx.send("The repeat filter has been **disabled**.")
+        else:
+            await ctx.send(f"Questions similar to ones played in the last `{days}` days will be skipped.")
+
+    @boozyquizset.command(name="scheduler")
+    @commands.is_owner()
+    async def _scheduler(self, ctx, max_in_flight: int, requests_per_minute: int, tokens_per_minute: int):
+        """Set the bot-wide OpenAI limits: concurrent requests, requests per minute and tokens per minute."""
+        if max_in_flight < 1 or requests_per_minute < 1 or tokens_per_minute < 1000:
+            await ctx.send("Use at least 1 concurrent request, 1 request per minute and 1000 tokens per minute.")
+            return
+        await self.config.max_in_flight.set(max_in_flight)
+        await self.config.requests_per_minute.set(requests_per_minute)
+        await self.config.tokens_per_minute.set(tokens_per_minute)
+        self.metrics.inc("boozybank_config_writes_total", 3, op="global")
+        self.scheduler.configure(max_in_flight, requests_per_minute, tokens_per_minute)
+        await ctx.send(
+            f"OpenAI scheduler set to `{max_in_flight}` concurrent requests, "
+            f"`{requests_per_minute}` requests/min and `{tokens_per_minute}` tokens/min."
+        )
+
+    @boozyquizset.command(name="games")
+    async def _games(self, ctx):
+        """List the quizzes and games currently running in this server."""
+        sessions = self.engine.sessions(ctx.guild.id)
+        if not sessions:
+            await ctx.send("There are no active quizzes or games in this server.")
+            return
+
+        lines = []
+        for session in sessions:
+            channel = ctx.guild.get_channel(session.channel_id)
+            channel_str = channel.mention if channel else f"#{session.channel_id}"
+            leader = session.standings()[0] if session.scores else None
+            leader_str = f" | Leader: <@{leader[0]}> ({leader[1]} pts)" if leader else ""
+            lines.append(
+                f"{channel_str} — {session.kind.capitalize()} about **{session.topic}** ({session.difficulty}) | "
+                f"State: `{session.state}` | Round {session.round_index}/{session.rounds} | "
+                f"Players: {len(session.player_ids)}{leader_str}"
+            )
+        await ctx.send("\n".join(lines), allowed_mentions=discord.AllowedMentions.none())
+
+    @boozyquizset.command(name="metrics")
+    async def _metrics(self, ctx):
+        """Show where the time goes: OpenAI latency, parsing, lobbies, REST calls, Config access and cache hit rates.
+
+        The same numbers are written every minute to `metrics.prom` (Prometheus text format) in the cog data folder.
+        """
+        metrics = self.metrics
+        metrics.collect()
+
+        def summary(name, unit="s", fmt=".2f"):
+            lines = []
+            for key, histogram in sorted(metrics.histograms(name).items()):
+                label = ", ".join(v for _, v in key)
+                prefix = f"`{label}`: " if label else ""
+                lines.append(
+                    f"{prefix}{histogram.count}× | p50 ≤ `{histogram.quantile(0.5):{fmt}}{unit}` | "
+                    f"p95 ≤ `{histogram.quantile(0.95):{fmt}}{unit}` | max `{histogram.max:{fmt}}{unit}`"
+                )
+            return "\n".join(lines) or "No data yet"
+
+        def counts(name):
+            values = metrics.counters(name)
+            return ", ".join(f"{dict(key)['op']}: `{value}`" for key, value in sorted(values.items())) or "None"
+
+        def ratio(cache):
+            value = metrics.hit_ratio(cache)
+            return f"{cache}: `{value:.0%}`" if value is not None else f"{cache}: n/a"
+
+        emb = discord.Embed(title="📈 BoozyBank Metrics", color=discord.Color.purple())
+        emb.add_field(name="🧠 OpenAI Latency (per model)", value=summary("boozybank_openai_latency_seconds"), inline=False)
+        emb.add_field(name="🧪 Parse + Validate", value=summary("boozybank_parse_seconds", fmt=".4f"), inline=False)
+        emb.add_field(name="🎮 Lobby Duration", value=summary("boozybank_lobby_seconds"), inline=False)
+        emb.add_field(name="⏳ Time to First Question", value=summary("boozybank_first_question_seconds"), inline=False)
+        emb.add_field(name="📨 REST Calls per Round", value=summary("boozybank_round_rest_calls", "", ".0f"), inline=False)
+        emb.add_field(name="🌀 Event-Loop Lag", value=summary("boozybank_loop_lag_seconds", fmt=".3f"), inline=False)
+        emb.add_field(name="📬 Guess Handling Delay", value=summary("boozybank_answer_delay_seconds", fmt=".3f"), inline=False)
+        emb.add_field(name="📖 Config Reads", value=counts("boozybank_config_reads_total"), inline=False)
+        emb.add_field(name="✍️ Config Writes", value=counts("boozybank_config_writes_total"), inline=False)
+        emb.add_field(
+            name="🎯 Cache Hit Rates",
+            value=" | ".join(ratio(cache) for cache in ("settings", "leaderboard", "render", "pool")),
+            inline=False
+        )
+        totals = self.batch_tuner.totals()
+        per_served = f"`{totals.tokens_per_served:.0f}` tokens" if totals.tokens_per_served is not None else "n/a"
+        emb.add_field(
+            name="💸 Generation Cost",
+            value=f"{totals.requests} requests, {totals.generated} generated, {totals.served} served | {per_served} per served question",
+            inline=False
+        )
+        emb.add_field(name="♻️ Repeats Skipped", value=f"`{self.recent_questions.rejected}` questions", inline=False)
+        await ctx.send(embed=emb)
+
+    @boozyquizset.command()
+    async def fairness(self, ctx):
+        """Show how answer timing holds up: event-loop lag and what timing on Discord's clock corrected.
+
+        Answer speed is measured between the question's and the answer's Discord timestamps, so the bot's own
+        delays in handling a guess no longer count against the player.
+        """
+        stats = self.fairness.summary()
+        emb = discord.Embed(title="⚖️ Answer Timing Fairness", color=discord.Color.gold())
+        emb.add_field(
+            name="🌀 Event-Loop Lag (last ~2 min)",
+            value=(
+                f"now `{self.loop_lag.current * 1000:.0f}ms` | p50 `{self.loop_lag.percentile(0.5) * 1000:.0f}ms` | "
+                f"p95 `{self.loop_lag.percentile(0.95) * 1000:.0f}ms` | max `{self.loop_lag.percentile(1.0) * 1000:.0f}ms`"
+            ),
+            inline=False
+        )
+        if not stats["rounds"]:
+            emb.add_field(name="🎯 Recent Rounds", value="No rounds played since the cog loaded.", inline=False)
+        else:
+            emb.add_field(
+                name=f"🎯 Last {stats['rounds']} Rounds",
+                value=(
+                    f"`{stats['guesses']}` guesses, handled `{stats['median_delay'] * 1000:.0f}ms` after Discord got them "
+                    f"(median), worst `{stats['max_delay'] * 1000:.0f}ms`\n"
+                    f"Winning times corrected by `{stats['mean_correction']:.2f}s` on average\n"
+                    f"Correct answers beaten by a later one: `{stats['inversions']}`\n"
+                    f"Worst loop lag during a round: `{stats['max_loop_lag'] * 1000:.0f}ms`"
+                ),
+                inline=False
+            )
+        await ctx.send(embed=emb)
+
     @boozyquizset.group(name="endreward")
     async def _endreward(self, ctx):
         """Configure the end-game rewards based on game difficulty."""
@@ -1595,7 +2118,7 @@ class BoozyBank(commands.Cog):
         if amount < 0:
             await ctx.send("Reward cannot be negative.")
             return
-        await self.config.guild(ctx.guild).easy_endreward.set(amount)
+        await self._set_guild_setting(ctx.guild, "easy_endreward", amount)
         await ctx.send(f"Easy game winner reward set to `{amount}` coins.")
 
     @_endreward.command(name="medium")
@@ -1604,7 +2127,7 @@ class BoozyBank(commands.Cog):
         if amount < 0:
             await ctx.send("Reward cannot be negative.")
             return
-        await self.config.guild(ctx.guild).medium_endreward.set(amount)
+        await self._set_guild_setting(ctx.guild, "medium_endreward", amount)
         await ctx.send(f"Medium game winner reward set to `{amount}` coins.")
 
     @_endreward.command(name="hard")
@@ -1613,7 +2136,7 @@ class BoozyBank(commands.Cog):
         if amount < 0:
             await ctx.send("Reward cannot be negative.")
             return
-        await self.config.guild(ctx.guild).hard_endreward.set(amount)
+        await self._set_guild_setting(ctx.guild, "hard_endreward", amount)
         await ctx.send(f"Hard game winner reward set to `{amount}` coins.")
 
     @boozyquizset.group(name="topics")
@@ -1625,6 +2148,9 @@ class BoozyBank(commands.Cog):
     async def add_topic(self, ctx, *, topic: str):
         """Add a new topic to the default list."""
         topic = topic.strip()
+        # The transaction reads the list and writes it back on exit, early return included
+        self.metrics.inc("boozybank_config_reads_total", op="settings")
+        self.metrics.inc("boozybank_config_writes_total", op="settings")
         async with self.config.guild(ctx.guild).default_topics() as topics:
             if topic in topics:
                 await ctx.send("This topic is already in the list.")
@@ -1636,6 +2162,8 @@ class BoozyBank(commands.Cog):
     async def remove_topic(self, ctx, *, topic: str):
         """Remove a topic from the default list."""
         topic = topic.strip()
+        self.metrics.inc("boozybank_config_reads_total", op="settings")
+        self.metrics.inc("boozybank_config_writes_total", op="settings")
         async with self.config.guild(ctx.guild).default_topics() as topics:
             if topic not in topics:
                 await ctx.send("This topic is not in the list.")
@@ -1647,6 +2175,7 @@ class BoozyBank(commands.Cog):
     async def list_topics(self, ctx):
         """Show all configured default topics."""
         topics = await self.config.guild(ctx.guild).default_topics()
+        self.metrics.inc("boozybank_config_reads_total", op="settings")
         if not topics:
             await ctx.send("No default topics have been configured.")
             return
@@ -1656,22 +2185,27 @@ class BoozyBank(commands.Cog):
     @boozyquizset.command()
     async def settings(self, ctx):
         """View the current BoozyBank Quiz settings."""
-        config_guild = self.config.guild(ctx.guild)
-        quiz = await config_guild.quiz_reward()
-        timeout = await config_guild.timeout()
-        model = await config_guild.model()
-        second_guess = await config_guild.allow_second_guess()
-        show_explanation = await config_guild.show_explanation()
-        topics = await config_guild.default_topics()
-        max_payout = await config_guild.max_game_payout()
-        easy_end = await config_guild.easy_endreward()
-        med_end = await config_guild.medium_endreward()
-        hard_end = await config_guild.hard_endreward()
-        cleanup = await config_guild.cleanup_messages()
-        final_delay = await config_guild.final_cleanup_delay()
-        daily_lim = await config_guild.daily_limit()
-        min_play = await config_guild.min_players()
-        reading_time = await config_guild.reading_time()
+        settings = await self._get_settings(ctx.guild)
+        quiz = settings.quiz_reward
+        timeout = settings.timeout
+        model = settings.model
+        second_guess = settings.allow_second_guess
+        show_explanation = settings.show_explanation
+        topics = settings.default_topics
+        max_payout = settings.max_game_payout
+        easy_end = settings.easy_endreward
+        med_end = settings.medium_endreward
+        hard_end = settings.hard_endreward
+        cleanup = settings.cleanup_messages
+        final_delay = settings.final_cleanup_delay
+        daily_lim = settings.daily_limit
+        min_play = settings.min_players
+        reading_time = settings.reading_time
+        pool_low_water = settings.pool_low_water
+        banked_questions = await self.question_bank.count()
+        stream_questions = settings.stream_questions
+        breaker = self._breakers[ctx.guild.id]
+        http_stats = self.http_stats
 
         currency_name = await bank.get_currency_name(ctx.guild)
 
@@ -1693,6 +2227,29 @@ class BoozyBank(commands.Cog):
         emb.add_field(name="📅 Daily limit", value=f"`{daily_lim}` starts" if daily_lim > 0 else "Disabled", inline=True)
         emb.add_field(name="👥 Min Lobby Players", value=f"`{min_play}` players", inline=True)
         emb.add_field(name="📝 Default Topics", value=f"`{len(topics)}` topics", inline=True)
+        emb.add_field(name="📦 Pool Low-Water", value=f"`{pool_low_water}` questions" if pool_low_water > 0 else "Disabled", inline=True)
+        emb.add_field(name="➕ Batch Surplus", value=f"`{settings.batch_surplus}` questions" if settings.batch_surplus > 0 else "Disabled", inline=True)
+        emb.add_field(name="📚 Question Bank", value=f"`{banked_questions}` questions", inline=True)
+        emb.add_field(name="🔘 Answer Mode", value=settings.answer_mode.capitalize(), inline=True)
+        emb.add_field(name="📡 Streaming Generation", value="Enabled" if stream_questions else "Disabled", inline=True)
+        emb.add_field(name="🪃 Hedged Requests", value="Enabled" if settings.hedge_requests else "Disabled", inline=True)
+        emb.add_field(name="🗂️ Offline Questions", value="Enabled" if settings.offline_questions else "Disabled", inline=True)
+        emb.add_field(
+            name="♻️ Repeat Window",
+            value=f"`{settings.repeat_window_days}` days" if settings.repeat_window_days > 0 else "Disabled",
+            inline=True
+        )
+        emb.add_field(name="🚦 OpenAI Circuit", value="Open (using stored questions)" if breaker.is_open else "Closed", inline=True)
+        emb.add_field(
+            name="🧮 OpenAI Scheduler",
+            value=f"{self.scheduler.in_flight}/{self.scheduler.max_in_flight} in flight, {self.scheduler.queued} queued",
+            inline=True,
+        )
+        emb.add_field(
+            name="🔌 OpenAI Connections",
+            value=f"`{http_stats.new}` new / `{http_stats.reused}` reused ({http_stats.reuse_ratio:.0%} reuse)",
+            inline=True
+        )
 
         await ctx.send(embed=emb)
 
@@ -1703,8 +2260,12 @@ class BoozyBank(commands.Cog):
         if not member:
             member = ctx.author
 
-        wins = await self.config.member(member).wins()
-        earnings = await self.config.member(member).earnings()
+        board = await self._get_leaderboard(ctx.guild)
+        wins, earnings = board.stats.get(member.id, (0, 0))
+        if wins == 0:
+            # Members without wins are not ranked, but may still have earnings on record
+            earnings = await self.config.member(member).earnings()
+            self.metrics.inc("boozybank_config_reads_total", op="stats")
         currency_name = await bank.get_currency_name(ctx.guild)
 
         emb = discord.Embed(
@@ -1716,40 +2277,54 @@ class BoozyBank(commands.Cog):
         emb.add_field(name="🏆 Total Wins", value=f"`{wins}` quiz rounds won", inline=False)
         emb.add_field(name="💰 Total Earned", value=f"`{earnings}` {currency_name}", inline=False)
 
+        wins_rank = board.rank("wins", member.id)
+        if wins_rank:
+            earnings_rank = board.rank("earnings", member.id)
+            emb.add_field(
+                name="🏅 Leaderboard Rank",
+                value=f"`#{wins_rank}` by wins | `#{earnings_rank}` by earnings (of {len(board)} players)",
+                inline=False
+            )
+
         await ctx.send(embed=emb)
 
     @commands.command()
     @commands.guild_only()
-    async def boozyquizleaderboard(self, ctx):
-        """View the quiz leaderboard for this server."""
-        all_members = await self.config.all_members(ctx.guild)
-        if not all_members:
-            await ctx.send("Nobody has won a quiz in this server yet!")
-            return
+    async def boozyquizleaderboard(self, ctx, sort_by: str = "wins", page: int = 1):
+        """View the quiz leaderboard for this server.
 
-        leaderboard_data = []
-        for member_id, data in all_members.items():
-            wins = data.get("wins", 0)
-            earnings = data.get("earnings", 0)
-            if wins > 0:
-                leaderboard_data.append((member_id, wins, earnings))
+        Sort by `wins` (default) or `earnings`, and pick a page of 10 players.
 
-        if not leaderboard_data:
+        Examples:
+        `[p]boozyquizleaderboard`
+        `[p]boozyquizleaderboard earnings 2`
+        """
+        sort_by = sort_by.lower()
+        if sort_by not in SORT_KEYS:
+            await ctx.send("❌ You can sort the leaderboard by `wins` or `earnings`.")
+            return
+
+        board = await self._get_leaderboard(ctx.guild)
+        if not len(board):
             await ctx.send("Nobody has won a quiz in this server yet!")
             return
 
-        leaderboard_data.sort(key=lambda x: x[1], reverse=True)
+        total_pages = (len(board) + 9) // 10
+        if page < 1 or page > total_pages:
+            await ctx.send(f"❌ Choose a page between 1 and {total_pages}.")
+            return
 
         currency_name = await bank.get_currency_name(ctx.guild)
 
         emb = discord.Embed(
             title="🏆 BoozyQuiz Top Players Leaderboard 🏆",
             color=discord.Color.gold(),
-            description="The players with the most quiz round wins in this server!\n"
+            description="The players with the most quiz round wins in this server!\n" if sort_by == "wins"
+                        else f"The players who earned the most {currency_name} in this server!\n"
         )
 
         leaderboard_text = ""
-        for index, (member_id, wins, earnings) in enumerate(leaderboard_data[:10], start=1):
+        for index, member_id, wins, earnings in board.page(sort_by, page):
             member = ctx.guild.get_member(member_id)
             name = member.display_name if member else f"Former Member ({member_id})"
 
@@ -1766,4 +2341,5 @@ class BoozyBank(commands.Cog):
             leaderboard_text += f"{medal}**{name}** - `{wins}` wins (`{earnings}` {currency_name})\n"
 
         emb.description = f"{emb.description}\n{leaderboard_text}"
+        emb.set_footer(text=f"Page {page} of {total_pages} | {len(board)} ranked players")
         await ctx.send(embed=emb)
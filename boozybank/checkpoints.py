@@ -0,0 +1,68 @@
+# checkpoints.py — On-disk game checkpoints
+# A running game writes its session (questions, round, scores, speeds) to one
+# small compact JSON file per channel after every round. The write goes to a
+# temporary file first and is then swapped in, so a crash never leaves half a
+# checkpoint behind. On load, the cog resumes every game that still has one.
+
+import asyncio
+import json
+import logging
+import os
+import time
+
+from .generation import loads
+
+log = logging.getLogger("red.boozybank")
+
+# Checkpoints older than this are dropped instead of resumed
+MAX_AGE = 3600
+
+
+class CheckpointStore:
+    """One `<channel_id>.json` checkpoint per running game."""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, channel_id: int):
+        return self.directory / f"{channel_id}.json"
+
+    def _write(self, channel_id: int, data: dict):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(channel_id)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, separators=(",", ":"), ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+
+    async def save(self, data: dict):
+        """Writes a session's `to_dict()` snapshot, replacing the previous one for that channel."""
+        data["saved_at"] = time.time()
+        await asyncio.to_thread(self._write, data["channel_id"], data)
+
+    def remove(self, channel_id: int):
+        try:
+            self._path(channel_id).unlink()
+        except FileNotFoundError:
+            pass
+
+    def load_all(self) -> list:
+        """Returns the snapshots that are recent enough to resume, and deletes the rest."""
+        if not self.directory.exists():
+            return []
+        snapshots = []
+        for path in self.directory.glob("*.json"):
+            try:
+                data = loads(path.read_bytes())
+            except (OSError, ValueError) as e:
+                log.error(f"Could not read game checkpoint {path.name}: {e}")
+                path.unlink(missing_ok=True)
+                continue
+            if not isinstance(data, dict) or not isinstance(data.get("saved_at"), (int, float)):
+                log.error(f"Game checkpoint {path.name} is not a saved game, deleting it")
+                path.unlink(missing_ok=True)
+                continue
+            if time.time() - data["saved_at"] > MAX_AGE:
+                path.unlink(missing_ok=True)
+                continue
+            snapshots.append(data)
+        return snapshots
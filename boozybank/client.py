@@ -0,0 +1,43 @@
+# client.py — Long-lived HTTP client for the OpenAI API
+# One session per cog load so the TLS connection to api.openai.com is kept
+# alive and reused between generations instead of re-handshaking each time.
+
+import aiohttp
+
+
+class ConnectionStats:
+    """Counts how often a request got a fresh connection versus a reused keep-alive one."""
+
+    def __init__(self):
+        self.new = 0
+        self.reused = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        total = self.new + self.reused
+        return self.reused / total if total else 0.0
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+
+        async def on_create(session, ctx, params):
+            self.new += 1
+
+        async def on_reuse(session, ctx, params):
+            self.reused += 1
+
+        trace.on_connection_create_end.append(on_create)
+        trace.on_connection_reuseconn.append(on_reuse)
+        return trace
+
+
+def create_session(stats: ConnectionStats) -> aiohttp.ClientSession:
+    """Builds the cog-owned session with a keep-alive connector tuned for a single API host."""
+    connector = aiohttp.TCPConnector(
+        limit=20,
+        limit_per_host=10,
+        ttl_dns_cache=300,
+        keepalive_timeout=60,
+        enable_cleanup_closed=True,
+    )
+    return aiohttp.ClientSession(connector=connector, trace_configs=[stats.trace_config()])
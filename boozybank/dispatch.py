@@ -0,0 +1,105 @@
+# dispatch.py — Per-channel answer routing
+# The cog listens to on_message / on_reaction_add (and answer button clicks)
+# once and hands each valid guess to the open round of that channel (or
+# question message) through a queue, so a round never has to register its own
+# wait_for listeners. Each guess carries the time Discord received it (see
+# timing.py), so its speed does not depend on when the round gets to it.
+
+import asyncio
+
+from .timing import DiscordClock, now_ms, snowflake_ms
+
+ANSWER_LETTERS = frozenset({"A", "B", "C", "D"})
+EMOJI_TO_LETTER = {"🇦": "A", "🇧": "B", "🇨": "C", "🇩": "D"}
+
+
+class AnswerRound:
+    """Collects the guesses of one open question."""
+
+    def __init__(self, channel_id: int, player_ids: set, allow_second_guess: bool, correct_answer: str = None):
+        self.channel_id = channel_id
+        self.player_ids = player_ids
+        self.allow_second_guess = allow_second_guess
+        self.correct_answer = correct_answer
+        self.solved = False  # Set once the winning guess is queued (only known when correct_answer is given)
+        self.winning_sent_at = None
+        self.inversions = 0  # correct guesses turned away although Discord got them before the winning one
+        self.message_ids = set()
+        self.answered = set()
+        self.queue = asyncio.Queue()
+
+    def offer(self, user, letter: str, message=None, reaction=None, sent_at: int = None) -> bool:
+        """Queues a guess if this player is allowed to make it. `sent_at` is Discord's time of the guess in ms."""
+        if user.bot or user.id not in self.player_ids:
+            return False
+        if self.solved:
+            if letter == self.correct_answer and None not in (sent_at, self.winning_sent_at) and sent_at < self.winning_sent_at:
+                self.inversions += 1
+            return False
+        if not self.allow_second_guess and user.id in self.answered:
+            return False
+        self.answered.add(user.id)
+        if letter == self.correct_answer:
+            self.solved = True
+            self.winning_sent_at = sent_at
+        self.queue.put_nowait((user, letter, message, reaction, sent_at))
+        return True
+
+    async def next_answer(self, timeout: float):
+        """Waits for the next guess as (user, letter, message, reaction, sent_at), or None on timeout."""
+        if timeout <= 0:
+            return None
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class AnswerRouter:
+    """Routes incoming messages and reactions to the open round in O(1) per event."""
+
+    def __init__(self):
+        self._by_channel = {}  # {channel_id: AnswerRound}
+        self._by_message = {}  # {question_message_id: AnswerRound}
+        self.clock = DiscordClock()  # fed by every guild message, used to time reactions
+
+    def open(self, channel_id: int, player_ids: set, allow_second_guess: bool, message_id: int = None, correct_answer: str = None) -> AnswerRound:
+        answer_round = AnswerRound(channel_id, set(player_ids), allow_second_guess, correct_answer)
+        self._by_channel[channel_id] = answer_round
+        if message_id is not None:
+            self.watch(answer_round, message_id)
+        return answer_round
+
+    def watch(self, answer_round: AnswerRound, message_id: int):
+        """Also accept reaction answers on this message."""
+        answer_round.message_ids.add(message_id)
+        self._by_message[message_id] = answer_round
+
+    def round_for_message(self, message_id: int):
+        return self._by_message.get(message_id)
+
+    def close(self, answer_round: AnswerRound):
+        if self._by_channel.get(answer_round.channel_id) is answer_round:
+            del self._by_channel[answer_round.channel_id]
+        for message_id in answer_round.message_ids:
+            if self._by_message.get(message_id) is answer_round:
+                del self._by_message[message_id]
+
+    def route_message(self, message) -> bool:
+        self.clock.observe(message.id, now_ms())
+        answer_round = self._by_channel.get(message.channel.id)
+        if answer_round is None:
+            return False
+        letter = message.content.strip().upper()
+        if letter not in ANSWER_LETTERS:
+            return False
+        return answer_round.offer(message.author, letter, message=message, sent_at=snowflake_ms(message.id))
+
+    def route_reaction(self, reaction, user) -> bool:
+        answer_round = self._by_message.get(reaction.message.id)
+        if answer_round is None:
+            return False
+        letter = EMOJI_TO_LETTER.get(str(reaction.emoji))
+        if letter is None:
+            return False
+        return answer_round.offer(user, letter, reaction=reaction, sent_at=self.clock.to_discord_ms(now_ms()))
@@ -0,0 +1,236 @@
+# engine.py — Game sessions and the engine that runs them
+# Every quick quiz or multi-round game is a GameSession: a small state machine
+# holding the players, scores and questions of one channel (by ID, so it can be
+# saved and restored). The GameEngine runs each session as its own task, so
+# many channels can play at once, and lets commands inspect, pause, resume or
+# stop a game. Stopping sets a flag that the game notices at its next wait,
+# instead of cancelling the task in the middle of a Discord call. With a
+# CheckpointStore attached, sessions are saved as they go and their checkpoint
+# is removed when they end, unless the engine is only suspended for a reload.
+
+import asyncio
+import logging
+import time
+
+log = logging.getLogger("red.boozybank")
+
+LOBBY = "lobby"
+LOADING = "loading"
+PLAYING = "playing"
+PAUSED = "paused"
+TIEBREAK = "tiebreak"
+FINISHED = "finished"
+STOPPED = "stopped"
+
+
+class GameStopped(Exception):
+    """Raised inside a game once its session has been stopped."""
+
+
+class GameSession:
+    """State of one quiz or game in one channel."""
+
+    __slots__ = (
+        "kind", "guild_id", "channel_id", "host_id", "topic", "difficulty", "rounds",
+        "state", "round_index", "player_ids", "scores", "wins", "speeds", "multipliers",
+        "questions", "created_at", "task", "_stop", "_resumed", "_paused_from",
+    )
+
+    def __init__(self, kind: str, guild_id: int, channel_id: int, host_id: int, topic: str, difficulty: str, rounds: int):
+        self.kind = kind  # "quiz" or "game"
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+        self.host_id = host_id
+        self.topic = topic
+        self.difficulty = difficulty
+        self.rounds = rounds
+        self.state = LOBBY
+        self.round_index = 0  # rounds completed so far
+        self.player_ids = []
+        self.scores = {}  # {member_id: points}
+        self.wins = {}  # {member_id: rounds won}
+        self.speeds = {}  # {member_id: [seconds, ...]}
+        self.multipliers = {}  # {member_id: [multiplier, ...]}
+        self.questions = []  # questions drawn for this game, in round order
+        self.created_at = time.time()
+        self.task = None
+        self._stop = asyncio.Event()
+        self._resumed = asyncio.Event()
+        self._resumed.set()
+        self._paused_from = None
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop.is_set()
+
+    def record_win(self, member_id: int, elapsed: float, multiplier: float) -> int:
+        """Adds a round win to the scoreboard and returns the points awarded."""
+        points = int(100 * multiplier)
+        self.scores[member_id] = self.scores.get(member_id, 0) + points
+        self.wins[member_id] = self.wins.get(member_id, 0) + 1
+        self.speeds.setdefault(member_id, []).append(elapsed)
+        self.multipliers.setdefault(member_id, []).append(multiplier)
+        return points
+
+    def standings(self) -> list:
+        """Returns [(member_id, points), ...] sorted from first to last."""
+        return sorted(self.scores.items(), key=lambda item: item[1], reverse=True)
+
+    def pause(self) -> bool:
+        """Pauses a multi-round game at its next checkpoint. A quick quiz is a single round, so it can't pause."""
+        if self.kind != "game" or self.state not in (PLAYING, TIEBREAK):
+            return False
+        self._paused_from = self.state
+        self.state = PAUSED
+        self._resumed.clear()
+        return True
+
+    def resume(self) -> bool:
+        if self.state != PAUSED:
+            return False
+        self.state = self._paused_from
+        self._resumed.set()
+        return True
+
+    def enter(self, state: str):
+        """Moves the game on to `state`. A paused game stays paused and resumes into it."""
+        if self.state == PAUSED:
+            self._paused_from = state
+        else:
+            self.state = state
+
+    def stop(self):
+        self.state = STOPPED
+        self._stop.set()
+        self._resumed.set()
+
+    async def guard(self, awaitable):
+        """Awaits `awaitable`, or raises GameStopped as soon as the session is stopped."""
+        task = asyncio.ensure_future(awaitable)
+        if self.stopped:
+            task.cancel()
+            raise GameStopped()
+        stopper = asyncio.ensure_future(self._stop.wait())
+        try:
+            await asyncio.wait({task, stopper}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            stopper.cancel()
+        if not task.done():
+            task.cancel()
+            raise GameStopped()
+        return task.result()
+
+    async def sleep(self, seconds: float):
+        """Sleeps, but wakes up (and raises GameStopped) if the session is stopped."""
+        await self.guard(asyncio.sleep(seconds))
+
+    async def checkpoint(self):
+        """Waits while the game is paused. Raises GameStopped if it was stopped."""
+        if not self._resumed.is_set():
+            await self._resumed.wait()
+        if self.stopped:
+            raise GameStopped()
+
+    def to_dict(self) -> dict:
+        return {
+            "kind": self.kind,
+            "guild_id": self.guild_id,
+            "channel_id": self.channel_id,
+            "host_id": self.host_id,
+            "topic": self.topic,
+            "difficulty": self.difficulty,
+            "rounds": self.rounds,
+            "state": self._paused_from if self.state == PAUSED else self.state,
+            "round_index": self.round_index,
+            "player_ids": list(self.player_ids),
+            "scores": [[member_id, points] for member_id, points in self.scores.items()],
+            "wins": [[member_id, wins] for member_id, wins in self.wins.items()],
+            "speeds": [[member_id, speeds] for member_id, speeds in self.speeds.items()],
+            "multipliers": [[member_id, mults] for member_id, mults in self.multipliers.items()],
+            "questions": self.questions,
+            "created_at": self.created_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GameSession":
+        session = cls(
+            data["kind"], data["guild_id"], data["channel_id"], data["host_id"],
+            data["topic"], data["difficulty"], data["rounds"],
+        )
+        session.state = data["state"]
+        session.round_index = data["round_index"]
+        session.player_ids = list(data["player_ids"])
+        session.scores = {int(k): v for k, v in data["scores"]}
+        session.wins = {int(k): v for k, v in data["wins"]}
+        session.speeds = {int(k): list(v) for k, v in data["speeds"]}
+        session.multipliers = {int(k): list(v) for k, v in data["multipliers"]}
+        session.questions = list(data["questions"])
+        session.created_at = data["created_at"]
+        return session
+
+
+class GameEngine:
+    """Owns the active sessions, one per channel, and the tasks that run them."""
+
+    def __init__(self, store=None):
+        self.store = store
+        self._sessions = {}  # {channel_id: GameSession}
+        self._suspended = False
+
+    def __contains__(self, channel_id: int) -> bool:
+        return channel_id in self._sessions
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def get(self, channel_id: int):
+        return self._sessions.get(channel_id)
+
+    def sessions(self, guild_id: int = None) -> list:
+        return [s for s in self._sessions.values() if guild_id is None or s.guild_id == guild_id]
+
+    def open(self, session: GameSession) -> bool:
+        """Reserves the session's channel. Returns False if a game is already active there."""
+        if session.channel_id in self._sessions:
+            return False
+        self._sessions[session.channel_id] = session
+        return True
+
+    def launch(self, session: GameSession, coro) -> asyncio.Task:
+        """Runs `coro` (the game itself) as the session's task. The channel is released when it ends."""
+        session.task = asyncio.create_task(self._run(session, coro))
+        return session.task
+
+    async def save(self, session: GameSession):
+        """Checkpoints the session, if a store is attached. A failed write never interrupts the game."""
+        if self.store is None or self._suspended or self._sessions.get(session.channel_id) is not session:
+            return
+        try:
+            await self.store.save(session.to_dict())
+        except Exception as e:
+            log.error(f"Could not checkpoint the game in channel {session.channel_id}: {e}")
+
+    def close(self, session: GameSession):
+        if session.state != STOPPED:
+            session.state = FINISHED
+        if self._sessions.get(session.channel_id) is session:
+            del self._sessions[session.channel_id]
+            if self.store is not None and not self._suspended:
+                self.store.remove(session.channel_id)
+
+    def suspend(self):
+        """Stops every session but keeps their checkpoints, so they resume after a reload."""
+        self._suspended = True
+        for session in list(self._sessions.values()):
+            session.stop()
+
+    async def _run(self, session: GameSession, coro):
+        try:
+            await self.save(session)
+            await coro
+        except GameStopped:
+            pass
+        except Exception as e:
+            log.error(f"Game in channel {session.channel_id} crashed: {e}", exc_info=True)
+        finally:
+            self.close(session)
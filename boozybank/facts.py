@@ -0,0 +1,139 @@
+# facts.py — Offline question generator built on fact tables
+# The cog ships structured fact tables (data/facts.json: country -> capital,
+# cocktail -> base spirit, ...). A question is a template filled in with one
+# row, and the three wrong choices are sampled from the other rows of the
+# same table. Everything is precomputed when the tables load, so generating
+# a question is a few random picks and thousands fit in a second. Used when
+# OpenAI is not configured, failing, or switched off for a guild.
+
+import json
+import random
+from pathlib import Path
+
+from .generation import LETTERS
+from .pool import normalize_topic
+from .storage import quiz_fingerprint
+
+DEFAULT_PATH = Path(__file__).parent / "data" / "facts.json"
+
+# Row tiers (lowest, highest) each difficulty draws from. Hard questions also take distractors from the same group
+DIFFICULTY_TIERS = {"easy": (1, 1), "medium": (1, 2), "hard": (2, 3)}
+
+# Topics that mean "anything goes"
+GENERAL_TOPICS = frozenset({"general", "general knowledge", "trivia", "random", "anything", "mixed"})
+
+
+class FactTable:
+    """One fact table with its question templates and precomputed lookups."""
+
+    def __init__(self, data: dict):
+        self.name = data["name"]
+        self.topics = frozenset(data["topics"])
+        self.templates = [(t["ask"], t["answer"]) for t in data["templates"]]
+        self.explanation = data["explanation"]
+        self.rows = [tuple(row) for row in data["rows"]]  # (key, value, tier, group)
+
+        self._values = sorted({row[1] for row in self.rows})
+        self._group_rows = {}
+        for row in self.rows:
+            self._group_rows.setdefault(row[3], []).append(row)
+        self._tier_rows = {
+            difficulty: [row for row in self.rows if low <= row[2] <= high] or self.rows
+            for difficulty, (low, high) in DIFFICULTY_TIERS.items()
+        }
+
+    def matches(self, words: set) -> bool:
+        return not self.topics.isdisjoint(words)
+
+    def _distractors(self, row: tuple, answer_field: str, same_group: bool) -> list:
+        """Three distinct wrong answers. For a reverse question (answer is the key), a row that
+        shares the correct row's value would also be right, so those are skipped.
+        """
+        if answer_field == "value":
+            pools = ([r[1] for r in self._group_rows[row[3]]], self._values) if same_group else (self._values,)
+            correct = row[1]
+            wrong = set()
+            for pool in pools:
+                for _ in range(len(pool) * 2):
+                    if len(wrong) == 3:
+                        return list(wrong)
+                    choice = random.choice(pool)
+                    if choice != correct:
+                        wrong.add(choice)
+        else:
+            pools = (self._group_rows[row[3]], self.rows) if same_group else (self.rows,)
+            wrong = set()
+            for pool in pools:
+                for _ in range(len(pool) * 2):
+                    if len(wrong) == 3:
+                        return list(wrong)
+                    choice = random.choice(pool)
+                    if choice[1] != row[1]:
+                        wrong.add(choice[0])
+        return list(wrong) if len(wrong) == 3 else None
+
+    def question(self, difficulty: str) -> dict:
+        """Builds one random question, or returns None if the sampled row has too few distractors."""
+        row = random.choice(self._tier_rows.get(difficulty, self.rows))
+        ask, answer_field = random.choice(self.templates)
+        distractors = self._distractors(row, answer_field, same_group=difficulty == "hard")
+        if distractors is None:
+            return None
+
+        key, value = row[0], row[1]
+        correct = value if answer_field == "value" else key
+        choices = distractors + [correct]
+        random.shuffle(choices)
+        return {
+            "question": ask.format(key=key, value=value),
+            "options": dict(zip(LETTERS, choices)),
+            "correct_answer": LETTERS[choices.index(correct)],
+            "explanation": self.explanation.format(key=key, value=value),
+        }
+
+
+class FactGenerator:
+    """Generates multiple-choice questions from the bundled fact tables, without any API."""
+
+    def __init__(self, tables: list):
+        self.tables = tables
+
+    @classmethod
+    def load(cls, path=DEFAULT_PATH) -> "FactGenerator":
+        with open(path, encoding="utf-8") as fp:
+            data = json.load(fp)
+        return cls([FactTable(table) for table in data["tables"]])
+
+    def _matching(self, topic: str) -> list:
+        normalized = normalize_topic(topic)
+        if normalized in GENERAL_TOPICS:
+            return self.tables
+        words = {word.rstrip("s") for word in normalized.split()} | set(normalized.split())
+        return [table for table in self.tables if table.matches(words)]
+
+    def covers(self, topic: str) -> bool:
+        """Whether a table matches the topic, or the topic is general. Otherwise questions are general trivia."""
+        return bool(self._matching(topic))
+
+    def tables_for(self, topic: str) -> list:
+        """Tables whose keywords appear in the topic. Unrelated topics use every table, see `covers`."""
+        return self._matching(topic) or self.tables
+
+    def generate(self, topic: str, difficulty: str, count: int, exclude=()) -> list:
+        """Returns up to `count` distinct questions whose fingerprints are not in `exclude`."""
+        tables = self.tables_for(topic)
+        difficulty = difficulty.lower()
+        seen = set(exclude)
+        questions = []
+        for _ in range(count * 20):
+            if len(questions) >= count:
+                break
+            quiz = random.choice(tables).question(difficulty)
+            if quiz is None:
+                continue
+            fingerprint = quiz_fingerprint(quiz)
+            if fingerprint in seen:
+                continue
+            seen.add(fingerprint)
+            questions.append(quiz)
+        return questions
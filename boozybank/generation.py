@@ -0,0 +1,114 @@
+# generation.py — Validation pipeline for generated questions
+# Every question the model writes, whether it arrives in a JSON batch or one
+# by one from a stream, goes through the same stages:
+#   fetch (cog) -> parse -> validate -> normalize -> shuffle -> store (cog)
+# The pure stages live here. Stages are plain functions that take and return a
+# question dict, so extra checks can be plugged into a QuestionPipeline.
+# JSON is decoded with orjson when it is installed.
+
+import json
+import logging
+import random
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger("red.boozybank")
+
+LETTERS = ("A", "B", "C", "D")
+
+# Precompiled schema: every field a question needs, with its expected type
+QUESTION_SCHEMA = (
+    ("question", str),
+    ("options", dict),
+    ("correct_answer", str),
+    ("explanation", str),
+)
+
+
+def loads(text):
+    """Decodes JSON (str or bytes), using orjson when available. Raises ValueError on invalid input."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+class QuestionError(ValueError):
+    """A generated question (or batch) does not match the expected format."""
+
+
+def validate(quiz) -> dict:
+    """Checks the question against QUESTION_SCHEMA."""
+    if not isinstance(quiz, dict):
+        raise QuestionError("Question is not a JSON object.")
+    for key, kind in QUESTION_SCHEMA:
+        if not isinstance(quiz.get(key), kind):
+            raise QuestionError(f"Missing or invalid key '{key}'.")
+    if len(quiz["options"]) != 4:
+        raise QuestionError("Options are not exactly 4 choices (A, B, C, D).")
+    return quiz
+
+
+def normalize(quiz: dict) -> dict:
+    """Uppercases option letters, trims text and keeps only the known fields."""
+    options = {str(letter).strip().upper(): str(text).strip() for letter, text in quiz["options"].items()}
+    missing = [letter for letter in LETTERS if letter not in options]
+    if missing:
+        raise QuestionError(f"Missing option '{missing[0]}' in the options.")
+
+    answer = quiz["correct_answer"].strip().upper()
+    if answer not in LETTERS:
+        raise QuestionError(f"Correct answer '{answer}' is not A, B, C, or D.")
+
+    return {
+        "question": quiz["question"].strip(),
+        "options": {letter: options[letter] for letter in LETTERS},
+        "correct_answer": answer,
+        "explanation": quiz["explanation"].strip(),
+    }
+
+
+def shuffle(quiz: dict) -> dict:
+    """Randomly shuffles the choices so the correct letter is never predictable."""
+    correct_text = quiz["options"][quiz["correct_answer"]]
+    choices = list(quiz["options"].values())
+    random.shuffle(choices)
+    quiz["options"] = dict(zip(LETTERS, choices))
+    quiz["correct_answer"] = LETTERS[choices.index(correct_text)]
+    return quiz
+
+
+class QuestionPipeline:
+    """Parses model output and runs each question through the validation stages."""
+
+    def __init__(self, stages=(validate, normalize, shuffle)):
+        self.stages = list(stages)
+
+    def process(self, quiz) -> dict:
+        """Runs one raw question through every stage. Raises QuestionError if it is rejected."""
+        for stage in self.stages:
+            quiz = stage(quiz)
+        return quiz
+
+    def parse_batch(self, content) -> list:
+        """Parses a `{"questions": [...]}` completion into its raw question objects."""
+        try:
+            data = loads(content)
+        except ValueError as e:
+            raise QuestionError(f"Could not parse the OpenAI response. Error: {e}")
+        questions = data.get("questions") if isinstance(data, dict) else None
+        if not isinstance(questions, list):
+            raise QuestionError("Missing or invalid 'questions' array in OpenAI response.")
+        return questions
+
+    def run_batch(self, content) -> list:
+        """Returns the valid questions of a batch completion. Invalid ones are skipped, not fatal."""
+        accepted = []
+        for index, raw in enumerate(self.parse_batch(content)):
+            try:
+                accepted.append(self.process(raw))
+            except QuestionError as e:
+                log.warning(f"Skipping invalid generated question #{index + 1}: {e}")
+        return accepted
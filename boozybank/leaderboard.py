@@ -0,0 +1,97 @@
+# leaderboard.py — Incrementally maintained leaderboard per guild
+# Each guild keeps its winners in two sorted key lists (by wins and by
+# earnings). The lists are built once from Config and then updated whenever
+# stats are committed, so a page or a rank is a slice or a bisect. An update
+# finds its spot by bisect but still shifts the list behind it, which is O(n)
+# memmove; that is cheap for the few thousand winners a guild has.
+
+from bisect import bisect_left, insort
+
+SORT_KEYS = ("wins", "earnings")
+
+
+def _sort_key(by: str, member_id: int, wins: int, earnings: int) -> tuple:
+    if by == "wins":
+        return (-wins, -earnings, member_id)
+    return (-earnings, -wins, member_id)
+
+
+class GuildBoard:
+    """Sorted views of one guild's quiz winners."""
+
+    def __init__(self):
+        self.stats = {}  # {member_id: (wins, earnings)}
+        self._keys = {by: [] for by in SORT_KEYS}
+
+    def __len__(self):
+        return len(self.stats)
+
+    @classmethod
+    def build(cls, members):
+        """Builds a board from (member_id, wins, earnings) rows, sorting each key list once."""
+        board = cls()
+        for member_id, wins, earnings in members:
+            # Only players with at least one win are ranked
+            if wins > 0:
+                board.stats[member_id] = (wins, earnings)
+        for by, keys in board._keys.items():
+            keys.extend(_sort_key(by, member_id, *stats) for member_id, stats in board.stats.items())
+            keys.sort()
+        return board
+
+    def update(self, member_id: int, wins: int, earnings: int):
+        """Moves a member to their new place: a bisect plus an O(n) list delete and insert."""
+        old = self.stats.pop(member_id, None)
+        if old is not None:
+            for by, keys in self._keys.items():
+                del keys[bisect_left(keys, _sort_key(by, member_id, *old))]
+        # Only players with at least one win are ranked
+        if wins > 0:
+            self.stats[member_id] = (wins, earnings)
+            for by, keys in self._keys.items():
+                insort(keys, _sort_key(by, member_id, wins, earnings))
+
+    def page(self, by: str, page: int, per_page: int = 10) -> list:
+        """Returns [(rank, member_id, wins, earnings)] for a 1-based page."""
+        start = (page - 1) * per_page
+        rows = []
+        for offset, key in enumerate(self._keys[by][start:start + per_page]):
+            member_id = key[2]
+            rows.append((start + offset + 1, member_id, *self.stats[member_id]))
+        return rows
+
+    def rank(self, by: str, member_id: int):
+        """Returns the 1-based rank of a member, or None if they have no wins."""
+        stats = self.stats.get(member_id)
+        if stats is None:
+            return None
+        return bisect_left(self._keys[by], _sort_key(by, member_id, *stats)) + 1
+
+
+class LeaderboardIndex:
+    """Lazily loaded GuildBoard per guild."""
+
+    def __init__(self):
+        self._boards = {}  # {guild_id: GuildBoard}
+
+    def get(self, guild_id: int):
+        return self._boards.get(guild_id)
+
+    def load(self, guild_id: int, all_members: dict) -> GuildBoard:
+        """Builds a guild's board from the dict returned by `config.all_members(guild)`."""
+        board = GuildBoard.build(
+            (int(member_id), data.get("wins", 0), data.get("earnings", 0)) for member_id, data in all_members.items()
+        )
+        self._boards[guild_id] = board
+        return board
+
+    def forget(self, member_id: int):
+        """Removes a member from every loaded board."""
+        for board in self._boards.values():
+            board.update(member_id, 0, 0)
+
+    def update(self, guild_id: int, member_id: int, wins: int, earnings: int):
+        """Applies new totals to a guild's board if it has been loaded."""
+        board = self._boards.get(guild_id)
+        if board is not None:
+            board.update(member_id, wins, earnings)
@@ -0,0 +1,75 @@
+# limits.py — In-memory daily start counters with write-behind persistence
+# Counters are loaded once when the cog loads, checked and bumped in memory
+# when a game starts, and flushed to Config in the background.
+
+import asyncio
+import datetime
+import logging
+
+log = logging.getLogger("red.boozybank")
+
+
+class DailyLimitCache:
+    """Per-member "games started today" counters, keyed by date with lazy midnight rollover."""
+
+    def __init__(self, config, flush_interval: float = 30.0):
+        self.config = config
+        self.flush_interval = flush_interval
+        self._counts = {}  # {(guild_id, member_id): [date, count]}
+        self._dirty = set()
+        self._flush_task = None
+        self.writes = 0
+
+    async def start(self):
+        """Loads today's counters from Config and starts the write-behind loop."""
+        today = datetime.date.today().isoformat()
+        for guild_id, members in (await self.config.all_members()).items():
+            for member_id, data in members.items():
+                if data.get("last_quiz_date") == today:
+                    self._counts[(int(guild_id), int(member_id))] = [today, data.get("quizzes_today", 0)]
+        self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        """Stops the write-behind loop and flushes what is left."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
+
+    def try_increment(self, guild_id: int, member_id: int, limit: int) -> bool:
+        """Counts a game start if the member is below `limit` today. Returns False when blocked."""
+        today = datetime.date.today().isoformat()
+        entry = self._counts.get((guild_id, member_id))
+        if entry is None or entry[0] != today:
+            entry = [today, 0]
+            self._counts[(guild_id, member_id)] = entry
+        if entry[1] >= limit:
+            return False
+        entry[1] += 1
+        self._dirty.add((guild_id, member_id))
+        return True
+
+    def forget(self, member_id: int):
+        """Drops a member's counters in every guild, so a later flush does not write them back."""
+        for key in [key for key in self._counts if key[1] == member_id]:
+            del self._counts[key]
+            self._dirty.discard(key)
+
+    async def flush(self):
+        """Writes all changed counters to Config."""
+        dirty, self._dirty = self._dirty, set()
+        for key in dirty:
+            date, count = self._counts[key]
+            try:
+                async with self.config.member_from_ids(*key).all() as data:
+                    data["last_quiz_date"] = date
+                    data["quizzes_today"] = count
+                self.writes += 1
+            except Exception as e:
+                self._dirty.add(key)
+                log.error(f"Could not save the daily limit counter for member {key[1]}: {e}")
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
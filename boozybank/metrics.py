@@ -0,0 +1,168 @@
+# metrics.py — Latency and throughput instrumentation
+# Histograms with fixed buckets and plain counters, keyed by metric name and
+# labels, like Prometheus. The cog observes timings and counts as it runs;
+# `[p]boozyquizset metrics` summarises them, and the same data is written as
+# a Prometheus text file to the cog data folder so it can be scraped.
+
+import bisect
+import math
+import time
+from contextlib import contextmanager
+
+SECONDS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+FAST_SECONDS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+COUNTS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55)
+LAG_SECONDS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# {name: (type, help, buckets)}
+METRICS = {
+    "boozybank_openai_latency_seconds": ("histogram", "OpenAI chat-completion latency per model and mode (batch: full response, stream: first byte).", SECONDS),
+    "boozybank_parse_seconds": ("histogram", "Time spent parsing and validating generated questions.", FAST_SECONDS),
+    "boozybank_lobby_seconds": ("histogram", "How long lobbies stay open.", SECONDS),
+    "boozybank_first_question_seconds": ("histogram", "Time from the end of the lobby to the first question.", SECONDS),
+    "boozybank_round_rest_calls": ("histogram", "Discord REST calls made for one round.", COUNTS),
+    "boozybank_loop_lag_seconds": ("histogram", "How late the event loop wakes up from a timed sleep.", LAG_SECONDS),
+    "boozybank_answer_delay_seconds": ("histogram", "Time from Discord receiving a guess to the round handling it.", LAG_SECONDS),
+    "boozybank_answer_inversions_total": ("counter", "Correct guesses turned away although Discord received them before the winner's.", None),
+    "boozybank_config_reads_total": ("counter", "Config reads by operation.", None),
+    "boozybank_config_writes_total": ("counter", "Config writes by operation.", None),
+    "boozybank_cache_requests_total": ("counter", "Cache lookups by cache and result.", None),
+    "boozybank_generation_tokens_total": ("counter", "OpenAI tokens spent on question generation.", None),
+    "boozybank_questions_total": ("counter", "Questions generated by OpenAI and questions served, by stage.", None),
+    "boozybank_repeat_questions_total": ("counter", "Questions skipped as near-repeats of recently served ones.", None),
+}
+
+
+class Histogram:
+    """Counts observations per bucket, plus their sum and the largest one."""
+
+    __slots__ = ("buckets", "counts", "sum", "count", "max")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # the last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th observation (the largest value for the +Inf bucket)."""
+        rank = math.ceil(q * self.count)
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+def _label_key(labels: dict) -> tuple:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: tuple, extra: tuple = ()) -> str:
+    pairs = key + extra
+    if not pairs:
+        return ""
+    escaped = (v.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n") for _, v in pairs)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+
+def _format_value(value: float) -> str:
+    return f"{value:g}" if isinstance(value, float) else str(value)
+
+
+class Metrics:
+    """Registry of the cog's histograms and counters."""
+
+    def __init__(self):
+        self._histograms = {}  # {name: {label_key: Histogram}}
+        self._counters = {}  # {name: {label_key: value}}
+        self._collectors = []
+
+    def observe(self, name: str, value: float, **labels):
+        series = self._histograms.setdefault(name, {})
+        key = _label_key(labels)
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = Histogram(METRICS[name][2])
+        histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """Observes how long the `with` block took, in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def inc(self, name: str, amount: int = 1, **labels):
+        series = self._counters.setdefault(name, {})
+        key = _label_key(labels)
+        series[key] = series.get(key, 0) + amount
+
+    def set(self, name: str, value: int, **labels):
+        """Sets a counter that is kept by another component (see `add_collector`)."""
+        self._counters.setdefault(name, {})[_label_key(labels)] = value
+
+    def add_collector(self, collect):
+        """Registers `collect()`, called before every summary or export to `set` outside counters."""
+        self._collectors.append(collect)
+
+    def collect(self):
+        for collect in self._collectors:
+            collect()
+
+    def histograms(self, name: str) -> dict:
+        """Returns {labels dict as tuple: Histogram} for one metric."""
+        return dict(self._histograms.get(name, {}))
+
+    def counters(self, name: str) -> dict:
+        return dict(self._counters.get(name, {}))
+
+    def hit_ratio(self, cache: str):
+        """Share of hits for a cache, or None if it was never used."""
+        hits = misses = 0
+        for key, value in self._counters.get("boozybank_cache_requests_total", {}).items():
+            labels = dict(key)
+            if labels.get("cache") != cache:
+                continue
+            if labels.get("result") == "hit":
+                hits += value
+            else:
+                misses += value
+        total = hits + misses
+        return hits / total if total else None
+
+    def to_prometheus(self) -> str:
+        """Renders every metric in the Prometheus text exposition format."""
+        self.collect()
+        lines = []
+        for name, (kind, help_text, _) in METRICS.items():
+            if kind == "histogram":
+                series = self._histograms.get(name)
+            else:
+                series = self._counters.get(name)
+            if not series:
+                continue
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for key, value in sorted(series.items()):
+                if kind != "histogram":
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+                    continue
+                cumulative = 0
+                for bound, count in zip(value.buckets, value.counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_format_labels(key, (('le', f'{bound:g}'),))} {cumulative}")
+                lines.append(f"{name}_bucket{_format_labels(key, (('le', '+Inf'),))} {value.count}")
+                lines.append(f"{name}_sum{_format_labels(key)} {value.sum:g}")
+                lines.append(f"{name}_count{_format_labels(key)} {value.count}")
+        return "\n".join(lines) + "\n"
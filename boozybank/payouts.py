@@ -0,0 +1,147 @@
+# payouts.py — Payout ledger for game rewards
+# A game credits its winners in a PayoutLedger instead of calling the bank
+# for every reward. On commit the credits are summed per member, scaled down
+# once if they exceed the game's payout cap, and paid with one deposit per
+# member. As before the ledger, a deposit that would overflow a wallet pays
+# nothing. Every commit is appended to an audit log (JSON lines in the cog
+# data folder), which is rotated to one older file once it grows past
+# MAX_AUDIT_BYTES, so it never takes more than about twice that.
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+
+from redbot.core import bank
+
+log = logging.getLogger("red.boozybank")
+
+MAX_AUDIT_BYTES = 1024 * 1024  # roughly 4000 games per file
+
+
+class PayoutLedger:
+    """Collects the credits of one game and pays them out in a single pass."""
+
+    def __init__(self, guild, reason: str, cap: int = None):
+        self.guild = guild
+        self.reason = reason
+        self.cap = cap  # max total payout for the game, or None for no cap
+        self._credits = {}  # {member_id: [member, amount]}
+        self.paid = {}  # {member_id: coins actually deposited}
+        self.capped = set()  # members whose wallet hit the bank's max balance
+        self.max_balance = None
+        self.operations = 0
+
+    def credit(self, member, amount: int):
+        entry = self._credits.setdefault(member.id, [member, 0])
+        entry[1] += amount
+
+    @property
+    def requested(self) -> int:
+        return sum(amount for _, amount in self._credits.values())
+
+    @property
+    def scaling_factor(self) -> float:
+        requested = self.requested
+        if self.cap is None or requested <= self.cap:
+            return 1.0
+        return self.cap / requested
+
+    async def commit(self) -> dict:
+        """Pays every member once and returns {member_id: coins paid}."""
+        factor = self.scaling_factor
+        for member_id, (member, amount) in self._credits.items():
+            amount = int(amount * factor)
+            if amount <= 0:
+                self.paid[member_id] = 0
+                continue
+            self.paid[member_id] = await self._deposit(member, amount)
+        return self.paid
+
+    async def _deposit(self, member, amount: int) -> int:
+        self.operations += 1
+        try:
+            await bank.deposit_credits(member, amount)
+            return amount
+        except bank.errors.BalanceTooHigh:
+            self.capped.add(member.id)
+        # Only looked up for the Wallet Full message, once per game
+        if self.max_balance is None:
+            self.operations += 1
+            self.max_balance = await bank.get_max_balance(self.guild)
+        return 0
+
+    def audit_entry(self) -> dict:
+        factor = self.scaling_factor
+        return {
+            "time": time.time(),
+            "guild": self.guild.id,
+            "reason": self.reason,
+            "requested": self.requested,
+            "cap": self.cap,
+            "scale": round(factor, 4),
+            "payouts": {
+                str(member_id): [int(amount * factor), self.paid.get(member_id, 0)]
+                for member_id, (_, amount) in self._credits.items()
+            },
+            "capped": sorted(self.capped),
+            "bank_operations": self.operations,
+        }
+
+
+class PayoutAudit:
+    """JSON lines file with one entry per committed ledger, plus the previous file after a rotation."""
+
+    def __init__(self, path, max_bytes: int = MAX_AUDIT_BYTES):
+        self.path = path
+        self.rotated = path.with_name(path.name + ".1")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()  # appends and rewrites run in worker threads
+
+    def _append(self, line: str):
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as fp:
+                fp.write(line + "\n")
+                size = fp.tell()
+            if size > self.max_bytes:
+                os.replace(self.path, self.rotated)
+
+    def _forget(self, member_id: str):
+        with self._lock:
+            for path in (self.path, self.rotated):
+                if not path.exists():
+                    continue
+                lines = []
+                with open(path, encoding="utf-8") as fp:
+                    for line in fp:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            continue
+                        entry.get("payouts", {}).pop(member_id, None)
+                        entry["capped"] = [m for m in entry.get("capped", []) if str(m) != member_id]
+                        lines.append(json.dumps(entry, separators=(",", ":")) + "\n")
+                tmp = path.with_suffix(".tmp")
+                with open(tmp, "w", encoding="utf-8") as fp:
+                    fp.writelines(lines)
+                os.replace(tmp, path)
+
+    async def forget(self, member_id: int):
+        """Removes a member's payouts from both audit files, keeping the game totals."""
+        try:
+            await asyncio.to_thread(self._forget, str(member_id))
+        except OSError as e:
+            log.error(f"Could not remove member {member_id} from the payout audit log: {e}")
+
+    async def record(self, ledger: PayoutLedger):
+        entry = ledger.audit_entry()
+        log.info(
+            f"Paid {sum(ledger.paid.values())} of {entry['requested']} requested coins for {ledger.reason} "
+            f"in guild {entry['guild']} ({entry['bank_operations']} bank operations)"
+        )
+        try:
+            await asyncio.to_thread(self._append, json.dumps(entry, separators=(",", ":")))
+        except OSError as e:
+            log.error(f"Could not write the payout audit log: {e}")
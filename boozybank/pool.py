@@ -0,0 +1,78 @@
+# pool.py — In-memory pre-generated question pool
+# Questions are kept per (guild_id, topic, difficulty) so a game can start
+# straight from memory while a background task refills the pool.
+# Cold topics are evicted LRU-style so the pool stays bounded.
+
+import json
+from collections import OrderedDict, deque
+
+
+def normalize_topic(topic: str) -> str:
+    """Lowercases a topic and collapses whitespace so 'Beer  &  Breweries' matches 'beer & breweries'."""
+    return " ".join(topic.lower().split())
+
+
+def pool_key(guild_id: int, topic: str, difficulty: str) -> tuple:
+    """Builds the normalized pool key for a guild/topic/difficulty combination."""
+    return (int(guild_id), normalize_topic(topic), difficulty.lower())
+
+
+class QuestionPool:
+    """Bounded LRU pool of ready-to-play questions."""
+
+    def __init__(self, max_topics: int = 50, max_per_topic: int = 30):
+        self.max_topics = max_topics
+        self.max_per_topic = max_per_topic
+        self._entries = OrderedDict()  # {key: deque[question_dict]}
+
+    def __len__(self):
+        return sum(len(q) for q in self._entries.values())
+
+    def size(self, key: tuple) -> int:
+        """Returns how many questions are ready for this key (does not touch LRU order)."""
+        entry = self._entries.get(key)
+        return len(entry) if entry else 0
+
+    def peek(self, key: tuple) -> list:
+        """Returns the questions waiting for this key without removing them."""
+        return list(self._entries.get(key, ()))
+
+    def put(self, key: tuple, questions: list):
+        """Adds freshly generated questions and marks the key as recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = deque(maxlen=self.max_per_topic)
+            self._entries[key] = entry
+        entry.extend(questions)
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def take(self, key: tuple, count: int) -> list:
+        """Pops up to `count` questions for this key (oldest first)."""
+        entry = self._entries.get(key)
+        if not entry:
+            return []
+        self._entries.move_to_end(key)
+        taken = []
+        while entry and len(taken) < count:
+            taken.append(entry.popleft())
+        return taken
+
+    def _evict(self):
+        while len(self._entries) > self.max_topics:
+            self._entries.popitem(last=False)
+
+    def to_json(self) -> str:
+        """Serializes the pool, preserving LRU order (coldest first)."""
+        data = [
+            [key[0], key[1], key[2], list(questions)]
+            for key, questions in self._entries.items()
+            if questions
+        ]
+        return json.dumps(data)
+
+    def load_json(self, raw: str):
+        """Restores a pool previously written by `to_json`."""
+        self._entries.clear()
+        for guild_id, topic, difficulty, questions in json.loads(raw):
+            self.put(pool_key(guild_id, topic, difficulty), questions)
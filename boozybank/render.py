@@ -0,0 +1,88 @@
+# render.py — Question embed rendering
+# The question/choices text of a question is rendered once, when it enters the
+# pool (or on first use), and cached. Every question message remembers the
+# payload it last sent, so an edit that would not change what players see is
+# never sent to Discord.
+
+from collections import OrderedDict
+
+import discord
+
+_MISSING = object()
+
+
+def _render_body(quiz: dict) -> str:
+    choices = "".join(f"**{letter}**: {option}\n" for letter, option in quiz["options"].items())
+    return f"**QUESTION:**\n{quiz['question']}\n\n**CHOICES:**\n{choices}"
+
+
+class QuestionRenderer:
+    """Bounded LRU cache of rendered question bodies."""
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._bodies = OrderedDict()  # {(question, *options): body}
+        self.hits = 0
+        self.misses = 0
+
+    def prepare(self, quiz: dict) -> str:
+        """Returns the rendered question and choices, rendering them on first use."""
+        key = (quiz["question"], *quiz["options"].values())
+        body = self._bodies.get(key)
+        if body is not None:
+            self.hits += 1
+            self._bodies.move_to_end(key)
+            return body
+
+        self.misses += 1
+        body = self._bodies[key] = _render_body(quiz)
+        if len(self._bodies) > self.max_entries:
+            self._bodies.popitem(last=False)
+        return body
+
+    def question_embed(self, quiz: dict, title: str, color: discord.Color, header: str = "", footer: str = None) -> discord.Embed:
+        emb = discord.Embed(title=title, color=color, description=header + self.prepare(quiz))
+        if footer:
+            emb.set_footer(text=footer)
+        return emb
+
+
+def _view_payload(view):
+    return view.to_components() if view is not None else None
+
+
+class RenderedMessage:
+    """A sent message plus the payload it currently shows. `edit` only calls Discord when that payload changes."""
+
+    def __init__(self, message, embed: discord.Embed = None, view=None):
+        self.message = message
+        self._embed = embed.to_dict() if embed is not None else None
+        self._view = _view_payload(view)
+        self.edits = 0
+        self.skipped = 0
+        self.edited_at = None  # Discord's timestamp of the last edit, when the API returned one
+
+    async def edit(self, *, embed=_MISSING, view=_MISSING) -> bool:
+        """Edits the message if the embed and/or view differ from what it shows. Returns True if an edit was sent."""
+        changes = {}
+        if embed is not _MISSING:
+            embed_payload = embed.to_dict() if embed is not None else None
+            if embed_payload != self._embed:
+                changes["embed"] = embed
+        if view is not _MISSING:
+            view_payload = _view_payload(view)
+            if view_payload != self._view:
+                changes["view"] = view
+
+        if not changes:
+            self.skipped += 1
+            return False
+
+        edited = await self.message.edit(**changes)
+        self.edits += 1
+        self.edited_at = getattr(edited, "edited_at", None)
+        if "embed" in changes:
+            self._embed = embed_payload
+        if "view" in changes:
+            self._view = view_payload
+        return True
@@ -0,0 +1,106 @@
+# resilience.py — Retries, hedging and circuit breaking for OpenAI calls
+# Transient failures (rate limits, 5xx, timeouts, dropped connections) are
+# retried with full-jitter exponential backoff, a slow request can be hedged
+# with a second one once it passes the model's p95 latency, and a per-guild
+# circuit breaker stops calling a degraded API so games fall back to stored
+# questions straight away.
+
+import asyncio
+import random
+import time
+from collections import deque
+
+
+class RetryableError(RuntimeError):
+    """A failure that is worth retrying: rate limit, server error, timeout or dropped connection."""
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling the API while the circuit breaker is open."""
+
+
+class LatencyTracker:
+    """Rolling window of recent request latencies."""
+
+    def __init__(self, size: int = 100):
+        self._samples = deque(maxlen=size)
+
+    def __len__(self):
+        return len(self._samples)
+
+    def add(self, seconds: float):
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> float:
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+class CircuitBreaker:
+    """Opens after `failure_threshold` consecutive failures and lets one probe through after `reset_after` seconds."""
+
+    def __init__(self, failure_threshold: int = 3, reset_after: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self.failures = 0
+        self.opened_at = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        if time.monotonic() - self.opened_at >= self.reset_after:
+            # Half-open: let this request probe the API, and re-open right away if it fails
+            self.opened_at = None
+            self.failures = self.failure_threshold - 1
+            return True
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+
+async def with_retries(attempt, retries: int = 2, base_delay: float = 0.5, max_delay: float = 4.0):
+    """Runs `attempt()` and retries RetryableErrors with full-jitter exponential backoff."""
+    for number in range(retries + 1):
+        try:
+            return await attempt()
+        except RetryableError:
+            if number == retries:
+                raise
+            await asyncio.sleep(random.uniform(0, min(max_delay, base_delay * 2 ** number)))
+
+
+async def hedged(attempt, hedge_after: float = None):
+    """Runs `attempt()`, starting a second copy if the first is still running after `hedge_after` seconds.
+    The first successful result wins and the other request is cancelled.
+    """
+    if hedge_after is None:
+        return await attempt()
+
+    tasks = {asyncio.ensure_future(attempt())}
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+        if not done:
+            tasks.add(asyncio.ensure_future(attempt()))
+        pending, error = tasks, None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        # Also runs when the caller is cancelled, so no request outlives it
+        for task in tasks:
+            task.cancel()
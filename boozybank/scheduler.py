@@ -0,0 +1,112 @@
+# scheduler.py — Cog-wide scheduling of OpenAI requests
+# Every request waits for an in-flight slot and for request/token budget
+# before it is sent. Waiting guilds are served round-robin so one busy guild
+# cannot starve the others.
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+
+
+class TokenBucket:
+    """Refills `rate_per_minute` units per minute, up to one minute of budget."""
+
+    def __init__(self, rate_per_minute: float):
+        self.rate_per_minute = rate_per_minute
+        self.level = rate_per_minute
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.level = min(self.rate_per_minute, self.level + (now - self._updated) * self.rate_per_minute / 60)
+        self._updated = now
+
+    async def take(self, amount: float):
+        """Waits until `amount` units are available and takes them. Requests larger than the bucket only wait for a full bucket."""
+        amount = min(amount, self.rate_per_minute)
+        while True:
+            self._refill()
+            if self.level >= amount:
+                self.level -= amount
+                return
+            await asyncio.sleep((amount - self.level) * 60 / self.rate_per_minute)
+
+    def adjust(self, amount: float):
+        """Corrects the level once the real cost is known (may go negative)."""
+        self._refill()
+        self.level -= amount
+
+
+class GenerationScheduler:
+    """Limits concurrent OpenAI requests and request/token rates, with fair queuing across guilds."""
+
+    def __init__(self, max_in_flight: int = 4, requests_per_minute: int = 60, tokens_per_minute: int = 200000):
+        self.in_flight = 0
+        self._waiting = OrderedDict()  # {guild_id: deque[Future]}, in round-robin order
+        self.configure(max_in_flight, requests_per_minute, tokens_per_minute)
+
+    def configure(self, max_in_flight: int, requests_per_minute: int, tokens_per_minute: int):
+        self.max_in_flight = max_in_flight
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self._wake()
+
+    @property
+    def queued(self) -> int:
+        return sum(len(q) for q in self._waiting.values())
+
+    async def acquire(self, guild_id: int, estimated_tokens: int):
+        """Waits for an in-flight slot (fairly across guilds) and for rate budget."""
+        if self.in_flight < self.max_in_flight and not self._waiting:
+            self.in_flight += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiting.setdefault(guild_id, deque()).append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self.release()  # The slot was granted as we got cancelled
+                else:
+                    self._forget(guild_id, waiter)
+                raise
+
+        try:
+            await self.requests.take(1)
+            await self.tokens.take(estimated_tokens)
+        except asyncio.CancelledError:
+            self.release()
+            raise
+
+    @asynccontextmanager
+    async def slot(self, guild_id: int, estimated_tokens: int):
+        """Holds an in-flight slot for the duration of one request."""
+        await self.acquire(guild_id, estimated_tokens)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def release(self):
+        self.in_flight -= 1
+        self._wake()
+
+    def _forget(self, guild_id, waiter):
+        queue = self._waiting.get(guild_id)
+        if queue is not None and waiter in queue:
+            queue.remove(waiter)
+            if not queue:
+                del self._waiting[guild_id]
+
+    def _wake(self):
+        while self.in_flight < self.max_in_flight and self._waiting:
+            guild_id, queue = next(iter(self._waiting.items()))
+            waiter = queue.popleft()
+            # The guild goes to the back of the line, or leaves it if nothing else is waiting
+            del self._waiting[guild_id]
+            if queue:
+                self._waiting[guild_id] = queue
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
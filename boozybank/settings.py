@@ -0,0 +1,40 @@
+# settings.py — Immutable per-guild settings snapshot
+# Loaded once with `config.guild(g).all()` and cached by the cog, so rounds
+# read plain attributes instead of awaiting Config for every value.
+
+from typing import NamedTuple, Tuple
+
+
+class GuildSettings(NamedTuple):
+    quiz_reward: int
+    timeout: int
+    show_explanation: bool
+    model: str
+    allow_second_guess: bool
+    max_game_payout: int
+    easy_endreward: int
+    medium_endreward: int
+    hard_endreward: int
+    cleanup_messages: bool
+    final_cleanup_delay: int
+    daily_limit: int
+    min_players: int
+    reading_time: int
+    pool_low_water: int
+    batch_surplus: int
+    stream_questions: bool
+    hedge_requests: bool
+    answer_mode: str
+    offline_questions: bool
+    repeat_window_days: int
+    default_topics: Tuple[str, ...]
+
+    @classmethod
+    def from_config(cls, data: dict) -> "GuildSettings":
+        """Builds a snapshot from the dict returned by `config.guild(g).all()`."""
+        values = {name: data[name] for name in cls._fields}
+        values["default_topics"] = tuple(values["default_topics"])
+        return cls(**values)
+
+    def end_reward(self, difficulty: str) -> int:
+        return getattr(self, f"{difficulty}_endreward")
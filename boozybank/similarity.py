@@ -0,0 +1,175 @@
+# similarity.py — Near-duplicate filter for served questions
+# Fingerprints only catch reordered copies of a question. To catch rewordings
+# the content words of a question and its correct answer are sorted, cut into
+# character shingles (so "fell" still overlaps "fall") and summarised as a
+# MinHash signature; the Jaccard similarity of two questions is estimated by
+# how many signature slots agree. Signatures are split into LSH bands, so
+# finding similar questions is a handful of dict lookups instead of a scan.
+# One index per guild holds what it was served in the last MAX_WINDOW_DAYS;
+# the guild's own window is applied when looking up, so changing it never
+# loses history. Signatures cost over a millisecond each, so they are cached
+# per fingerprint and new ones are computed off the event loop.
+
+import asyncio
+import time
+import zlib
+from array import array
+from collections import OrderedDict, deque
+
+from .storage import content_words, quiz_fingerprint
+
+SHINGLE_SIZE = 4
+NUM_PERM = 60
+BANDS = 20  # 20 bands of 3 rows: pairs above 0.6 similarity share a band over 99% of the time
+ROWS = NUM_PERM // BANDS
+THRESHOLD = 0.6  # estimated Jaccard similarity from which a question counts as a repeat
+MAX_WINDOW_DAYS = 90
+SIGNATURE_CACHE = 2000  # signatures kept per process, enough for a few pools' worth of questions
+
+_PRIME = (1 << 61) - 1
+_MASK = (1 << 32) - 1
+# Fixed coefficients, so signatures stored on disk stay comparable after a restart
+_PERMUTATIONS = [
+    (1 + zlib.crc32(f"a{i}".encode()) * 2654435761 % (_PRIME - 1), zlib.crc32(f"b{i}".encode()))
+    for i in range(NUM_PERM)
+]
+
+
+def shingles(quiz: dict) -> set:
+    """Character shingles of the question's and correct answer's content words, in sorted order."""
+    answer = quiz.get("options", {}).get(quiz.get("correct_answer"), "")
+    text = " ".join(sorted(set(content_words(f"{quiz['question']} {answer}"))))
+    if len(text) <= SHINGLE_SIZE:
+        return {text}
+    return {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+
+def signature(quiz: dict) -> array:
+    """MinHash signature of a question: the minimum of each hash permutation over its shingles."""
+    hashes = [zlib.crc32(shingle.encode()) for shingle in shingles(quiz)]
+    return array("I", (min((a * h + b) % _PRIME for h in hashes) & _MASK for a, b in _PERMUTATIONS))
+
+
+def similarity(first: array, second: array) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(x == y for x, y in zip(first, second)) / NUM_PERM
+
+
+def _bands(sig: array):
+    for band in range(BANDS):
+        yield band, tuple(sig[band * ROWS:(band + 1) * ROWS])
+
+
+class SimilarityIndex:
+    """LSH index of the questions one guild was served, oldest first so expiry is cheap."""
+
+    def __init__(self):
+        self._entries = {}  # {fingerprint: (signature, served_at)}
+        self._order = deque()  # (served_at, fingerprint), may hold stale pairs of re-served questions
+        self._buckets = {}  # {(band, rows): {fingerprint}}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, fingerprint: str, sig: array, served_at: float):
+        if fingerprint in self._entries:
+            self._discard(fingerprint)
+        self._entries[fingerprint] = (sig, served_at)
+        self._order.append((served_at, fingerprint))
+        for key in _bands(sig):
+            self._buckets.setdefault(key, set()).add(fingerprint)
+
+    def expire(self, before: float):
+        while self._order and self._order[0][0] < before:
+            served_at, fingerprint = self._order.popleft()
+            entry = self._entries.get(fingerprint)
+            if entry is not None and entry[1] == served_at:
+                self._discard(fingerprint)
+
+    def _discard(self, fingerprint: str):
+        sig, _ = self._entries.pop(fingerprint)
+        for key in _bands(sig):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(fingerprint)
+                if not bucket:
+                    del self._buckets[key]
+
+    def closest(self, sig: array, since: float = 0.0) -> float:
+        """Highest estimated similarity to any question served since `since` that shares an LSH band, else 0."""
+        candidates = set()
+        for key in _bands(sig):
+            candidates |= self._buckets.get(key, set())
+        return max(
+            (similarity(sig, entry[0]) for entry in map(self._entries.get, candidates) if entry[1] >= since),
+            default=0.0,
+        )
+
+
+class RecentQuestions:
+    """Per-guild similarity indexes of recently served questions, persisted in the question bank."""
+
+    def __init__(self, bank, threshold: float = THRESHOLD):
+        self.bank = bank
+        self.threshold = threshold
+        self._indexes = {}  # {guild_id: SimilarityIndex}
+        self._signatures = OrderedDict()  # {fingerprint: signature}, least recently used first
+        self.rejected = 0
+
+    async def _signatures_for(self, questions: list) -> list:
+        """[(fingerprint, signature)] per question; uncached signatures are computed in a worker thread."""
+        fingerprints = [quiz_fingerprint(quiz) for quiz in questions]
+        # Captured before the await: a concurrent call may evict entries while the thread runs
+        found = {fp: self._signatures[fp] for fp in fingerprints if fp in self._signatures}
+        missing = {fp: quiz for fp, quiz in zip(fingerprints, questions) if fp not in found}
+        if missing:
+            found.update(zip(missing, await asyncio.to_thread(lambda: [signature(quiz) for quiz in missing.values()])))
+        for fingerprint in fingerprints:
+            self._signatures[fingerprint] = found[fingerprint]
+            self._signatures.move_to_end(fingerprint)
+        while len(self._signatures) > SIGNATURE_CACHE:
+            self._signatures.popitem(last=False)
+        return [(fingerprint, found[fingerprint]) for fingerprint in fingerprints]
+
+    async def _index(self, guild_id: int) -> SimilarityIndex:
+        index = self._indexes.get(guild_id)
+        if index is None:
+            index = SimilarityIndex()
+            since = time.time() - MAX_WINDOW_DAYS * 86400
+            for fingerprint, blob, served_at in await self.bank.load_history(guild_id, since):
+                sig = array("I")
+                sig.frombytes(blob)
+                index.add(fingerprint, sig, served_at)
+            self._indexes[guild_id] = index
+        # Only history beyond the largest window is dropped; the guild's own window is applied per lookup
+        index.expire(time.time() - MAX_WINDOW_DAYS * 86400)
+        return index
+
+    async def filter(self, guild_id: int, questions: list, days: int) -> list:
+        """Drops questions too similar to what the guild was served in the last `days` days, or to each other."""
+        if not questions:
+            return questions
+        index = await self._index(guild_id)
+        since = time.time() - days * 86400
+        kept, kept_signatures = [], []
+        for quiz, (_, sig) in zip(questions, await self._signatures_for(questions)):
+            if index.closest(sig, since) >= self.threshold or any(
+                similarity(sig, other) >= self.threshold for other in kept_signatures
+            ):
+                self.rejected += 1
+                continue
+            kept.append(quiz)
+            kept_signatures.append(sig)
+        return kept
+
+    async def record(self, guild_id: int, questions: list):
+        """Adds served questions to the guild's index and its stored history."""
+        if not questions:
+            return
+        index = await self._index(guild_id)
+        now = time.time()
+        entries = []
+        for fingerprint, sig in await self._signatures_for(questions):
+            index.add(fingerprint, sig, now)
+            entries.append((fingerprint, sig.tobytes(), now))
+        await self.bank.record_history(guild_id, entries)
@@ -0,0 +1,119 @@
+# stats.py — Batched, journaled member stats writes
+# A game collects per-member deltas in memory and commits them at the end with
+# one Config transaction per member. The batch is journaled first, and every
+# member record remembers the last batch it applied, so a restart mid-flush
+# replays the journal without losing or double-counting anything. Batch ids
+# come from a persisted counter, never from the clock, and batches are applied
+# strictly in id order.
+
+import asyncio
+
+
+class StatsDelta:
+    """Per-member win and earning deltas collected during one game."""
+
+    def __init__(self):
+        self.deltas = {}  # {member_id: [wins, earnings]}
+
+    def __bool__(self):
+        return bool(self.deltas)
+
+    def add(self, member_id: int, wins: int = 0, earnings: int = 0):
+        entry = self.deltas.setdefault(member_id, [0, 0])
+        entry[0] += wins
+        entry[1] += earnings
+
+
+class StatsWriter:
+    """Commits StatsDelta batches to the member Config through a crash-safe journal."""
+
+    def __init__(self, config):
+        self.config = config
+        self._lock = asyncio.Lock()
+        self._seq = 0  # last batch id handed out, persisted in the global stats_batch_seq
+        self._pending = {}  # {batch_id: entry} journaled but not applied yet
+        self._applied = []  # batch ids applied but still in the journal, pruned by the next journal write
+        self._loaded = False
+        self.reads = 0  # Config reads and writes, exported by the cog's metrics
+        self.writes = 0
+
+    async def _load(self):
+        journal = await self.config.stats_journal()
+        self._pending = {int(batch_id): entry for batch_id, entry in journal.items()}
+        self._seq = max([await self.config.stats_batch_seq(), *self._pending])
+        self.reads += 2
+        self._loaded = True
+
+    async def commit(self, guild_id: int, delta: StatsDelta) -> dict:
+        """Journals and applies a game's deltas, after any older batch still pending.
+        Returns the new {(guild_id, member_id): (wins, earnings)} totals of every batch applied.
+        """
+        if not delta:
+            return {}
+        async with self._lock:
+            if not self._loaded:
+                await self._load()
+            self._seq += 1
+            batch_id = self._seq
+            await self.config.stats_batch_seq.set(batch_id)
+            entry = {"guild": guild_id, "deltas": {str(k): v for k, v in delta.deltas.items()}}
+            async with self.config.stats_journal() as journal:
+                for applied in self._applied:
+                    journal.pop(str(applied), None)
+                journal[str(batch_id)] = entry
+            self.reads += 1
+            self.writes += 2
+            self._applied.clear()
+            self._pending[batch_id] = entry
+            return await self._drain()
+
+    async def replay(self) -> dict:
+        """Re-applies batches left in the journal by a crash or reload, oldest first."""
+        async with self._lock:
+            await self._load()
+            totals = await self._drain()
+            if self._applied:
+                async with self.config.stats_journal() as live_journal:
+                    for applied in self._applied:
+                        live_journal.pop(str(applied), None)
+                self.reads += 1
+                self.writes += 1
+                self._applied.clear()
+            return totals
+
+    async def forget(self, member_id: int):
+        """Removes a member's deltas from pending and journaled batches, so a replay does not recreate them."""
+        async with self._lock:
+            for entry in self._pending.values():
+                entry["deltas"].pop(str(member_id), None)
+            async with self.config.stats_journal() as journal:
+                for entry in journal.values():
+                    entry["deltas"].pop(str(member_id), None)
+            self.reads += 1
+            self.writes += 1
+
+    async def _drain(self) -> dict:
+        # Strictly in id order: a batch that fails stays pending and holds back every newer one,
+        # since a member's marker would otherwise move past it and it would never be counted
+        totals = {}
+        for batch_id in sorted(self._pending):
+            entry = self._pending[batch_id]
+            for member_id, values in (await self._apply(batch_id, entry)).items():
+                totals[(entry["guild"], member_id)] = values
+            del self._pending[batch_id]
+            self._applied.append(batch_id)
+        return totals
+
+    async def _apply(self, batch_id: int, entry: dict) -> dict:
+        totals = {}
+        for member_id, (wins, earnings) in entry["deltas"].items():
+            async with self.config.member_from_ids(entry["guild"], int(member_id)).all() as data:
+                # Batches are applied in id order, so anything at or below the marker is already counted
+                if data["stats_batch"] < batch_id:
+                    data["wins"] += wins
+                    data["earnings"] += earnings
+                    data["stats_batch"] = batch_id
+                totals[int(member_id)] = (data["wins"], data["earnings"])
+            self.reads += 1
+            self.writes += 1
+        return totals
@@ -0,0 +1,195 @@
+# storage.py — Persistent on-disk question bank
+# Every generated question is stored in a small SQLite database in the cog
+# data path so games can be served again without an OpenAI round-trip.
+# Questions are de-duplicated on a normalized fingerprint of their text and answer.
+# Each guild's served history (MinHash signatures, see similarity.py) is kept
+# here too, so the repeat filter survives restarts.
+
+import asyncio
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+
+from .generation import loads
+from .pool import normalize_topic
+
+# Filler words that don't change what a question asks
+STOPWORDS = frozenset({
+    "a", "an", "the", "of", "in", "on", "at", "to", "for", "by", "with", "from",
+    "is", "was", "are", "were", "be", "been", "which", "what", "who", "whom",
+    "whose", "when", "where", "how", "does", "did", "do", "this", "that", "these",
+    "those", "and", "or", "as", "its", "it", "known", "called", "name",
+})
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    id INTEGER PRIMARY KEY,
+    fingerprint TEXT NOT NULL UNIQUE,
+    topic TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    served_count INTEGER NOT NULL DEFAULT 0,
+    last_served REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_questions_lookup
+    ON questions (topic, difficulty, served_count, last_served);
+CREATE TABLE IF NOT EXISTS served_history (
+    guild_id INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL,
+    signature BLOB NOT NULL,
+    served_at REAL NOT NULL,
+    PRIMARY KEY (guild_id, fingerprint)
+);
+"""
+
+
+def content_words(text: str) -> list:
+    """Lowercased ASCII words of a text without the filler words, in their original order."""
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode().lower()
+    return [w for w in _WORD_RE.findall(text) if w not in STOPWORDS]
+
+
+def _normalize_text(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+def _fingerprint_part(text: str) -> str:
+    # Non-Latin text (or text made only of filler words) has no content words, so it keeps its full text
+    words = sorted(set(content_words(text)))
+    return " ".join(words) if words else _normalize_text(text)
+
+
+def question_fingerprint(question: str, answer: str = "") -> str:
+    """Builds a fingerprint that is identical for reworded/reordered copies of the same question and answer."""
+    key = f"{_fingerprint_part(question)}|{_fingerprint_part(answer)}"
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def quiz_fingerprint(quiz: dict) -> str:
+    """Fingerprint of a question dict: its question text and the text of its correct answer."""
+    answer = quiz.get("options", {}).get(quiz.get("correct_answer"), "")
+    return question_fingerprint(quiz["question"], answer)
+
+
+class QuestionBank:
+    """SQLite-backed store of every generated question, indexed by topic and difficulty."""
+
+    def __init__(self, path):
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def open(self):
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] < 1:
+            self._refingerprint()
+        self._conn.commit()
+
+    def _refingerprint(self):
+        """Recomputes stored fingerprints after they started covering the correct answer (schema version 1)."""
+        rows = self._conn.execute("SELECT id, payload FROM questions").fetchall()
+        self._conn.executemany(
+            "UPDATE OR IGNORE questions SET fingerprint = ? WHERE id = ?",
+            [(quiz_fingerprint(loads(payload)), row_id) for row_id, payload in rows]
+        )
+        self._conn.execute("PRAGMA user_version = 1")
+
+    def close(self):
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+                self._conn = None
+
+    async def add(self, topic: str, difficulty: str, questions: list) -> list:
+        """Stores new questions and returns only the ones that were not already known."""
+        return await asyncio.to_thread(self._add, normalize_topic(topic), difficulty.lower(), questions)
+
+    async def draw(self, topic: str, difficulty: str, count: int, exclude=(), unserved_only: bool = False) -> list:
+        """Returns up to `count` stored questions, least recently served first."""
+        return await asyncio.to_thread(
+            self._draw, normalize_topic(topic), difficulty.lower(), count, set(exclude), unserved_only
+        )
+
+    async def mark_served(self, questions: list):
+        """Bumps the served counters so these questions are picked last next time."""
+        await asyncio.to_thread(self._mark_served, [quiz_fingerprint(q) for q in questions])
+
+    async def count(self) -> int:
+        return await asyncio.to_thread(self._count)
+
+    async def record_history(self, guild_id: int, entries: list):
+        """Remembers what a guild was served: entries are (fingerprint, signature bytes, served_at)."""
+        await asyncio.to_thread(self._record_history, guild_id, entries)
+
+    async def load_history(self, guild_id: int, since: float) -> list:
+        """Returns a guild's (fingerprint, signature bytes, served_at) entries since `since`, oldest first.
+        Older entries are deleted on the way.
+        """
+        return await asyncio.to_thread(self._load_history, guild_id, since)
+
+    def _add(self, topic, difficulty, questions):
+        accepted = []
+        now = time.time()
+        with self._lock:
+            for quiz in questions:
+                cur = self._conn.execute(
+                    "INSERT OR IGNORE INTO questions (fingerprint, topic, difficulty, payload, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (quiz_fingerprint(quiz), topic, difficulty, json.dumps(quiz), now)
+                )
+                if cur.rowcount:
+                    accepted.append(quiz)
+            self._conn.commit()
+        return accepted
+
+    def _draw(self, topic, difficulty, count, exclude, unserved_only):
+        query = (
+            "SELECT fingerprint, payload FROM questions WHERE topic = ? AND difficulty = ?"
+            + (" AND served_count = 0" if unserved_only else "")
+            + " ORDER BY served_count, last_served LIMIT ?"
+        )
+        with self._lock:
+            rows = self._conn.execute(query, (topic, difficulty, count + len(exclude))).fetchall()
+        return [loads(payload) for fp, payload in rows if fp not in exclude][:count]
+
+    def _mark_served(self, fingerprints):
+        if not fingerprints:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE questions SET served_count = served_count + 1, last_served = ? WHERE fingerprint = ?",
+                [(time.time(), fp) for fp in fingerprints]
+            )
+            self._conn.commit()
+
+    def _count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM questions").fetchone()[0]
+
+    def _record_history(self, guild_id, entries):
+        if not entries:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO served_history (guild_id, fingerprint, signature, served_at) VALUES (?, ?, ?, ?)",
+                [(guild_id, fp, signature, served_at) for fp, signature, served_at in entries]
+            )
+            self._conn.commit()
+
+    def _load_history(self, guild_id, since):
+        with self._lock:
+            self._conn.execute("DELETE FROM served_history WHERE guild_id = ? AND served_at < ?", (guild_id, since))
+            self._conn.commit()
+            return self._conn.execute(
+                "SELECT fingerprint, signature, served_at FROM served_history WHERE guild_id = ? ORDER BY served_at",
+                (guild_id,)
+            ).fetchall()
@@ -0,0 +1,78 @@
+# streaming.py — Incremental parsing of streamed OpenAI batch responses
+# With `stream=True` the chat-completions API sends the JSON answer in small
+# server-sent-event deltas. The parser below picks complete question objects
+# out of the `questions` array as soon as their closing brace arrives, so the
+# first round can start while the model is still writing the rest.
+
+from .generation import loads
+
+
+async def iter_sse_content(response):
+    """Yields the content deltas of a streamed chat-completions response."""
+    async for raw_line in response.content:
+        line = raw_line.strip()
+        if not line.startswith(b"data:"):
+            continue
+        data = line[5:].strip()
+        if data == b"[DONE]":
+            break
+        try:
+            chunk = loads(data)
+            delta = chunk["choices"][0].get("delta", {}).get("content")
+        except (KeyError, IndexError, ValueError):
+            continue
+        if delta:
+            yield delta
+
+
+class QuestionStreamParser:
+    """Extracts each object of the top-level `questions` array as soon as it is complete."""
+
+    def __init__(self):
+        self._text = []
+        self._length = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._start = None  # absolute offset where the current question object began
+
+    def feed(self, chunk: str) -> list:
+        """Consumes a chunk of streamed JSON text and returns any questions it completed."""
+        completed = []
+        offset = self._length
+        self._text.append(chunk)
+        self._length += len(chunk)
+
+        for i, char in enumerate(chunk):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                # Depth 2 is inside {"questions": [ ... ]}
+                if char == "{" and self._depth == 2:
+                    self._start = offset + i
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if char == "}" and self._depth == 2 and self._start is not None:
+                    text = "".join(self._text)
+                    raw = text[self._start:offset + i + 1]
+                    # Drop everything before this object so the buffer stays small
+                    self._text = [text[offset + i + 1:]]
+                    consumed = offset + i + 1
+                    self._length -= consumed
+                    offset -= consumed
+                    self._start = None
+                    try:
+                        completed.append(loads(raw))
+                    except ValueError:
+                        pass
+        return completed
@@ -0,0 +1,130 @@
+# timing.py — Answer timing on Discord's clock
+# A message or interaction id is a snowflake that carries the millisecond it
+# was created on Discord's side, so answer speed is measured from the
+# question's snowflake to the answer's snowflake. That leaves out gateway
+# delivery, event-loop lag and REST calls, which used to count against the
+# player. Reactions carry no snowflake; their receive time is mapped onto
+# Discord's clock with the smallest offset seen between a message's snowflake
+# and the moment it arrived. A lag monitor samples how late the event loop
+# wakes up, and FairnessStats keeps what the timing correction changed per round.
+
+import asyncio
+import time
+from collections import deque
+
+DISCORD_EPOCH_MS = 1420070400000
+
+
+def snowflake_ms(snowflake: int) -> int:
+    """Unix time in milliseconds at which Discord created the object with this id."""
+    return (int(snowflake) >> 22) + DISCORD_EPOCH_MS
+
+
+def now_ms() -> int:
+    return time.time_ns() // 1_000_000
+
+
+class DiscordClock:
+    """Maps local receive times onto Discord's clock.
+    Every message is a sample of (arrival - creation); the smallest recent one is the
+    best estimate of clock skew plus the fastest delivery.
+    """
+
+    def __init__(self, samples: int = 200):
+        self._offsets = deque(maxlen=samples)
+        self._offset = None
+
+    def observe(self, snowflake: int, received_ms: int):
+        offset = received_ms - snowflake_ms(snowflake)
+        evicted = self._offsets[0] if len(self._offsets) == self._offsets.maxlen else None
+        self._offsets.append(offset)
+        if self._offset is None or offset < self._offset:
+            self._offset = offset
+        elif evicted == self._offset:
+            self._offset = min(self._offsets)
+
+    def to_discord_ms(self, received_ms: int) -> int:
+        return received_ms - (self._offset or 0)
+
+
+class LoopLagMonitor:
+    """Measures how late a periodic sleep wakes up, i.e. how long the event loop was busy."""
+
+    def __init__(self, interval: float = 0.5, samples: int = 240, on_sample=None):
+        self.interval = interval
+        self.samples = deque(maxlen=samples)  # about two minutes at the default interval
+        self.count = 0
+        self._on_sample = on_sample
+        self._task = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.monotonic() - start - self.interval)
+            self.samples.append(lag)
+            self.count += 1
+            if self._on_sample is not None:
+                self._on_sample(lag)
+
+    @property
+    def current(self) -> float:
+        return self.samples[-1] if self.samples else 0.0
+
+    def max_since(self, count: int) -> float:
+        """Largest lag sampled since the monitor's `count` was `count`."""
+        recent = min(self.count - count, len(self.samples))
+        return max(list(self.samples)[-recent:], default=0.0) if recent > 0 else 0.0
+
+    def percentile(self, q: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class RoundFairness:
+    """What the timing correction changed in one round."""
+
+    __slots__ = ("guesses", "delays", "winner_seconds", "local_seconds", "inversions", "loop_lag")
+
+    def __init__(self, guesses: int, delays: list, winner_seconds, local_seconds, inversions: int, loop_lag: float):
+        self.guesses = guesses
+        self.delays = delays  # per guess: seconds between Discord receiving it and the round handling it
+        self.winner_seconds = winner_seconds  # winning answer time on Discord's clock
+        self.local_seconds = local_seconds  # the same answer measured when the round handled it
+        self.inversions = inversions  # correct answers turned away although Discord got them before the winner's
+        self.loop_lag = loop_lag  # worst event-loop lag sampled during the round
+
+
+class FairnessStats:
+    """The most recent rounds' fairness records."""
+
+    def __init__(self, rounds: int = 200):
+        self.rounds = deque(maxlen=rounds)
+
+    def add(self, record: RoundFairness):
+        self.rounds.append(record)
+
+    def summary(self) -> dict:
+        rounds = list(self.rounds)
+        delays = sorted(d for r in rounds for d in r.delays)
+        corrected = [r.local_seconds - r.winner_seconds for r in rounds if r.winner_seconds is not None]
+        return {
+            "rounds": len(rounds),
+            "guesses": sum(r.guesses for r in rounds),
+            "median_delay": delays[len(delays) // 2] if delays else 0.0,
+            "max_delay": delays[-1] if delays else 0.0,
+            "mean_correction": sum(corrected) / len(corrected) if corrected else 0.0,
+            "inversions": sum(r.inversions for r in rounds),
+            "max_loop_lag": max((r.loop_lag for r in rounds), default=0.0),
+        }
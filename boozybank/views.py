@@ -0,0 +1,158 @@
+# views.py — Component views for BoozyBank
+# Answer buttons are an alternative to emoji reactions: one message, one
+# view, a private reply per click and a single edit when the round ends.
+# The lobby is a view too: clicks only change its state, and the lobby embed
+# is re-rendered at most once per interval however many players click.
+
+import asyncio
+import time
+
+import discord
+
+ANSWER_BUTTON_PREFIX = "boozy_answer_"
+
+
+class AnswerButtonsView(discord.ui.View):
+    """A/B/C/D answer buttons. Persistent, so clicks on a question still reach the cog after a reload."""
+
+    def __init__(self, cog, disabled: bool = False):
+        super().__init__(timeout=None)
+        self.cog = cog
+        for letter in "ABCD":
+            button = discord.ui.Button(
+                label=letter,
+                style=discord.ButtonStyle.primary,
+                custom_id=f"{ANSWER_BUTTON_PREFIX}{letter}",
+                disabled=disabled,
+            )
+            button.callback = self._make_callback(letter)
+            self.add_item(button)
+
+    def set_disabled(self, disabled: bool):
+        for button in self.children:
+            button.disabled = disabled
+
+    def reveal(self, correct_answer: str):
+        """Disables the buttons and highlights the correct one."""
+        for button in self.children:
+            button.disabled = True
+            is_correct = button.custom_id == f"{ANSWER_BUTTON_PREFIX}{correct_answer}"
+            button.style = discord.ButtonStyle.success if is_correct else discord.ButtonStyle.secondary
+
+    def _make_callback(self, letter: str):
+        async def callback(interaction: discord.Interaction):
+            try:
+                # If this view is a zombie from a previous reload, forward to the active cog.
+                active_cog = self.cog.bot.get_cog("BoozyBank")
+                if active_cog is not None:
+                    await active_cog.handle_answer_button(interaction, letter)
+                elif not interaction.response.is_done():
+                    await interaction.response.send_message("⚠️ BoozyBank is not loaded.", ephemeral=True)
+            except discord.errors.InteractionResponded:
+                pass  # Already responded — safe to ignore
+            except Exception:
+                # Make sure Discord always gets a response to avoid "interaction failed"
+                try:
+                    if not interaction.response.is_done():
+                        await interaction.response.send_message("⚠️ Something went wrong. Please try again.", ephemeral=True)
+                except Exception:
+                    pass
+
+        return callback
+
+
+class LobbyView(discord.ui.View):
+    """Join/Leave/Start buttons for a matchmaking lobby.
+    `started` is set once the host (or an admin) starts the game with enough players.
+    """
+
+    def __init__(self, host, min_players: int, can_start, make_embed, render_interval: float = 1.5):
+        super().__init__(timeout=None)  # The cog runs the lobby's single timeout timer
+        self.host = host
+        self.min_players = min_players
+        self.players = {host.id: host}  # in join order
+        self.started = asyncio.Event()
+        self.rendered = None  # RenderedMessage of the lobby, set by `attach` once it is posted
+        self._can_start = can_start
+        self._make_embed = make_embed
+        self._render_interval = render_interval
+        self._render_task = None
+        self._dirty = False
+        self._last_render = time.monotonic()
+
+    @discord.ui.button(label="Join", emoji="🟢", style=discord.ButtonStyle.success)
+    async def join_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.handle_join(interaction)
+
+    @discord.ui.button(label="Leave", emoji="🚪", style=discord.ButtonStyle.secondary)
+    async def leave_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.handle_leave(interaction)
+
+    @discord.ui.button(label="Start", emoji="🎮", style=discord.ButtonStyle.primary)
+    async def start_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.handle_start(interaction)
+
+    async def handle_join(self, interaction: discord.Interaction):
+        user = interaction.user
+        if user.id in self.players:
+            await interaction.response.send_message("✅ You are already in this lobby.", ephemeral=True)
+            return
+        self.players[user.id] = user
+        self._changed()
+        await interaction.response.send_message("🟢 You joined the lobby!", ephemeral=True)
+
+    async def handle_leave(self, interaction: discord.Interaction):
+        user = interaction.user
+        if user.id == self.host.id:
+            await interaction.response.send_message("🚫 The host can't leave their own lobby.", ephemeral=True)
+            return
+        if self.players.pop(user.id, None) is None:
+            await interaction.response.send_message("⚠️ You are not in this lobby.", ephemeral=True)
+            return
+        self._changed()
+        await interaction.response.send_message("🚪 You left the lobby.", ephemeral=True)
+
+    async def handle_start(self, interaction: discord.Interaction):
+        if not self._can_start(interaction.user):
+            await interaction.response.send_message("🚫 Only the Host or an Admin can start the match!", ephemeral=True)
+            return
+        if len(self.players) < self.min_players:
+            await interaction.response.send_message(
+                f"⚠️ **Cannot start!** Need at least **{self.min_players}** player(s) to start (currently: {len(self.players)}).",
+                ephemeral=True,
+            )
+            return
+        self.started.set()
+        await interaction.response.send_message("🎮 Starting the match!", ephemeral=True)
+
+    def attach(self, rendered):
+        """Sets the posted lobby message and renders joins or leaves that came in while it was being sent."""
+        self.rendered = rendered
+        if self._dirty:
+            self._changed()
+
+    def close(self):
+        """Stops the view and any pending re-render."""
+        self.stop()
+        if self._render_task is not None:
+            self._render_task.cancel()
+
+    def _changed(self):
+        self._dirty = True
+        if self._render_task is None or self._render_task.done():
+            self._render_task = asyncio.create_task(self._render_loop())
+
+    async def _render_loop(self):
+        # Changes that arrive while waiting are picked up by the same edit
+        while self._dirty and not self.is_finished():
+            wait = self._last_render + self._render_interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            if self.started.is_set() or self.rendered is None:
+                return  # Still dirty without a message; `attach` picks it up
+            self._dirty = False
+            self._last_render = time.monotonic()
+            try:
+                await self.rendered.edit(embed=self._make_embed(list(self.players.values())))
+            except discord.HTTPException:
+                pass
@@ -0,0 +1,543 @@
+# boozybank_bench.py — End-to-end BoozyBank game benchmark
+# Drives `boozyquiz` / `boozygame` against the local OpenAI stub with fake
+# discord guild, channel, member and message objects, simulated players and an
+# I/O-counting stand-in for Red's Config. Needs discord.py and Red installed
+# (the cog module is imported for real), but no bot token, OpenAI key or network.
+#
+# Example:  python tools/boozybank_bench.py --games 5 --rounds 5 --latency 0.8 --per-question 0.4
+#
+# Reports per game: time-to-first-question (lobby end -> first question sent),
+# per-round overhead (correct guess -> round result sent), REST calls per round,
+# Config reads/writes and OpenAI connection reuse. `--answer-mode buttons`
+# makes the players click answer buttons instead of typing letters.
+
+import argparse
+import asyncio
+import copy
+import datetime
+import itertools
+import random
+import statistics
+import sys
+import tempfile
+import time
+import types
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import boozybank.boozybank as cog_module  # noqa: E402
+import boozybank.engine as engine_module  # noqa: E402
+import boozybank.payouts as payouts_module  # noqa: E402
+from boozybank.boozybank import BoozyBank  # noqa: E402
+
+from openai_stub import StubConfig, start_stub  # noqa: E402
+
+DISCORD_EPOCH_MS = 1420070400000
+
+
+def _snowflake_ids():
+    """Ids shaped like Discord snowflakes (creation time in the upper bits), so answer timing works."""
+    for sequence in itertools.count():
+        yield ((time.time_ns() // 1_000_000 - DISCORD_EPOCH_MS) << 22) | (sequence & 0x3FFFFF)
+
+
+_snowflakes = _snowflake_ids()
+
+
+# ── Counting Config stand-in ──────────────────────────────────────────────────
+
+class _ValueCtx:
+    """Awaitable / async-context value, mirroring Red's Config value access."""
+
+    def __init__(self, config, getter, setter):
+        self.config, self.getter, self.setter = config, getter, setter
+
+    def __await__(self):
+        self.config.reads += 1
+        return self._read().__await__()
+
+    async def _read(self):
+        return copy.deepcopy(self.getter())
+
+    async def __aenter__(self):
+        self.config.reads += 1
+        self.value = copy.deepcopy(self.getter())
+        return self.value
+
+    async def __aexit__(self, *exc):
+        self.config.writes += 1
+        self.setter(self.value)
+
+
+class _Value:
+    def __init__(self, config, store, name, default):
+        self.config, self.store, self.name, self.default = config, store, name, default
+
+    def __call__(self):
+        return _ValueCtx(self.config, lambda: self.store.get(self.name, copy.deepcopy(self.default)),
+                         lambda v: self.store.__setitem__(self.name, v))
+
+    async def set(self, value):
+        self.config.writes += 1
+        self.store[self.name] = copy.deepcopy(value)
+
+
+class _Group:
+    def __init__(self, config, store, defaults):
+        self.config, self.store, self.defaults = config, store, defaults
+
+    def __getattr__(self, name):
+        return _Value(self.config, self.store, name, self.defaults[name])
+
+    def all(self):
+        def getter():
+            data = copy.deepcopy(self.defaults)
+            data.update(self.store)
+            return data
+
+        def setter(value):
+            self.store.clear()
+            self.store.update(value)
+
+        return _ValueCtx(self.config, getter, setter)
+
+
+class CountingConfig:
+    """Just enough of Red's Config for the cog, counting every read and write."""
+
+    def __init__(self):
+        self.reads = 0
+        self.writes = 0
+        self._defaults = {"guild": {}, "member": {}, "global": {}}
+        self._guilds, self._members, self._global = {}, {}, {}
+
+    @classmethod
+    def get_conf(cls, cog, identifier, force_registration=False):
+        return cls()
+
+    def register_guild(self, **defaults):
+        self._defaults["guild"].update(defaults)
+
+    def register_member(self, **defaults):
+        self._defaults["member"].update(defaults)
+
+    def register_global(self, **defaults):
+        self._defaults["global"].update(defaults)
+
+    def guild(self, guild):
+        return _Group(self, self._guilds.setdefault(guild.id, {}), self._defaults["guild"])
+
+    def member(self, member):
+        return self.member_from_ids(member.guild.id, member.id)
+
+    def member_from_ids(self, guild_id, member_id):
+        return _Group(self, self._members.setdefault((guild_id, member_id), {}), self._defaults["member"])
+
+    def all(self):
+        return _Group(self, self._global, self._defaults["global"]).all()
+
+    async def all_members(self, guild=None):
+        self.reads += 1
+        result = {}
+        for (guild_id, member_id), data in self._members.items():
+            merged = copy.deepcopy(self._defaults["member"])
+            merged.update(data)
+            result.setdefault(guild_id, {})[member_id] = merged
+        return result.get(guild.id, {}) if guild is not None else result
+
+    def __getattr__(self, name):
+        if name.startswith("_") or name not in self._defaults["global"]:
+            raise AttributeError(name)
+        return _Value(self, self._global, name, self._defaults["global"][name])
+
+
+# ── Fake discord objects ──────────────────────────────────────────────────────
+
+class FakeBank:
+    class errors:
+        class BalanceTooHigh(Exception):
+            pass
+
+    @staticmethod
+    async def get_currency_name(guild):
+        return "coins"
+
+    @staticmethod
+    async def deposit_credits(member, amount):
+        return amount
+
+    @staticmethod
+    async def get_max_balance(guild):
+        return 2 ** 63 - 1
+
+
+class Perms:
+    def __init__(self, admin: bool):
+        self.manage_guild = admin
+        self.manage_messages = admin
+
+
+class FakeAvatar:
+    url = "https://cdn.discordapp.com/embed/avatars/0.png"
+
+
+class FakeMember:
+    def __init__(self, guild, name, bot=False, admin=False):
+        self.id = next(_snowflakes)
+        self.guild = guild
+        self.name = self.display_name = name
+        self.mention = f"<@{self.id}>"
+        self.bot = bot
+        self.admin = admin
+        self.display_avatar = FakeAvatar()
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __eq__(self, other):
+        return getattr(other, "id", None) == self.id
+
+
+class FakeGuild:
+    def __init__(self):
+        self.id = next(_snowflakes)
+        self.name = "Bench Guild"
+        self.members = {}
+        self.me = None
+
+    def get_member(self, member_id):
+        return self.members.get(member_id)
+
+
+class FakeMessage:
+    def __init__(self, channel, author, content=None, embed=None):
+        self.id = next(_snowflakes)
+        self.channel = channel
+        self.guild = channel.guild
+        self.author = author
+        self.content = content or ""
+        self.embeds = [embed] if embed else []
+        self.reactions = []
+
+    async def delete(self):
+        self.channel.rest["message.delete"] += 1
+
+    async def edit(self, **kwargs):
+        self.channel.rest["message.edit"] += 1
+        if kwargs.get("embed"):
+            self.embeds = [kwargs["embed"]]
+        self.edited_at = datetime.datetime.now(datetime.timezone.utc)
+        return self
+
+    async def add_reaction(self, emoji):
+        self.channel.rest["reaction.add"] += 1
+
+    async def remove_reaction(self, emoji, user):
+        self.channel.rest["reaction.remove"] += 1
+
+    async def clear_reactions(self):
+        self.channel.rest["reaction.clear"] += 1
+
+
+class FakeChannel:
+    def __init__(self, guild, harness):
+        self.id = next(_snowflakes)
+        self.name = "bench"
+        self.guild = guild
+        self.harness = harness
+        self.rest = Counter()
+        self.messages = {}
+
+    def permissions_for(self, member):
+        return Perms(getattr(member, "admin", False) or getattr(member, "bot", False))
+
+    async def send(self, content=None, *, embed=None, **kwargs):
+        self.rest["message.send"] += 1
+        msg = FakeMessage(self, self.harness.bot.user, content, embed)
+        msg.view = kwargs.get("view")
+        self.messages[msg.id] = msg
+        self.harness.on_bot_message(msg)
+        return msg
+
+    async def fetch_message(self, message_id):
+        self.rest["message.fetch"] += 1
+        return self.messages[message_id]
+
+    async def delete_messages(self, messages):
+        self.rest["message.bulk_delete"] += 1
+
+
+class FakeInteractionResponse:
+    def __init__(self, channel):
+        self.channel = channel
+        self._done = False
+
+    def is_done(self):
+        return self._done
+
+    async def send_message(self, content=None, **kwargs):
+        self.channel.rest["interaction.response"] += 1
+        self._done = True
+
+
+class FakeInteraction:
+    def __init__(self, user, message):
+        self.id = next(_snowflakes)
+        self.user = user
+        self.message = message
+        self.response = FakeInteractionResponse(message.channel)
+
+
+class FakeContext:
+    def __init__(self, bot, guild, channel, author):
+        self.bot = bot
+        self.guild = guild
+        self.channel = channel
+        self.author = author
+        self.me = bot.user
+        self.command = None
+
+    async def send(self, content=None, **kwargs):
+        return await self.channel.send(content, **kwargs)
+
+
+class FakeBot:
+    def __init__(self, guild, harness):
+        self.user = FakeMember(guild, "BoozyBot", bot=True)
+        self.harness = harness
+
+    def add_view(self, view, *, message_id=None):
+        pass
+
+    def get_cog(self, name):
+        return self.harness.cog
+
+    def get_channel(self, channel_id):
+        channel = self.harness.channel
+        return channel if channel.id == channel_id else None
+
+    async def wait_until_red_ready(self):
+        pass
+
+    async def get_shared_api_tokens(self, service):
+        return {"api_key": "stub", "api_base": self.harness.api_base}
+
+
+# ── Harness ───────────────────────────────────────────────────────────────────
+
+def _scaled_asyncio(scale: float):
+    """A stand-in for the cog module's `asyncio` that shortens the game's fixed pauses."""
+    proxy = types.ModuleType("asyncio")
+    proxy.__dict__.update({k: v for k, v in vars(asyncio).items() if not k.startswith("__")})
+
+    real_sleep = asyncio.sleep
+
+    async def sleep(delay, result=None):
+        return await real_sleep(delay * scale if delay >= 1 else delay, result)
+
+    proxy.sleep = sleep
+    return proxy
+
+
+class GameRecord:
+    def __init__(self):
+        self.lobby_end = None
+        self.first_question = None
+        self.round_overheads = []
+        self.round_rest = []
+        self.config_reads = 0
+        self.config_writes = 0
+
+
+class Harness:
+    QUESTION_MARKERS = ("BoozyGame - Round", "BoozyBank Trivia!", "Tie-Breaker Round")
+    RESULT_MARKERS = ("Round", "We have a winner", "Time is up", "Tie-Breaker Solved")
+
+    def __init__(self, args):
+        self.args = args
+        self.api_base = None
+        self.guild = FakeGuild()
+        self.bot = FakeBot(self.guild, self)
+        self.guild.me = self.bot.user
+        self.channel = FakeChannel(self.guild, self)
+        self.players = [FakeMember(self.guild, f"Player {i + 1}") for i in range(args.players)]
+        for member in self.players:
+            self.guild.members[member.id] = member
+        self.cog = None
+        self.record = None
+        self.lobby_msg = None
+        self.lobby_script = []
+        self.lobby_step = 0.0
+        self.round_open = None
+        self.last_guess = None
+        self.rest_mark = Counter()
+
+    async def setup(self):
+        cog_module.Config = CountingConfig
+        cog_module.bank = payouts_module.bank = FakeBank
+        data_path = Path(tempfile.mkdtemp(prefix="boozybench-"))
+        cog_module.cog_data_path = lambda cog: data_path
+        cog_module.asyncio = engine_module.asyncio = _scaled_asyncio(self.args.pause_scale)
+
+        self.cog = BoozyBank(self.bot)
+        guild_config = self.cog.config.guild(self.guild)
+        await guild_config.timeout.set(self.args.timeout)
+        await guild_config.allow_second_guess.set(True)
+        await guild_config.final_cleanup_delay.set(0)
+        await guild_config.daily_limit.set(0)
+        await guild_config.min_players.set(min(2, len(self.players)))
+        await guild_config.pool_low_water.set(self.args.low_water)
+        await guild_config.answer_mode.set(self.args.answer_mode)
+        await guild_config.offline_questions.set(self.args.offline)
+        await self.cog.cog_load()
+
+        original_lobby = self.cog._run_lobby
+
+        async def timed_lobby(*args, **kwargs):
+            result = await original_lobby(*args, **kwargs)
+            self.record.lobby_end = time.perf_counter()
+            return result
+
+        self.cog._run_lobby = timed_lobby
+
+    def on_bot_message(self, msg):
+        title = msg.embeds[0].title if msg.embeds else ""
+        if "Lobby" in title:
+            self.lobby_msg = msg
+            asyncio.create_task(self._drive_lobby(msg))
+        elif any(marker in title for marker in self.QUESTION_MARKERS):
+            now = time.perf_counter()
+            if self.record.first_question is None:
+                self.record.first_question = now
+            self.rest_mark = Counter(self.channel.rest)
+            self.round_open = asyncio.Event()
+            for player in self.players:
+                asyncio.create_task(self._play(player, msg, self.round_open))
+        elif self.round_open is not None and any(marker in title for marker in self.RESULT_MARKERS):
+            now = time.perf_counter()
+            self.round_open.set()
+            self.round_open = None
+            if self.last_guess is not None:
+                self.record.round_overheads.append(now - self.last_guess)
+            self.record.round_rest.append(sum((self.channel.rest - self.rest_mark).values()))
+
+    async def _drive_lobby(self, lobby_msg):
+        # Replay the scripted joins and the start click on the lobby's buttons
+        view = lobby_msg.view
+        handlers = {"join": view.handle_join, "start": view.handle_start}
+        while self.lobby_script:
+            await asyncio.sleep(self.lobby_step)
+            action, user = self.lobby_script.pop(0)
+            await handlers[action](FakeInteraction(user, lobby_msg))
+
+    async def _play(self, player, question_msg, round_open):
+        await asyncio.sleep(random.uniform(self.args.think_min, self.args.think_max))
+        for letter in random.sample("ABCD", 4):
+            if round_open.is_set():
+                return
+            self.last_guess = time.perf_counter()
+            if self.args.answer_mode == "buttons":
+                await self.cog.handle_answer_button(FakeInteraction(player, question_msg), letter)
+            else:
+                await self.cog.on_message(FakeMessage(self.channel, player, letter))
+            await asyncio.sleep(self.args.guess_gap)
+
+    async def run_game(self, rounds: int) -> GameRecord:
+        self.record = GameRecord()
+        host = self.players[0]
+        self.lobby_script = [("join", p) for p in self.players[1:]] + [("start", host)]
+        self.lobby_step = self.args.lobby_seconds / len(self.lobby_script)
+        ctx = FakeContext(self.bot, self.guild, self.channel, host)
+
+        config = self.cog.config
+        reads, writes = config.reads, config.writes
+        if rounds == 1:
+            await self.cog.boozyquiz.callback(self.cog, ctx, topic_and_difficulty=self.args.topic)
+        else:
+            await self.cog.boozygame.callback(self.cog, ctx, rounds, topic_and_difficulty=self.args.topic)
+        # The command returns once the lobby is done; the game itself runs as an engine task
+        session = self.cog.engine.get(self.channel.id)
+        if session is not None and session.task is not None:
+            await session.task
+        self.record.config_reads = config.reads - reads
+        self.record.config_writes = config.writes - writes
+        return self.record
+
+
+def _fmt(values, unit="s"):
+    if not values:
+        return "n/a"
+    ordered = sorted(values)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"median {statistics.median(ordered):.3f}{unit} | p95 {p95:.3f}{unit} | max {ordered[-1]:.3f}{unit}"
+
+
+async def bench(args):
+    stub_cfg = StubConfig(args.latency, args.per_question, args.failure_rate, args.slow_rate, args.slow_latency)
+    runner, api_base = await start_stub(stub_cfg)
+    harness = Harness(args)
+    harness.api_base = api_base
+    await harness.setup()
+
+    records = []
+    try:
+        for number in range(1, args.games + 1):
+            record = await harness.run_game(args.rounds)
+            records.append(record)
+            ttfq = (record.first_question - record.lobby_end) if record.first_question and record.lobby_end else None
+            print(
+                f"game {number}: ttfq {ttfq:.3f}s | rounds {len(record.round_overheads)} | "
+                f"config {record.config_reads}r/{record.config_writes}w"
+                if ttfq is not None else f"game {number}: no question was posted"
+            )
+    finally:
+        await harness.cog.cog_unload()
+        await runner.cleanup()
+
+    ttfqs = [r.first_question - r.lobby_end for r in records if r.first_question and r.lobby_end]
+    overheads = [o for r in records for o in r.round_overheads]
+    rest = [c for r in records for c in r.round_rest]
+    stats = harness.cog.http_stats
+
+    print()
+    print(f"games: {len(records)} x {args.rounds} round(s), stub latency {args.latency}s + {args.per_question}s/question")
+    print(f"time-to-first-question: {_fmt(ttfqs)}")
+    print(f"per-round overhead:     {_fmt(overheads)}")
+    print(f"REST calls per round:   {_fmt(rest, unit='')}")
+    print(f"config I/O per game:    {statistics.mean(r.config_reads for r in records):.1f} reads, "
+          f"{statistics.mean(r.config_writes for r in records):.1f} writes")
+    print(f"OpenAI requests:        {stub_cfg.requests} ({stub_cfg.failures} injected failures), "
+          f"connections {stats.new} new / {stats.reused} reused")
+    fairness = harness.cog.fairness.summary()
+    print(f"answer timing:          guesses handled {fairness['median_delay'] * 1000:.0f}ms after Discord got them "
+          f"(median, worst {fairness['max_delay'] * 1000:.0f}ms), winning times corrected by "
+          f"{fairness['mean_correction']:.3f}s, {fairness['inversions']} inversion(s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end BoozyBank game benchmark against the local OpenAI stub.")
+    parser.add_argument("--games", type=int, default=3)
+    parser.add_argument("--rounds", type=int, default=5, help="1 runs boozyquiz, more runs boozygame")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--topic", default="Benchmarking medium")
+    parser.add_argument("--timeout", type=int, default=10, help="answer timeout per round")
+    parser.add_argument("--low-water", type=int, default=5, help="question pool low-water mark")
+    parser.add_argument("--lobby-seconds", type=float, default=2.0)
+    parser.add_argument("--think-min", type=float, default=0.3)
+    parser.add_argument("--think-max", type=float, default=1.5)
+    parser.add_argument("--guess-gap", type=float, default=0.4)
+    parser.add_argument("--answer-mode", choices=("reactions", "buttons"), default="reactions")
+    parser.add_argument("--offline", action="store_true", help="build questions from the fact tables instead of the stub")
+    parser.add_argument("--pause-scale", type=float, default=0.0, help="scale for the game's fixed pauses (0 skips them)")
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--per-question", type=float, default=0.3)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--slow-rate", type=float, default=0.0)
+    parser.add_argument("--slow-latency", type=float, default=10.0)
+    asyncio.run(bench(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+# openai_stub.py — Local OpenAI-compatible stub for BoozyBank benchmarks
+# Serves POST /v1/chat/completions with fake trivia batches, both as a normal
+# JSON response and as a `stream=True` server-sent-event stream, with
+# configurable latency and failure injection so generation can be measured
+# without spending tokens.
+#
+# Standalone:  python tools/openai_stub.py --port 8089 --latency 0.5 --per-question 0.3
+# Then point the cog at it:  [p]set api openai api_key,stub api_base,http://127.0.0.1:8089/v1
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import re
+
+from aiohttp import web
+
+_COUNT_RE = re.compile(r"list of (\d+)")
+_question_ids = itertools.count(1)
+
+
+class StubConfig:
+    """Latency and failure knobs for the stub server."""
+
+    def __init__(self, latency=0.5, per_question=0.3, failure_rate=0.0, slow_rate=0.0, slow_latency=10.0, chunk_size=24):
+        self.latency = latency  # seconds before the first byte
+        self.per_question = per_question  # generation time per question
+        self.failure_rate = failure_rate  # share of requests answered with HTTP 500
+        self.slow_rate = slow_rate  # share of requests that stall for `slow_latency`
+        self.slow_latency = slow_latency
+        self.chunk_size = chunk_size  # characters per streamed delta
+        self.requests = 0
+        self.failures = 0
+
+
+_SYLLABLES = ("ka", "lo", "mi", "ru", "zen", "tor", "vel", "qua", "bri", "sho", "dun", "pex", "ya", "glo", "fi", "mar")
+
+
+def _word() -> str:
+    return "".join(random.choice(_SYLLABLES) for _ in range(3))
+
+
+def make_question() -> dict:
+    # Made-up words, so the cog's near-duplicate filter does not take stub questions for rewordings of each other
+    number = next(_question_ids)
+    correct = random.choice("ABCD")
+    return {
+        "question": f"Stub question {number}: which {_word()} did the {_word()} of {_word()} choose?",
+        "options": {letter: f"The {_word()} {_word()}" for letter in "ABCD"},
+        "correct_answer": correct,
+        "explanation": f"The stub picked {correct} for question {number}.",
+    }
+
+
+def _requested_count(payload: dict) -> int:
+    match = _COUNT_RE.search(payload["messages"][-1]["content"])
+    return int(match.group(1)) if match else 1
+
+
+def _usage(payload: dict, content: str) -> dict:
+    prompt_tokens = sum(len(m["content"]) for m in payload["messages"]) // 4
+    completion_tokens = len(content) // 4
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+
+async def chat_completions(request: web.Request) -> web.StreamResponse:
+    cfg = request.app["stub_config"]
+    cfg.requests += 1
+    payload = await request.json()
+
+    if random.random() < cfg.failure_rate:
+        cfg.failures += 1
+        return web.json_response({"error": {"message": "Injected stub failure", "type": "server_error"}}, status=500)
+
+    delay = cfg.slow_latency if random.random() < cfg.slow_rate else cfg.latency
+    await asyncio.sleep(delay)
+
+    count = _requested_count(payload)
+    questions = [make_question() for _ in range(count)]
+    single = "questions" not in payload["messages"][0]["content"]
+
+    if not payload.get("stream"):
+        await asyncio.sleep(cfg.per_question * count)
+        content = json.dumps(questions[0] if single else {"questions": questions})
+        return web.json_response({
+            "object": "chat.completion",
+            "model": payload.get("model"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": _usage(payload, content),
+        })
+
+    response = web.StreamResponse(headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"})
+    await response.prepare(request)
+
+    async def send(text: str):
+        for i in range(0, len(text), cfg.chunk_size):
+            chunk = {"object": "chat.completion.chunk", "choices": [{"index": 0, "delta": {"content": text[i:i + cfg.chunk_size]}}]}
+            await response.write(f"data: {json.dumps(chunk)}\n\n".encode())
+
+    await send('{"questions": [')
+    for index, quiz in enumerate(questions):
+        await asyncio.sleep(cfg.per_question)
+        await send((", " if index else "") + json.dumps(quiz))
+    await send("]}")
+    await response.write(b"data: [DONE]\n\n")
+    await response.write_eof()
+    return response
+
+
+def create_app(cfg: StubConfig) -> web.Application:
+    app = web.Application()
+    app["stub_config"] = cfg
+    app.router.add_post("/v1/chat/completions", chat_completions)
+    return app
+
+
+async def start_stub(cfg: StubConfig, host: str = "127.0.0.1", port: int = 0):
+    """Starts the stub in the running loop. Returns (runner, api_base)."""
+    runner = web.AppRunner(create_app(cfg))
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    bound_port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://{host}:{bound_port}/v1"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible stub for BoozyBank.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.5, help="seconds before the first byte")
+    parser.add_argument("--per-question", type=float, default=0.3, help="generation seconds per question")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="share of requests answered with HTTP 500")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="share of requests that stall")
+    parser.add_argument("--slow-latency", type=float, default=10.0, help="stall duration in seconds")
+    args = parser.parse_args()
+
+    cfg = StubConfig(args.latency, args.per_question, args.failure_rate, args.slow_rate, args.slow_latency)
+    web.run_app(create_app(cfg), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()